@@ -0,0 +1,94 @@
+"""
+Benchmark: enemy AI tick for 5,000 enemies on a 4000 x 4000 world with
+4 moving players, every Enemy.update every tick vs AIScheduler (near
+every tick, mid every 4 ticks, far frozen), with and without an update
+budget, plus the per-bucket counters.
+
+Run from the project root:
+    python benchmarks/bench_ai_lod.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.ai_scheduler import BUCKETS, AIScheduler
+from game.enemy import Enemy
+
+WORLD_SIZE = 4000
+NB_ENEMIES = 5000
+NB_PLAYERS = 4
+TICKS = 120
+PLAYER_SPEED = 2
+BUDGET = 400
+
+
+class Target:
+    """Player stand-in walking in a straight line."""
+
+    def __init__(self, rng):
+        self.position = (rng.uniform(0, WORLD_SIZE), rng.uniform(0, WORLD_SIZE))
+        self.velocity = (rng.choice((-1, 1)) * PLAYER_SPEED, rng.choice((-1, 1)) * PLAYER_SPEED)
+        self.hits = 0
+
+    def move(self):
+        self.position = (self.position[0] + self.velocity[0], self.position[1] + self.velocity[1])
+
+    def take_damage(self, amount):
+        self.hits += 1
+
+
+def make_world(seed=3):
+    rng = random.Random(seed)
+    players = [Target(rng) for _ in range(NB_PLAYERS)]
+    enemies = [Enemy(rng.uniform(0, WORLD_SIZE), rng.uniform(0, WORLD_SIZE))
+               for _ in range(NB_ENEMIES)]
+    return players, enemies
+
+
+def full_tick(enemies, players):
+    """Every enemy, every tick, against its closest player."""
+    for enemy in enemies:
+        ex, ey = enemy.position
+        target = min(players, key=lambda p: (p.position[0] - ex) ** 2 + (p.position[1] - ey) ** 2)
+        enemy.update(target)
+
+
+def run(tick, players):
+    durations = []
+    for _ in range(TICKS):
+        for player in players:
+            player.move()
+        start = time.perf_counter()
+        tick()
+        durations.append((time.perf_counter() - start) * 1000)
+    hits = sum(player.hits for player in players)
+    return sum(durations) / TICKS, max(durations), hits
+
+
+def main():
+    print(f"{NB_ENEMIES} enemies, {NB_PLAYERS} moving players, {WORLD_SIZE}x{WORLD_SIZE} world, "
+          f"{TICKS} ticks")
+    print(f"{'':<26}{'ms/tick':>9}{'max ms':>9}{'updates/tick':>14}{'hits':>7}")
+
+    players, enemies = make_world()
+    mean_ms, max_ms, hits = run(lambda: full_tick(enemies, players), players)
+    print(f"{'Enemy.update every tick':<26}{mean_ms:>9.2f}{max_ms:>9.2f}{NB_ENEMIES:>14}{hits:>7}")
+
+    for name, budget in (("AIScheduler", None), (f"AIScheduler, budget {BUDGET}", BUDGET)):
+        players, enemies = make_world()
+        scheduler = AIScheduler(budget=budget)
+        for enemy in enemies:
+            scheduler.add(enemy)
+        mean_ms, max_ms, hits = run(lambda: scheduler.update(players), players)
+        print(f"{name:<26}{mean_ms:>9.2f}{max_ms:>9.2f}"
+              f"{scheduler.total_updates / TICKS:>14.1f}{hits:>7}")
+        print("    buckets: " + ", ".join(f"{b} {scheduler.counts[b]}" for b in BUCKETS)
+              + f" | last tick: " + ", ".join(f"{b} {scheduler.updates[b]}" for b in BUCKETS)
+              + f", deferred {scheduler.deferred}")
+
+
+if __name__ == "__main__":
+    main()
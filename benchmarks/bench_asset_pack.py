@@ -0,0 +1,91 @@
+"""
+Benchmark: character sprite startup, PNG decoding vs the mmap asset pack.
+
+"cold" is a fresh interpreter loading every character sheet (what the game
+does at startup), "warm" reloads them in the same process once the files
+are in the OS cache. Builds build/assets.pack first if it is missing.
+
+Run from the project root:
+    python benchmarks/bench_asset_pack.py
+"""
+import os
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC)
+
+import pygame as pyg
+
+from game.characters import clear_character_types, get_character_type
+from utils.asset_pack import (
+    DEFAULT_PACK_PATH,
+    AssetPack,
+    build_pack,
+    character_sheets,
+    set_default_pack,
+)
+from utils.paths import find_project_root
+from utils.sprite_sheet import SpriteSheet
+
+COLD_RUNS = 5
+WARM_RUNS = 20
+CHARACTERS = (2,)  # Character-2 is the only one with a full sprite set
+
+PACK_PATH = os.path.join(find_project_root(), DEFAULT_PACK_PATH)
+
+
+def load_characters(use_pack):
+    """Load every sheet and touch every left frame; returns seconds."""
+    start = time.perf_counter()
+    set_default_pack(AssetPack(PACK_PATH) if use_pack else None)
+    clear_character_types()
+    SpriteSheet.clear_cache()
+    for char_number in CHARACTERS:
+        char_type = get_character_type(char_number)
+        char_type.load_all()
+        for frames in dict.values(char_type.frames):
+            for i in range(len(frames['left'])):
+                frames['left'][i]
+    return time.perf_counter() - start
+
+
+def cold(use_pack):
+    """Median load time in a fresh process (imports excluded), in ms."""
+    code = (
+        f"import sys; sys.path.insert(0, {SRC!r}); "
+        "import pygame; pygame.init(); "
+        "import bench_asset_pack as b; "
+        f"print(b.load_characters({use_pack}))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for _ in range(COLD_RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True,
+            check=True,
+        ).stdout
+        times.append(float(out.strip().splitlines()[-1]))
+    return sorted(times)[len(times) // 2] * 1000
+
+
+def warm(use_pack):
+    """Average in-process reload time in ms."""
+    load_characters(use_pack)
+    return sum(load_characters(use_pack) for _ in range(WARM_RUNS)) / WARM_RUNS * 1000
+
+
+def main():
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    pyg.init()
+    if not os.path.exists(PACK_PATH):
+        build_pack(character_sheets(), PACK_PATH)
+
+    print(f"{'loader':<10}{'cold (ms)':>12}{'warm (ms)':>12}")
+    for name, use_pack in (("png", False), ("pack", True)):
+        print(f"{name:<10}{cold(use_pack):>12.2f}{warm(use_pack):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
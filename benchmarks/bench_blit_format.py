@@ -0,0 +1,62 @@
+"""
+Benchmark: blit throughput of sprite frames as loaded vs converted to the
+display pixel format (utils.display_format.to_display_format).
+
+Run from the project root:
+    python benchmarks/bench_blit_format.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame as pyg
+
+from utils.display_format import to_display_format
+from utils.paths import get_asset_path
+
+BLITS = 20000
+WINDOW_SIZE = (1280, 720)
+
+SHEETS = (
+    # (label, path parts, frame width, frame height)
+    ("character 40x40", ("sprites", "Character-2", "IDLE-Sheet.png"), 40, 40),
+    ("button 105x32", ("buttons", "21-MENUS", "BUTTONS-IDLE-PLAY-Sheet.png"), 105, 32),
+)
+
+
+def slice_sheet(parts, frame_w, frame_h):
+    sheet = pyg.image.load(get_asset_path(*parts))
+    count = sheet.get_width() // frame_w
+    return [sheet.subsurface((i * frame_w, 0, frame_w, frame_h)) for i in range(count)]
+
+
+def blits_per_second(screen, frames):
+    width, height = screen.get_size()
+    count = len(frames)
+    start = time.perf_counter()
+    for i in range(BLITS):
+        screen.blit(frames[i % count], ((i * 37) % (width - 120), (i * 53) % (height - 60)))
+    return BLITS / (time.perf_counter() - start)
+
+
+def main():
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    pyg.init()
+    screen = pyg.display.set_mode(WINDOW_SIZE)
+
+    print(f"{'frames':<18}{'raw (blit/s)':>14}{'converted':>14}{'speedup':>10}")
+    for label, parts, frame_w, frame_h in SHEETS:
+        raw = slice_sheet(parts, frame_w, frame_h)
+        converted = to_display_format(slice_sheet(parts, frame_w, frame_h))
+        raw_rate = blits_per_second(screen, raw)
+        converted_rate = blits_per_second(screen, converted)
+        print(
+            f"{label:<18}{raw_rate:>14.0f}{converted_rate:>14.0f}"
+            f"{converted_rate / raw_rate:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
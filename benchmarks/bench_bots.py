@@ -0,0 +1,109 @@
+"""
+Benchmark: 60 Hz simulation tick (an EnemySwarm of 2,000 enemies) with
+48 bots (16 sessions x 3 bot slots), the bots deciding inline in every
+simulation tick vs on the BotPool (10 decisions per second, 2 worker
+threads), with the decision time per bot.
+
+Run from the project root:
+    python benchmarks/bench_bots.py
+"""
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.swarm import EnemySwarm
+from ui.bots import SIM_TICK_RATE, BotController, BotPool
+
+NB_SESSIONS = 16
+BOTS_PER_SESSION = 3
+NB_ENEMIES = 2000
+DURATION = 3.0  # seconds per configuration
+
+
+class Target:
+    def __init__(self, x, y):
+        self.position = (x, y)
+
+    def take_damage(self, amount):
+        pass
+
+
+def human_positions(rng):
+    return {
+        f"session-{i}": {1: (rng.uniform(0, 1280), rng.uniform(0, 720))}
+        for i in range(NB_SESSIONS)
+    }
+
+
+def simulate(swarm, players, per_tick=None):
+    """Run the 60 Hz loop for DURATION, return the tick durations in ms."""
+    period = 1.0 / SIM_TICK_RATE
+    durations = []
+    end = time.perf_counter() + DURATION
+    next_tick = time.perf_counter()
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        swarm.update(players)
+        if per_tick is not None:
+            per_tick()
+        durations.append((time.perf_counter() - start) * 1000)
+        next_tick += period
+        delay = next_tick - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_tick = time.perf_counter()
+    return durations
+
+
+def report(name, durations, bots=None, extra=""):
+    durations = sorted(durations)
+    p99 = durations[int(len(durations) * 0.99) - 1]
+    line = f"{name:<22}{statistics.mean(durations):>9.3f}{p99:>9.3f}"
+    if bots:
+        means = [bot.mean_ms for bot in bots]
+        line += f"{statistics.mean(means) * 1000:>12.1f}{max(bot.max_ms for bot in bots):>10.3f}"
+    print(line + extra)
+
+
+def main():
+    rng = random.Random(4)
+    swarm = EnemySwarm(NB_ENEMIES)
+    swarm.spawn_many([rng.uniform(0, 2000) for _ in range(NB_ENEMIES)],
+                     [rng.uniform(0, 2000) for _ in range(NB_ENEMIES)])
+    players = [Target(640, 360)]
+    positions = human_positions(rng)
+    keys = [(f"session-{i}", pid) for i in range(NB_SESSIONS)
+            for pid in range(2, 2 + BOTS_PER_SESSION)]
+
+    print(f"{NB_SESSIONS * BOTS_PER_SESSION} bots, {SIM_TICK_RATE} Hz simulation of "
+          f"{NB_ENEMIES} enemies, {DURATION:.0f} s per run")
+    print(f"{'':<22}{'tick ms':>9}{'p99 ms':>9}{'decision us':>12}{'max ms':>10}")
+
+    report("no bots", simulate(swarm, players))
+
+    inline_bots = [BotController(session, pid, seed=n) for n, (session, pid) in enumerate(keys)]
+    messages = []
+
+    def inline_tick():
+        for bot in inline_bots:
+            messages.append(bot.decide(positions[bot.session_name], 1))
+    report("bots inline (60 Hz)", simulate(swarm, players, inline_tick), inline_bots)
+
+    submitted = []
+    pool = BotPool(submitted.append, lambda session: positions[session])
+    for i in range(NB_SESSIONS):
+        pool.add_session(f"session-{i}", range(2, 2 + BOTS_PER_SESSION))
+    pool.start()
+    durations = simulate(swarm, players)
+    pool.stop()
+    report("BotPool (10 Hz)", durations, list(pool.bots.values()),
+           f"   {len(submitted)} inputs, {pool.skipped} skipped, {pool.late_ticks} late")
+
+
+if __name__ == "__main__":
+    main()
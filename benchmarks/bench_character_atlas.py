@@ -0,0 +1,82 @@
+"""
+Benchmark: 4 players x 3 characters, per-instance frames vs shared atlas.
+
+Run from the project root:
+    python benchmarks/bench_character_atlas.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.characters import (
+    Character,
+    CharacterType,
+    FlippedFrames,
+    clear_character_types,
+    load_all_characters,
+)
+
+NB_PLAYERS = 4
+CHARACTERS_PER_PLAYER = 3
+
+
+def pixel_bytes(characters):
+    """Pixel memory owned by the sheets and flipped frames of *characters*."""
+    seen = set()
+    total = 0
+    for character in characters:
+        for directions in character.frames.values():
+            for frames in directions.values():
+                if isinstance(frames, FlippedFrames):
+                    frames = [f for f in frames._flipped if f is not None]
+                for frame in frames:
+                    owner = frame.get_parent() or frame
+                    if id(owner) in seen:
+                        continue
+                    seen.add(id(owner))
+                    total += owner.get_width() * owner.get_height() * owner.get_bytesize()
+    return total
+
+
+def build(picks, shared):
+    characters = []
+    for char_number in picks:
+        char_type = None if shared else CharacterType(char_number)
+        characters.append(Character(char_number, char_type=char_type))
+    return characters
+
+
+def measure(picks, shared):
+    clear_character_types()
+    tracemalloc.start()
+    start = time.perf_counter()
+    characters = build(picks, shared)
+    elapsed = (time.perf_counter() - start) * 1000
+    python_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Face left once so the lazily flipped frames in use are built
+    for character in characters:
+        character.direction = "left"
+        character.get_current_sprite()
+    return elapsed, python_bytes, pixel_bytes(characters)
+
+
+def main():
+    available = sorted(int(name.split("-")[1]) for name in load_all_characters())
+    # Each player picks 3 characters among the available ones
+    picks = [available[(p + c) % len(available)]
+             for p in range(NB_PLAYERS) for c in range(CHARACTERS_PER_PLAYER)]
+    print(f"{NB_PLAYERS} players x {CHARACTERS_PER_PLAYER} characters, "
+          f"character types available: {available}")
+    print(f"{'mode':>18} | {'build ms':>9} | {'python KiB':>10} | {'pixels KiB':>10}")
+    print("-" * 58)
+    for name, shared in (("per-instance", False), ("shared atlas", True)):
+        elapsed, python_bytes, pixels = measure(picks, shared)
+        print(f"{name:>18} | {elapsed:>9.2f} | {python_bytes / 1024:>10.1f} | {pixels / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
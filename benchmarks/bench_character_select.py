@@ -0,0 +1,54 @@
+"""
+Benchmark: frame time of Menu.handle_character_selection_final with four
+players that all picked three characters (18 character buttons, 4 large
+previews, 8 slot icons and the labels).
+
+Run from the project root:
+    python benchmarks/bench_character_select.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame as pyg
+
+from ui.menu import Menu
+
+FRAMES = 300
+REPEATS = 7
+SELECTIONS = {1: [2, 5, 11], 2: [3, 2, 17], 3: [18, 1, 9], 4: [7, 14, 2]}
+
+
+def main():
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    menu = Menu()
+    menu.number_bot = 0
+    menu.my_player_id = 1
+    menu.character_1, menu.character_2, menu.character_3 = SELECTIONS[1]
+    for player_id, selection in SELECTIONS.items():
+        menu.players_characters[player_id] = list(selection)
+        menu.players_ready[player_id] = player_id != 1
+
+    for _ in range(30):  # warm up caches
+        menu.handle_character_selection_final()
+        menu.render_queue.flush(menu.screen)
+
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            menu.handle_character_selection_final()
+            menu.render_queue.flush(menu.screen)
+            menu.render_queue.end_frame()
+            menu.text_cache.end_frame()
+        timings.append((time.perf_counter() - start) / FRAMES * 1000)
+    timings.sort()
+    print(
+        f"handle_character_selection_final: best {timings[0]:.3f} ms/frame, "
+        f"median {timings[REPEATS // 2]:.3f} ms/frame"
+    )
+
+if __name__ == "__main__":
+    main()
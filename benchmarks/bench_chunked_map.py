@@ -0,0 +1,122 @@
+"""
+Benchmark: camera panning over a synthetic 16k x 16k map drawn as chunks
+(game.chunked_map.ChunkedMap, LRU cache) vs what a single full-size
+surface would cost, plus a 4k x 4k map read from a chunk directory.
+
+Run from the project root:
+    python benchmarks/bench_chunked_map.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame as pyg
+
+from game.camera import Camera
+from game.chunked_map import (
+    CHUNK_CACHE_SIZE,
+    CHUNK_SIZE,
+    ChunkedMap,
+    load_chunked_map,
+    save_chunked_map,
+)
+
+WINDOW_SIZE = (1280, 720)
+BIG_MAP = (16384, 16384)
+DISK_MAP = (4096, 4096)
+FRAMES = 1500
+PAN_SPEED = (24, 11)  # pixels per frame, bounces on the map edges
+
+
+def synthetic_chunk(cx, cy):
+    """A chunk generated on the fly: checker colour plus a few 'trees'."""
+    chunk = pyg.Surface((CHUNK_SIZE, CHUNK_SIZE)).convert()
+    chunk.fill((30 + (cx * 7) % 60, 80 + (cy * 11) % 80, 40))
+    for i in range(8):
+        center = ((i * 97 + cx * 13) % CHUNK_SIZE, (i * 61 + cy * 29) % CHUNK_SIZE)
+        pyg.draw.circle(chunk, (20, 60, 20), center, 24)
+    return chunk
+
+
+def pan(screen, layer_map, camera, prefetch=0):
+    """Pan the camera for FRAMES frames; returns (avg ms, worst ms after
+    the first frame, which loads the whole view)."""
+    dx, dy = PAN_SPEED
+    total = worst = 0.0
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        camera.move(dx, dy)
+        if camera.rect.left == 0 or camera.rect.right == camera.world.right:
+            dx = -dx
+        if camera.rect.top == 0 or camera.rect.bottom == camera.world.bottom:
+            dy = -dy
+        layer_map.draw(screen, camera)
+        if prefetch:
+            layer_map.prefetch(camera, prefetch)
+        elapsed = (time.perf_counter() - start) * 1000
+        total += elapsed
+        if frame:
+            worst = max(worst, elapsed)
+    return total / FRAMES, worst
+
+
+def report(label, size, layer_map, avg, worst):
+    resident_mb = layer_map.resident * CHUNK_SIZE * CHUNK_SIZE * 4 / 2**20
+    full_mb = size[0] * size[1] * 4 / 2**20
+    print(
+        f"{label:<22}{avg:>9.3f}{worst:>10.3f}{layer_map.loads:>8}{layer_map.evictions:>8}"
+        f"{resident_mb:>11.0f}{full_mb:>11.0f}"
+    )
+
+
+def main():
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    pyg.init()
+    screen = pyg.display.set_mode(WINDOW_SIZE)
+    print(f"chunk {CHUNK_SIZE}px, cache {CHUNK_CACHE_SIZE} chunks, {FRAMES} frames")
+    print(f"{'map':<22}{'avg ms':>9}{'worst ms':>10}{'loads':>8}{'evicts':>8}"
+          f"{'chunks MB':>11}{'full MB':>11}")
+
+    big = ChunkedMap(BIG_MAP, synthetic_chunk)
+    camera = Camera(WINDOW_SIZE, BIG_MAP)
+    avg, worst = pan(screen, big, camera)
+    report("16k generated", BIG_MAP, big, avg, worst)
+
+    big = ChunkedMap(BIG_MAP, synthetic_chunk)
+    camera = Camera(WINDOW_SIZE, BIG_MAP)
+    avg, worst = pan(screen, big, camera, prefetch=1)
+    report("16k + prefetch", BIG_MAP, big, avg, worst)
+
+    # Same panning over a map read from disk, chunk files loaded on demand
+    whole = pyg.Surface(DISK_MAP).convert()
+    for cy in range(DISK_MAP[1] // CHUNK_SIZE):
+        for cx in range(DISK_MAP[0] // CHUNK_SIZE):
+            whole.blit(synthetic_chunk(cx, cy), (cx * CHUNK_SIZE, cy * CHUNK_SIZE))
+    with tempfile.TemporaryDirectory() as path:
+        save_chunked_map(path, {"back": (whole, False)})
+        start = time.perf_counter()
+        disk = load_chunked_map(path)["back"]
+        open_ms = (time.perf_counter() - start) * 1000
+        camera = Camera(WINDOW_SIZE, DISK_MAP)
+        avg, worst = pan(screen, disk, camera)
+        report("4k chunk directory", DISK_MAP, disk, avg, worst)
+
+        disk = load_chunked_map(path)["back"]
+        camera = Camera(WINDOW_SIZE, DISK_MAP)
+        avg, worst = pan(screen, disk, camera, prefetch=1)
+        report("4k dir + prefetch", DISK_MAP, disk, avg, worst)
+
+        # Full-image approach for the same 4k map: one PNG, decoded up front
+        full_path = os.path.join(path, "whole.png")
+        pyg.image.save(whole, full_path)
+        start = time.perf_counter()
+        pyg.image.load(full_path).convert()
+        full_ms = (time.perf_counter() - start) * 1000
+    print(f"\n4k map startup: chunk directory {open_ms:.1f} ms, whole PNG {full_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
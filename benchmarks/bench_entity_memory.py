@@ -0,0 +1,56 @@
+"""
+Benchmark: memory per entity for large entity counts.
+
+Run from the project root:
+    python benchmarks/bench_entity_memory.py
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.characters import Character, CharacterType
+from game.enemy import Enemy
+from game.items import Consumable, Equipment, Item
+
+ENTITY_COUNT = 100_000
+CHARACTER_COUNT = 1_000
+
+
+def bytes_per_entity(factory, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the entities is not part of the entity cost
+    list_bytes = sys.getsizeof(entities)
+    del entities
+    return (after - before - list_bytes) / count
+
+
+def main():
+    template = Character(2)
+    factories = [
+        ("Enemy", lambda i: Enemy(i, i), ENTITY_COUNT),
+        ("Item", lambda i: Item("Gold", "Coins", 5, x=i, y=i), ENTITY_COUNT),
+        ("Consumable", lambda i: Consumable("Potion", "heal", 20, "Heals", 10), ENTITY_COUNT),
+        ("Equipment", lambda i: Equipment("Helmet", "head", armor=3), ENTITY_COUNT),
+        ("Character (own frames)",
+         lambda i: Character(2, position=(i, i), char_type=CharacterType(2)),
+         200),
+        ("Character (shared type)",
+         lambda i: Character(2, position=(i, i), char_type=template.char_type),
+         CHARACTER_COUNT),
+    ]
+    print(f"{'entity':>24} | {'count':>7} | {'bytes/entity':>12}")
+    print("-" * 50)
+    for name, factory, count in factories:
+        print(f"{name:>24} | {count:>7} | {bytes_per_entity(factory, count):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: server-side loot simulation on inventories of 20 to 100,000
+items, the former list-based Inventory vs the indexed Inventory (slot
+array, class/name/rarity indexes, consumable stacks, running value).
+Loot is 60% consumables from a few kinds (they stack) and 40% unique
+equipment.
+
+Run from the project root:
+    python benchmarks/bench_inventory.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.items import (
+    ITEM_RARITY_COMMON,
+    ITEM_RARITY_EPIC,
+    ITEM_RARITY_RARE,
+    Consumable,
+    Equipment,
+    Inventory,
+)
+
+SIZES = (20, 1_000, 10_000, 100_000)
+REMOVALS = 1000
+QUERIES = 100
+CONSUMABLE_KINDS = (
+    ("Small potion", "heal", 20, 5),
+    ("Potion", "heal", 50, 15),
+    ("Elixir", "damage_boost", 10, 40),
+)
+
+
+class ListInventory:
+    """The former Inventory: a plain list."""
+
+    def __init__(self, max_size=20):
+        self.items = []
+        self.max_size = max_size
+
+    def add_item(self, item):
+        if len(self.items) < self.max_size:
+            self.items.append(item)
+            return True
+        return False
+
+    def remove_item(self, item):
+        if item in self.items:
+            self.items.remove(item)
+            return True
+        return False
+
+    def get_inventory_value(self):
+        return sum(item.value for item in self.items)
+
+    def get_items_by_type(self, item_type):
+        return [item for item in self.items if isinstance(item, item_type)]
+
+
+def make_loot(count, rng):
+    loot = []
+    for i in range(count):
+        if rng.random() < 0.6:
+            name, effect, amount, value = rng.choice(CONSUMABLE_KINDS)
+            loot.append(Consumable(name, effect, amount, value=value))
+        else:
+            rarity = rng.choice((ITEM_RARITY_COMMON, ITEM_RARITY_RARE, ITEM_RARITY_EPIC))
+            loot.append(Equipment(f"Blade {i}", "hand_r", damage_bonus=rng.randrange(1, 9),
+                                  value=rng.randrange(10, 500), rarity=rarity))
+    return loot
+
+
+def bench(inventory_class, loot, removed):
+    inventory = inventory_class(max_size=len(loot))
+    start = time.perf_counter()
+    for item in loot:
+        inventory.add_item(item)
+    add_us = (time.perf_counter() - start) * 1e6 / len(loot)
+    slots = getattr(inventory, "used_slots", len(loot))
+
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        inventory.get_items_by_type(Equipment)
+    query_us = (time.perf_counter() - start) * 1e6 / QUERIES
+
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        inventory.get_inventory_value()
+    value_us = (time.perf_counter() - start) * 1e6 / QUERIES
+
+    start = time.perf_counter()
+    for item in removed:
+        inventory.remove_item(item)
+    remove_us = (time.perf_counter() - start) * 1e6 / len(removed)
+    return add_us, remove_us, query_us, value_us, slots
+
+
+def main():
+    rng = random.Random(8)
+    print(f"microseconds per operation ({REMOVALS} random removals, {QUERIES} queries)")
+    print(f"{'items':>8} {'inventory':<8}{'add':>8}{'remove':>10}{'by type':>10}{'value':>10}"
+          f"{'slots':>8}")  # slots used once full
+    for size in SIZES:
+        loot = make_loot(size, rng)
+        removed = rng.sample(loot, min(REMOVALS, size))
+        for name, inventory_class in (("list", ListInventory), ("indexed", Inventory)):
+            add_us, remove_us, query_us, value_us, slots = bench(inventory_class, loot, removed)
+            print(f"{size:>8} {name:<8}{add_us:>8.2f}{remove_us:>10.2f}{query_us:>10.1f}"
+                  f"{value_us:>10.2f}{slots:>8}")
+
+
+if __name__ == "__main__":
+    main()
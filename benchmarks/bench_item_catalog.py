@@ -0,0 +1,114 @@
+"""
+Benchmark: memory of 100,000 dropped items, one Item / Consumable /
+Equipment object each (own name, description, value, rarity...) vs
+CatalogItem flyweights sharing the catalog definitions; then the size
+and speed of an inventory sync, JSON of get_info() per slot vs the
+binary pack_inventory format.
+
+Run from the project root:
+    python benchmarks/bench_item_catalog.py
+"""
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.item_catalog import get_item_catalog, pack_inventory, unpack_inventory
+from game.items import Consumable, Equipment, Inventory, Item
+
+NB_DROPS = 100_000
+INVENTORY_SLOTS = 1000
+WORLD_SIZE = 4000
+ROUNDS = 20
+
+
+def legacy_item(definition, x, y):
+    """An object per drop, with its own copies of the definition fields, as
+    a save file or a network message would produce them."""
+    name = "".join(definition.name)
+    description = "".join(definition.description)
+    if definition.item_class is Consumable:
+        item = Consumable(name, definition.effect, definition.amount, description,
+                          definition.value, definition.rarity)
+    elif definition.item_class is Equipment:
+        item = Equipment(name, definition.slot, definition.armor, definition.damage_bonus,
+                         description, definition.value, definition.rarity)
+    else:
+        item = Item(name, description, definition.value, definition.rarity)
+    item.position = (x, y)
+    return item
+
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return items, after - before
+
+
+def main():
+    catalog = get_item_catalog()
+    rng = random.Random(6)
+    drops = [
+        (rng.choice(catalog.definitions), rng.randrange(WORLD_SIZE), rng.randrange(WORLD_SIZE))
+        for _ in range(NB_DROPS)
+    ]
+
+    legacy, legacy_bytes = measure(lambda: [legacy_item(d, x, y) for d, x, y in drops])
+    flyweights, flyweight_bytes = measure(
+        lambda: [catalog.create(d.key, x, y) for d, x, y in drops]
+    )
+    print(f"{NB_DROPS} dropped items ({len(catalog)} definitions in the catalog)")
+    print(f"  Item objects     {legacy_bytes / 2**20:8.2f} MB  "
+          f"({legacy_bytes / NB_DROPS:.0f} bytes/item)")
+    print(f"  CatalogItem      {flyweight_bytes / 2**20:8.2f} MB  "
+          f"({flyweight_bytes / NB_DROPS:.0f} bytes/item)")
+
+    inventory = Inventory(INVENTORY_SLOTS)
+    for item in flyweights:
+        if not inventory.add_item(item):
+            break
+
+    def to_json():
+        return json.dumps([
+            dict(item.get_info(), slot=slot, count=count) for slot, item, count in inventory.slots()
+        ]).encode("utf-8")
+
+    def from_json(data):
+        restored = Inventory(INVENTORY_SLOTS)
+        for entry in json.loads(data):
+            definition = catalog.by_name(entry["name"])
+            restored.place(entry["slot"], catalog.create(definition.key), entry["count"])
+        return restored
+
+    json_data, binary_data = to_json(), pack_inventory(inventory)
+    timings = {}
+    for name, pack, unpack, data in (
+        ("JSON", to_json, from_json, json_data),
+        ("binary", lambda: pack_inventory(inventory), unpack_inventory, binary_data),
+    ):
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            pack()
+        middle = time.perf_counter()
+        for _ in range(ROUNDS):
+            restored = unpack(data)
+        end = time.perf_counter()
+        assert restored.get_inventory_value() == inventory.get_inventory_value()
+        timings[name] = ((middle - start) * 1000 / ROUNDS, (end - middle) * 1000 / ROUNDS)
+
+    print(f"\ninventory sync, {inventory.used_slots} slots ({inventory.count} items)")
+    print(f"  {'':<8}{'bytes':>9}{'pack ms':>10}{'unpack ms':>11}")
+    for name, data in (("JSON", json_data), ("binary", binary_data)):
+        pack_ms, unpack_ms = timings[name]
+        print(f"  {name:<8}{len(data):>9}{pack_ms:>10.2f}{unpack_ms:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: map stage of the startup (map_back + map_front scaled to the
+window and converted) without layer cache, with an empty cache (first
+launch: build + write) and with a warm cache (later launches), at a few
+resolutions. Each measure runs in a fresh process, like a real launch.
+
+Run from the project root:
+    python benchmarks/bench_layer_cache.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+RESOLUTIONS = ((1280, 720), (1920, 1080), (2560, 1440))
+RUNS = 5
+
+MAP_STAGE = """
+import os, sys, time
+sys.path.insert(0, {src!r})
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame as pyg
+from game.map_laoder import MapLoader
+from ui.backgrounds import BackgroundLayers
+from utils.layer_cache import LayerCache
+pyg.init()
+pyg.display.set_mode(({w}, {h}))
+start = time.perf_counter()
+loader = MapLoader(None)
+layers = BackgroundLayers(({w}, {h}), cache=LayerCache({cache!r}) if {cache!r} else None)
+layers.register("map_back", loader.map_path_back, alpha=False)
+layers.register("map_front", loader.map_path_fore)
+layers.get("map_back")
+layers.get("map_front")
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def map_stage_ms(size, cache_dir):
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    code = MAP_STAGE.format(src=src, w=size[0], h=size[1], cache=cache_dir)
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def main():
+    print(f"{'resolution':<12}{'no cache':>10}{'first run':>11}{'cached':>9}   ms (best of {RUNS})")
+    for size in RESOLUTIONS:
+        plain = min(map_stage_ms(size, "") for _ in range(RUNS))
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = map_stage_ms(size, cache_dir)
+            cached = min(map_stage_ms(size, cache_dir) for _ in range(RUNS))
+        label = f"{size[0]}x{size[1]}"
+        print(f"{label:<12}{plain:>10.2f}{first:>11.2f}{cached:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
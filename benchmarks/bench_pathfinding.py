@@ -0,0 +1,151 @@
+"""
+Benchmark: steering 1,000 enemies toward 4 moving players around walls,
+A* per enemy and per tick vs cached A* paths (next_waypoint) vs shared
+flow fields (Enemy.chase_target and the batched EnemySwarm tick), on a
+160 x 90 tile grid (2560 x 1440 pixels).
+
+Run from the project root:
+    python benchmarks/bench_pathfinding.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np
+
+from game.enemy import ENEMY_VISION_RANGE, Enemy
+from game.pathfinding import PathFinder
+from game.swarm import EnemySwarm
+from game.tile_map import TILE_SIZE, WalkGrid
+
+GRID_SIZE = (160, 90)
+NB_WALLS = 220
+NB_ENEMIES = 1000
+NB_PLAYERS = 4
+TICKS = 60
+UNCACHED_TICKS = 3
+PLAYER_SPEED = 2
+
+
+class Target:
+    """Player stand-in walking in a straight line."""
+
+    def __init__(self, rng, grid):
+        self.position = random_open_position(rng, grid)
+        self.velocity = (rng.choice((-1, 1)) * PLAYER_SPEED, rng.choice((-1, 1)) * PLAYER_SPEED)
+
+    def move(self):
+        self.position = (self.position[0] + self.velocity[0], self.position[1] + self.velocity[1])
+
+    def take_damage(self, amount):
+        pass
+
+
+def random_open_position(rng, grid, around=None, radius=0):
+    while True:
+        if around is None:
+            x = rng.uniform(0, grid.width * TILE_SIZE)
+            y = rng.uniform(0, grid.height * TILE_SIZE)
+        else:
+            x = around[0] + rng.uniform(-radius, radius)
+            y = around[1] + rng.uniform(-radius, radius)
+        if grid.walkable_at(x, y):
+            return (x, y)
+
+
+def build_grid(rng):
+    grid = WalkGrid(*GRID_SIZE, TILE_SIZE)
+    for _ in range(NB_WALLS):
+        x, y = rng.randrange(GRID_SIZE[0]), rng.randrange(GRID_SIZE[1])
+        length = rng.randrange(3, 12)
+        horizontal = rng.random() < 0.5
+        for i in range(length):
+            tx, ty = (x + i, y) if horizontal else (x, y + i)
+            if tx < GRID_SIZE[0] and ty < GRID_SIZE[1]:
+                grid.set_blocked(tx, ty)
+    return grid
+
+
+def run(tick, players, ticks):
+    start_positions = [player.position for player in players]
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for player in players:
+            player.move()
+        tick()
+    elapsed = (time.perf_counter() - start) / ticks * 1000
+    for player, position in zip(players, start_positions):
+        player.position = position
+    return elapsed
+
+
+def main():
+    rng = random.Random(5)
+    grid = build_grid(rng)
+    players = [Target(rng, grid) for _ in range(NB_PLAYERS)]
+    spawns = [
+        random_open_position(rng, grid, players[i % NB_PLAYERS].position, ENEMY_VISION_RANGE * 0.7)
+        for i in range(NB_ENEMIES)
+    ]
+    chased = [players[i % NB_PLAYERS] for i in range(NB_ENEMIES)]
+
+    def uncached_tick():
+        for position, player in zip(spawns, chased):
+            finder.find_path(finder.cell_of(position), finder.cell_of(player.position))
+
+    def cached_tick():
+        for i, (position, player) in enumerate(zip(spawns, chased)):
+            finder.next_waypoint(i, position, player.position)
+
+    enemies = [Enemy(x, y) for x, y in spawns]
+
+    def enemy_tick():
+        for enemy, player in zip(enemies, chased):
+            enemy.chase_target(player)
+
+    swarm = EnemySwarm(NB_ENEMIES)
+    swarm.spawn_many([x for x, _ in spawns], [y for _, y in spawns])
+    start_positions = swarm.positions.copy()
+
+    def swarm_tick(pathfinder):
+        swarm.update(players, pathfinder)
+
+    print(f"{NB_ENEMIES} enemies, {NB_PLAYERS} moving players, {GRID_SIZE[0]}x{GRID_SIZE[1]} "
+          f"tiles, {TICKS} ticks")
+    print(f"{'ms/tick':<34}{'ms':>8}   searches / fields built")
+
+    finder = PathFinder(grid)
+    ms = run(uncached_tick, players, UNCACHED_TICKS)
+    print(f"{'A* per enemy, every tick':<34}{ms:>8.2f}   {finder.searches} searches "
+          f"({UNCACHED_TICKS} ticks)")
+
+    finder = PathFinder(grid)
+    ms = run(cached_tick, players, TICKS)
+    print(f"{'cached A* (next_waypoint)':<34}{ms:>8.2f}   {finder.searches} searches, "
+          f"{finder.path_hits} cache hits")
+
+    finder = PathFinder(grid)
+    for enemy in enemies:
+        enemy.pathfinder = finder
+    ms = run(enemy_tick, players, TICKS)
+    print(f"{'flow field, Enemy.chase_target':<34}{ms:>8.2f}   {finder.fields_built} fields, "
+          f"{finder.field_hits} cache hits")
+
+    ms = run(lambda: swarm_tick(None), players, TICKS)
+    swarm.positions[:NB_ENEMIES] = start_positions
+    print(f"{'EnemySwarm tick, straight chase':<34}{ms:>8.2f}")
+    finder = PathFinder(grid)
+    ms = run(lambda: swarm_tick(finder), players, TICKS)
+    print(f"{'EnemySwarm tick, flow fields':<34}{ms:>8.2f}   {finder.fields_built} fields, "
+          f"{finder.field_hits} cache hits")
+
+    blocked = np.count_nonzero(finder._blocked)
+    print(f"\n{blocked} blocked cells ({blocked / (GRID_SIZE[0] * GRID_SIZE[1]):.0%}), flow field "
+          f"window {2 * finder.radius + 1}x{2 * finder.radius + 1} cells")
+
+
+if __name__ == "__main__":
+    main()
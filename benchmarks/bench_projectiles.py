@@ -0,0 +1,133 @@
+"""
+Benchmark: 10,000 live projectiles (spawn, update, draw per frame), a
+list of Projectile objects (one allocation per shot, per-object update,
+one blit each) vs ProjectilePool (preallocated arrays, free-list slots,
+batched update and one blits call). Expired projectiles are replaced
+every frame so the pool stays at 10k and the spawn path is exercised.
+
+Run from the project root:
+    python benchmarks/bench_projectiles.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame as pyg
+
+from game.projectiles import PROJECTILE_ANIM_SPEED, ProjectilePool
+
+WINDOW_SIZE = (1280, 720)
+WORLD_SIZE = (2560, 1440)
+NB_PROJECTILES = 10000
+FRAMES = 120
+DELTA_TIME = 16
+EFFECT_FRAMES = 6
+EFFECT_SIZE = 16
+
+
+class Projectile:
+    """Naive projectile: one object per shot."""
+
+    __slots__ = ("x", "y", "vx", "vy", "lifetime", "age", "owner", "frames")
+
+    def __init__(self, x, y, vx, vy, lifetime, owner, frames):
+        self.x, self.y = x, y
+        self.vx, self.vy = vx, vy
+        self.lifetime = lifetime
+        self.age = 0
+        self.owner = owner
+        self.frames = frames
+
+    def update(self, delta_time):
+        self.x += self.vx * delta_time
+        self.y += self.vy * delta_time
+        self.lifetime -= delta_time
+        self.age += delta_time
+        return self.lifetime > 0
+
+    def draw(self, surface, view):
+        if view.left - EFFECT_SIZE < self.x < view.right and view.top - EFFECT_SIZE < self.y < view.bottom:
+            frame = self.frames[int(self.age // PROJECTILE_ANIM_SPEED) % len(self.frames)]
+            surface.blit(frame, (int(self.x - view.x), int(self.y - view.y)))
+
+
+def random_shot(rng):
+    return (
+        rng.uniform(0, WORLD_SIZE[0]), rng.uniform(0, WORLD_SIZE[1]),
+        rng.uniform(-0.5, 0.5), rng.uniform(-0.5, 0.5),
+        rng.uniform(200, 2000), rng.randrange(4),
+    )
+
+
+def bench_objects(frames, screen, view):
+    rng = random.Random(3)
+    projectiles = [Projectile(*random_shot(rng), frames) for _ in range(NB_PROJECTILES)]
+    timings = {"spawn": 0.0, "update": 0.0, "draw": 0.0}
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        projectiles = [p for p in projectiles if p.update(DELTA_TIME)]
+        middle = time.perf_counter()
+        while len(projectiles) < NB_PROJECTILES:
+            projectiles.append(Projectile(*random_shot(rng), frames))
+        spawned = time.perf_counter()
+        for projectile in projectiles:
+            projectile.draw(screen, view)
+        end = time.perf_counter()
+        timings["update"] += middle - start
+        timings["spawn"] += spawned - middle
+        timings["draw"] += end - spawned
+    return timings
+
+
+def bench_pool(frames, screen, view):
+    rng = random.Random(3)
+    pool = ProjectilePool()
+    effect = pool.effect_id("bench", frames)
+    shots = [random_shot(rng) for _ in range(NB_PROJECTILES)]
+    for x, y, vx, vy, lifetime, owner in shots:
+        pool.spawn(x, y, vx, vy, effect, lifetime, owner)
+    timings = {"spawn": 0.0, "update": 0.0, "draw": 0.0}
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        pool.update(DELTA_TIME)
+        middle = time.perf_counter()
+        while pool.live < NB_PROJECTILES:
+            x, y, vx, vy, lifetime, owner = random_shot(rng)
+            pool.spawn(x, y, vx, vy, effect, lifetime, owner)
+        spawned = time.perf_counter()
+        pool.draw(screen, view)
+        end = time.perf_counter()
+        timings["update"] += middle - start
+        timings["spawn"] += spawned - middle
+        timings["draw"] += end - spawned
+    return timings, pool
+
+
+def main():
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    pyg.init()
+    screen = pyg.display.set_mode(WINDOW_SIZE)
+    frames = []
+    for i in range(EFFECT_FRAMES):
+        frame = pyg.Surface((EFFECT_SIZE, EFFECT_SIZE), pyg.SRCALPHA)
+        pyg.draw.circle(frame, (80, 160, 255, 255 - 30 * i), (EFFECT_SIZE // 2,) * 2, 6)
+        frames.append(frame.convert_alpha())
+    view = pyg.Rect((640, 360), WINDOW_SIZE)
+
+    objects = bench_objects(frames, screen, view)
+    pooled, pool = bench_pool(frames, screen, view)
+
+    print(f"{NB_PROJECTILES} live projectiles, {FRAMES} frames, "
+          f"view {WINDOW_SIZE[0]}x{WINDOW_SIZE[1]} of a {WORLD_SIZE[0]}x{WORLD_SIZE[1]} world")
+    print(f"{'ms/frame':<16}{'spawn':>8}{'update':>8}{'draw':>8}{'total':>8}")
+    for name, timings in (("objects", objects), ("ProjectilePool", pooled)):
+        values = [timings[key] * 1000 / FRAMES for key in ("spawn", "update", "draw")]
+        print(f"{name:<16}" + "".join(f"{value:>8.2f}" for value in values) + f"{sum(values):>8.2f}")
+    print(f"\npool capacity after the run: {pool.capacity} slots")
+
+
+if __name__ == "__main__":
+    main()
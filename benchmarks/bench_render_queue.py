@@ -0,0 +1,88 @@
+"""
+Benchmark: a game frame (map background, N character sprites, map
+foreground) drawn with individual screen.blit calls vs the RenderQueue
+(one blits call per layer), with the per-layer timings of the queue.
+
+Run from the project root:
+    python benchmarks/bench_render_queue.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame as pyg
+
+from game.characters import get_character_type
+from ui.render_queue import (
+    LAYER_BACKGROUND,
+    LAYER_ENTITIES,
+    LAYER_FOREGROUND,
+    LAYER_NAMES,
+    RenderQueue,
+)
+
+WINDOW_SIZE = (1280, 720)
+SPRITE_COUNTS = (10, 100, 1000)
+FRAMES = 200
+
+
+def build_scene(count):
+    frames = get_character_type(2).frames['idle']['right']
+    rng = random.Random(count)
+    return [
+        (frames[i % len(frames)], (rng.randrange(1240), rng.randrange(680)))
+        for i in range(count)
+    ]
+
+
+def frame_immediate(screen, back, front, sprites):
+    screen.blit(back, (0, 0))
+    for sprite, pos in sprites:
+        screen.blit(sprite, pos)
+    screen.blit(front, (0, 0))
+
+
+def frame_queued(screen, queue, back, front, sprites):
+    queue.submit(back, (0, 0), layer=LAYER_BACKGROUND)
+    entities = queue.layer(LAYER_ENTITIES)
+    for sprite, pos in sprites:
+        entities.blit(sprite, pos)
+    queue.submit(front, (0, 0), layer=LAYER_FOREGROUND)
+    queue.flush(screen)
+    queue.end_frame()
+
+
+def measure(draw):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    pyg.init()
+    screen = pyg.display.set_mode(WINDOW_SIZE)
+    back = pyg.Surface(WINDOW_SIZE).convert()
+    back.fill((40, 90, 40))
+    front = pyg.Surface(WINDOW_SIZE, pyg.SRCALPHA).convert_alpha()
+    pyg.draw.rect(front, (20, 20, 20, 255), (0, 640, 1280, 80))
+    queue = RenderQueue()
+
+    print(f"{'sprites':>8}{'blit (ms)':>12}{'queue (ms)':>12}   per layer (ms)")
+    for count in SPRITE_COUNTS:
+        sprites = build_scene(count)
+        immediate = measure(lambda: frame_immediate(screen, back, front, sprites))
+        queued = measure(lambda: frame_queued(screen, queue, back, front, sprites))
+        layers = "  ".join(
+            f"{LAYER_NAMES[layer]} {ms:.3f}"
+            for layer, ms in sorted(queue.last_timings.items())
+        )
+        print(f"{count:>8}{immediate:>12.3f}{queued:>12.3f}   {layers}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark: N animated entities scattered over a map 3x the screen, drawn
+every frame with one blit each (y-sorted, no culling) vs through the Scene
+(sync, y-sort of the moved sprites, culling, one blits call), and the
+Scene's dirty-rect mode over a static background with 10% of the entities moving.
+
+Run from the project root:
+    python benchmarks/bench_scene.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame as pyg
+
+from game.characters import get_character_type
+from game.scene import SCENE_LAYER_ACTORS, Scene
+from ui.render_queue import LAYER_ENTITIES, RenderQueue
+
+WINDOW_SIZE = (1280, 720)
+WORLD_SIZE = (3840, 2160)
+ENTITY_COUNTS = (100, 500, 2000)
+MOVING_RATIO = 0.1
+FRAMES = 200
+
+
+class Dummy:
+    """Minimal entity: a position and an animation frame."""
+
+    __slots__ = ("position", "frames", "frame", "speed")
+
+    def __init__(self, position, frames, speed):
+        self.position = position
+        self.frames = frames
+        self.frame = 0
+        self.speed = speed
+
+    def step(self, tick):
+        if self.speed:
+            x, y = self.position
+            self.position = ((x + self.speed) % WORLD_SIZE[0], y)
+        if tick % 6 == 0:
+            self.frame = (self.frame + 1) % len(self.frames)
+
+    def get_current_sprite(self):
+        return self.frames[self.frame]
+
+
+def build_entities(count):
+    frames = get_character_type(2).frames['idle']['right']
+    rng = random.Random(count)
+    moving = int(count * MOVING_RATIO)
+    return [
+        Dummy(
+            (rng.randrange(WORLD_SIZE[0]), rng.randrange(WORLD_SIZE[1])),
+            frames,
+            2 if i < moving else 0,
+        )
+        for i in range(count)
+    ]
+
+
+def measure(entities, draw):
+    start = time.perf_counter()
+    for tick in range(FRAMES):
+        for entity in entities:
+            entity.step(tick)
+        draw()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    pyg.init()
+    screen = pyg.display.set_mode(WINDOW_SIZE)
+    background = pyg.Surface(WINDOW_SIZE).convert()
+    background.fill((40, 90, 40))
+    queue = RenderQueue()
+
+    print(f"{'entities':>9}{'blit all (ms)':>15}{'scene (ms)':>12}{'visible':>9}"
+          f"{'dirty mode (ms)':>17}")
+    for count in ENTITY_COUNTS:
+        entities = build_entities(count)
+
+        def draw_all():
+            screen.blit(background, (0, 0))
+            for entity in sorted(entities, key=lambda entity: entity.position[1]):
+                screen.blit(entity.get_current_sprite(), entity.position)
+
+        scene = Scene(screen.get_rect())
+        for entity in entities:
+            scene.add_entity(entity, SCENE_LAYER_ACTORS)
+        layer = queue.layer(LAYER_ENTITIES)
+
+        def draw_scene():
+            screen.blit(background, (0, 0))
+            scene.update()
+            scene.queue(layer)
+            queue.flush(screen)
+            queue.end_frame()
+
+        dirty_scene = Scene(screen.get_rect())
+        for entity in entities:
+            dirty_scene.add_entity(entity, SCENE_LAYER_ACTORS)
+        dirty_scene.clear(screen, background)
+        screen.blit(background, (0, 0))
+
+        def draw_dirty():
+            dirty_scene.update()
+            dirty_scene.draw(screen)
+
+        all_ms = measure(entities, draw_all)
+        scene_ms = measure(entities, draw_scene)
+        dirty_ms = measure(entities, draw_dirty)
+        print(f"{count:>9}{all_ms:>15.3f}{scene_ms:>12.3f}{scene.visible_count:>9}"
+              f"{dirty_ms:>17.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark: enemy vision/attack queries, brute force vs SpatialHash.
+
+Run from the project root:
+    python benchmarks/bench_spatial.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.enemy import ENEMY_ATTACK_RANGE, ENEMY_VISION_RANGE, Enemy, update_enemies
+from game.spatial import KIND_CHARACTER, KIND_ENEMY, SpatialHash
+
+WORLD_SIZE = 4000
+NB_PLAYERS = 4
+ENEMY_COUNTS = (100, 1_000, 10_000)
+TICKS = 20
+
+
+class Target:
+    """Minimal player stand-in: position, grid and take_damage."""
+
+    def __init__(self, x, y):
+        self.position = [x, y]
+        self.grid = None
+        self.hits = 0
+
+    def take_damage(self, amount):
+        self.hits += 1
+
+
+def make_world(nb_enemies, seed=1):
+    rng = random.Random(seed)
+    players = [Target(rng.uniform(0, WORLD_SIZE), rng.uniform(0, WORLD_SIZE))
+               for _ in range(NB_PLAYERS)]
+    enemies = [Enemy(rng.uniform(0, WORLD_SIZE), rng.uniform(0, WORLD_SIZE))
+               for _ in range(nb_enemies)]
+    return players, enemies
+
+
+def brute_force_tick(enemies, players):
+    """Old path: two square roots per (enemy, player) pair."""
+    for enemy in enemies:
+        for player in players:
+            if enemy._calculate_distance(player.position) <= ENEMY_VISION_RANGE:
+                if enemy._calculate_distance(player.position) <= ENEMY_ATTACK_RANGE:
+                    player.take_damage(enemy.damage)
+                break
+
+
+def grid_tick(enemies, grid):
+    """One grid range query per enemy, squared distances only."""
+    attack_sq = ENEMY_ATTACK_RANGE * ENEMY_ATTACK_RANGE
+    for enemy in enemies:
+        player = grid.nearest(enemy.position, ENEMY_VISION_RANGE, KIND_CHARACTER)
+        if player is not None and enemy._calculate_distance_squared(player.position) <= attack_sq:
+            player.take_damage(enemy.damage)
+
+
+def grid_batch_tick(grid):
+    """One grid range query per character; far enemies are skipped."""
+    attack_sq = ENEMY_ATTACK_RANGE * ENEMY_ATTACK_RANGE
+    for player in grid.entities(KIND_CHARACTER):
+        for enemy in grid.query_radius(player.position, ENEMY_VISION_RANGE, KIND_ENEMY):
+            if enemy._calculate_distance_squared(player.position) <= attack_sq:
+                player.take_damage(enemy.damage)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        func(*args)
+    return (time.perf_counter() - start) / TICKS * 1000
+
+
+def main():
+    print("Vision + attack queries, 4 players, ms per tick")
+    print(f"{'enemies':>8} | {'brute':>8} | {'grid/enemy':>10} | {'grid/player':>11} | "
+          f"{'speedup':>7} | {'full update':>11}")
+    print("-" * 72)
+    for count in ENEMY_COUNTS:
+        players, enemies = make_world(count)
+        brute_ms = timed(brute_force_tick, enemies, players)
+
+        grid = SpatialHash()
+        for player in players:
+            grid.insert(player, KIND_CHARACTER)
+        for enemy in enemies:
+            grid.insert(enemy, KIND_ENEMY)
+        grid_ms = timed(grid_tick, enemies, grid)
+        batch_ms = timed(grid_batch_tick, grid)
+
+        # Full AI tick through the grid, including incremental re-bucketing
+        update_ms = timed(update_enemies, enemies, grid)
+
+        print(f"{count:>8} | {brute_ms:>8.3f} | {grid_ms:>10.3f} | {batch_ms:>11.3f} | "
+              f"{brute_ms / batch_ms:>6.1f}x | {update_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: sprite loading at startup (Water, Furnace, the three menu
+buttons and the full Character-2 type), with the SpriteSheet decode cache
+cleared before each run.
+
+Run from the project root:
+    python benchmarks/bench_sprite_startup.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame as pyg
+
+import game.characters as characters
+from ui import Buttons
+from utils.asset_pack import set_default_pack
+from utils.sprite_sheet import SpriteSheet
+
+RUNS = 15
+WINDOW_SIZE = (1280, 720)
+
+
+def load_sprites():
+    """Load every sprite user once; returns (milliseconds, PNG decodes)."""
+    SpriteSheet.clear_cache()
+    characters.clear_character_types()
+    decodes = SpriteSheet.decodes
+    start = time.perf_counter()
+    characters.Water()
+    characters.Furnace()
+    Buttons.PlayButton()
+    Buttons.OptionsButton()
+    Buttons.ExitButton()
+    characters.get_character_type(2).load_all()
+    return (time.perf_counter() - start) * 1000, SpriteSheet.decodes - decodes
+
+
+def main():
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    pyg.init()
+    pyg.display.set_mode(WINDOW_SIZE)
+    set_default_pack(None)  # PNG path only
+
+    runs = sorted(load_sprites() for _ in range(RUNS))
+    ms, decodes = runs[RUNS // 2]
+    print(f"{'median (ms)':<14}{'PNG decodes':>12}")
+    print(f"{ms:<14.2f}{decodes:>12}")
+
+
+if __name__ == "__main__":
+    main()
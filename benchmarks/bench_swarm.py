@@ -0,0 +1,71 @@
+"""
+Benchmark: EnemySwarm batched tick vs the per-object Enemy loop.
+
+Run from the project root:
+    python benchmarks/bench_swarm.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.enemy import Enemy
+from game.swarm import EnemySwarm
+
+WORLD_SIZE = 2000
+ENEMY_COUNTS = (1_000, 10_000)
+TICKS = 20
+
+
+class Target:
+    """Minimal player stand-in: position and take_damage."""
+
+    def __init__(self, x, y):
+        self.position = (x, y)
+        self.damage_taken = 0
+
+    def take_damage(self, amount):
+        self.damage_taken += amount
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        func()
+    return (time.perf_counter() - start) / TICKS * 1000
+
+
+def main():
+    rng = random.Random(1)
+    print("AI tick (vision, chase, attack, death), ms per tick")
+    print(f"{'enemies':>8} | {'players':>7} | {'Enemy loop':>10} | {'EnemySwarm':>10} | {'speedup':>7}")
+    print("-" * 56)
+    for count in ENEMY_COUNTS:
+        coords = [(rng.uniform(0, WORLD_SIZE), rng.uniform(0, WORLD_SIZE)) for _ in range(count)]
+        for nb_players in (1, 4):
+            players = [Target(rng.uniform(0, WORLD_SIZE), rng.uniform(0, WORLD_SIZE))
+                       for _ in range(nb_players)]
+
+            enemies = [Enemy(x, y) for x, y in coords]
+
+            def object_tick():
+                # Per-object loop: every enemy checks every player
+                for enemy in enemies:
+                    for player in players:
+                        enemy.update(player)
+                        if enemy.state == "CHASE":
+                            break
+
+            swarm = EnemySwarm(count)
+            swarm.spawn_many([x for x, _ in coords], [y for _, y in coords])
+
+            object_ms = timed(object_tick)
+            swarm_ms = timed(lambda: swarm.update(players))
+            print(f"{count:>8} | {nb_players:>7} | {object_ms:>10.3f} | {swarm_ms:>10.3f} | "
+                  f"{object_ms / swarm_ms:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
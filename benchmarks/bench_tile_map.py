@@ -0,0 +1,123 @@
+"""
+Benchmark: load time and memory of the tile map format (game.tile_map)
+vs the whole-image maps, for map-1 converted by tools/build_tile_map.py
+and for a synthetic 1024 x 1024 tile map (16k x 16k pixels), plus chunk
+rendering and walkability grid costs.
+
+Run from the project root:
+    python benchmarks/bench_tile_map.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame as pyg
+
+from game.chunked_map import CHUNK_SIZE
+from game.map_laoder import MAP_PATH_BACKGROUND, MAP_PATH_FOREGROUND
+from game.tile_map import (
+    TILE_SIZE,
+    TileMap,
+    Tileset,
+    load_tile_map,
+    save_tile_map,
+    tile_map_from_images,
+)
+from utils.paths import find_project_root
+
+WINDOW_SIZE = (1280, 720)
+BIG_TILES = 1024  # columns and rows of the synthetic map
+SOLID_RATIO = 0.15
+CHUNKS_RENDERED = 20
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def tile_map_bytes(tile_map):
+    tiles = sum(tile.get_width() * tile.get_height() * 4 for tile in tile_map.tileset.tiles)
+    layers = sum(len(data) * data.itemsize for data in tile_map.layers.values())
+    return tiles + layers
+
+
+def bench_map_1(root, path):
+    back_path = os.path.join(root, MAP_PATH_BACKGROUND)
+    front_path = os.path.join(root, MAP_PATH_FOREGROUND)
+
+    def load_images():
+        return pyg.image.load(back_path).convert(), pyg.image.load(front_path).convert_alpha()
+
+    (back, front), images_ms = timed(load_images)
+    source = tile_map_from_images({"back": (back, False), "front": (front, True)}, TILE_SIZE, "front")
+    save_tile_map(path, source)
+    tile_map, tiles_ms = timed(lambda: load_tile_map(path))
+    images_kb = (back.get_width() * back.get_height() * 4 * 2) / 1024
+    print(f"map-1 ({tile_map.width}x{tile_map.height} tiles, "
+          f"{len(tile_map.tileset.tiles)} distinct)")
+    print(f"  whole images : {images_ms:8.2f} ms {images_kb:10.0f} KB")
+    print(f"  tile map     : {tiles_ms:8.2f} ms {tile_map_bytes(tile_map) / 1024:10.0f} KB")
+
+
+def bench_big(tileset, path):
+    rng = random.Random(42)
+    count = len(tileset.tiles)
+    cells = BIG_TILES * BIG_TILES
+    back = array("H", (rng.randrange(1, count + 1) for _ in range(cells)))
+    front = array("H", (0 if rng.random() > SOLID_RATIO else 1 for _ in range(cells)))
+    solid_tileset = Tileset(tileset.tiles, tileset.tile_size, solid={1})
+    source = TileMap(BIG_TILES, BIG_TILES, solid_tileset, {"back": back, "front": front},
+                     {"back": False, "front": True})
+    save_tile_map(path, source)
+    file_kb = os.path.getsize(os.path.join(path, "map.json")) / 1024
+
+    tile_map, load_ms = timed(lambda: load_tile_map(path))
+    grid, grid_ms = timed(tile_map.walk_grid)
+    full_mb = cells * TILE_SIZE * TILE_SIZE * 4 * 2 / 2**20
+    layers_kb = sum(len(data) * data.itemsize for data in tile_map.layers.values()) / 1024
+    bools_kb = (sys.getsizeof([]) + 8 * BIG_TILES + BIG_TILES * (sys.getsizeof([]) + 8 * BIG_TILES)) / 1024
+
+    layer = tile_map.chunked("back")
+    start = time.perf_counter()
+    for i in range(CHUNKS_RENDERED):
+        layer.chunk(i, i)
+    chunk_ms = (time.perf_counter() - start) * 1000 / CHUNKS_RENDERED
+
+    queries = 100000
+    start = time.perf_counter()
+    for i in range(queries):
+        grid.walkable_at((i * 7919) % tile_map.pixel_size[0], (i * 104729) % tile_map.pixel_size[1])
+    query_us = (time.perf_counter() - start) * 1e6 / queries
+
+    print(f"\nsynthetic {BIG_TILES}x{BIG_TILES} tiles ({tile_map.pixel_size[0]}x"
+          f"{tile_map.pixel_size[1]} px, 2 layers)")
+    print(f"  descriptor file     {file_kb:10.0f} KB")
+    print(f"  load                {load_ms:10.1f} ms")
+    print(f"  tile id layers      {layers_kb:10.0f} KB   (whole images: {full_mb:.0f} MB)")
+    print(f"  walk grid build     {grid_ms:10.1f} ms")
+    print(f"  walk grid           {grid.nbytes / 1024:10.0f} KB   (list of bool lists: "
+          f"{bools_kb:.0f} KB)")
+    print(f"  walkable_at         {query_us:10.2f} us")
+    print(f"  render {CHUNK_SIZE}px chunk   {chunk_ms:10.2f} ms")
+
+
+def main():
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    pyg.init()
+    pyg.display.set_mode(WINDOW_SIZE)
+    root = find_project_root()
+    with tempfile.TemporaryDirectory() as path:
+        bench_map_1(root, os.path.join(path, "map-1"))
+        tileset = load_tile_map(os.path.join(path, "map-1")).tileset
+        bench_big(tileset, os.path.join(path, "big"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+from game.enemy import ENEMY_BASE_SPEED, ENEMY_VISION_RANGE
+
+BUCKET_NEAR = "near"
+BUCKET_MID = "mid"
+BUCKET_FAR = "far"
+BUCKETS = (BUCKET_NEAR, BUCKET_MID, BUCKET_FAR)
+
+AI_NEAR_RANGE = ENEMY_VISION_RANGE  # full AI every tick
+AI_MID_INTERVAL = 4                 # ticks between two mid-range updates
+AI_FAR_INTERVAL = 30                # ticks between two far-range re-bucketings
+AI_PLAYER_SPEED = 2                 # fastest player, pixels per tick
+# Far enemies only get re-bucketed every AI_FAR_INTERVAL ticks: the mid
+# band must be wider than what a player and an enemy can close meanwhile,
+# so nobody enters the vision range while still frozen
+AI_MID_RANGE = AI_NEAR_RANGE + (AI_PLAYER_SPEED + ENEMY_BASE_SPEED) * AI_FAR_INTERVAL + 50
+AI_UPDATE_BUDGET = None             # max AI updates per tick, None = no limit
+
+
+class AIScheduler:
+    """
+    Level-of-detail scheduler for the enemy AI.
+
+    Enemies are bucketed by their distance to the closest player:
+
+    - near (vision range): Enemy.update every tick, chase and attack;
+    - mid: Enemy.update every ``mid_interval`` ticks, which is enough to
+      notice a player coming into vision range;
+    - far: frozen, only re-bucketed every ``far_interval`` ticks.
+
+    Enemies on screen (``view``) are never frozen. Each enemy sits in a
+    timing wheel at the tick it is next due, so a tick only looks at the
+    enemies due on it, not at the whole population. With a ``budget``,
+    at most that many AI updates run per tick: the nearest due enemies go
+    first and the rest are deferred to the next tick.
+
+    Attributes:
+        tick (int): Ticks run
+        counts (dict): Bucket -> enemies in it, as of their last bucketing
+        updates (dict): Bucket -> AI updates of the last tick
+        deferred (int): Updates pushed to the next tick by the budget in
+            the last tick
+        total_updates (int): AI updates since the start
+    """
+
+    def __init__(self, near_range=AI_NEAR_RANGE, mid_range=AI_MID_RANGE,
+                 mid_interval=AI_MID_INTERVAL, far_interval=AI_FAR_INTERVAL,
+                 budget=AI_UPDATE_BUDGET):
+        """
+        Args:
+            near_range (float): Distance under which the AI runs every tick
+            mid_range (float): Distance under which the AI runs every
+                ``mid_interval`` ticks; farther enemies are frozen
+            mid_interval (int): Ticks between two mid-range updates
+            far_interval (int): Ticks between two far-range re-bucketings
+            budget (int): Max AI updates per tick, None for no limit
+        """
+        self.near_sq = near_range * near_range
+        self.mid_sq = mid_range * mid_range
+        self.mid_interval = mid_interval
+        self.far_interval = far_interval
+        self.budget = budget
+        self.tick = 0
+        self._wheel = {}    # tick -> list of enemies due
+        self._due = {}      # enemy -> tick it is due, stale wheel entries are skipped
+        self._bucket = {}   # enemy -> bucket
+        self.counts = dict.fromkeys(BUCKETS, 0)
+        self.updates = dict.fromkeys(BUCKETS, 0)
+        self.deferred = 0
+        self.total_updates = 0
+
+    # ========================================================================
+    # ENEMIES
+    # ========================================================================
+
+    def add(self, enemy):
+        """
+        Schedule an enemy. First bucketings are spread over
+        ``mid_interval`` ticks so a wave of spawns does not land on the
+        same ticks forever.
+        """
+        if enemy in self._bucket:
+            return
+        self._bucket[enemy] = None
+        self._schedule(enemy, self.tick + len(self._bucket) % self.mid_interval)
+
+    def remove(self, enemy):
+        """Unschedule an enemy (its wheel entry is dropped when due)."""
+        self._due.pop(enemy, None)
+        bucket = self._bucket.pop(enemy, None)
+        if bucket is not None:
+            self.counts[bucket] -= 1
+
+    def bucket_of(self, enemy):
+        """Bucket of an enemy, None before its first tick."""
+        return self._bucket.get(enemy)
+
+    def _schedule(self, enemy, tick):
+        self._due[enemy] = tick
+        self._wheel.setdefault(tick, []).append(enemy)
+
+    def _set_bucket(self, enemy, bucket):
+        old = self._bucket[enemy]
+        if old != bucket:
+            if old is not None:
+                self.counts[old] -= 1
+            self.counts[bucket] += 1
+            self._bucket[enemy] = bucket
+
+    # ========================================================================
+    # TICK
+    # ========================================================================
+
+    def update(self, players, view=None):
+        """
+        Run the AI of the enemies due this tick.
+
+        Args:
+            players (list): Characters exposing ``position`` and ``take_damage``
+            view (pygame.Rect): Visible area; enemies inside are at least mid
+
+        Returns:
+            int: AI updates run
+        """
+        due = self._wheel.pop(self.tick, None)
+        for bucket in BUCKETS:
+            self.updates[bucket] = 0
+        self.deferred = 0
+        if due is None:
+            self.tick += 1
+            return 0
+
+        positions = [player.position for player in players]
+        tick = self.tick
+        due_ticks = self._due
+        entries = []  # (distance squared, enemy, closest player)
+        for enemy in due:
+            if due_ticks.get(enemy) != tick:
+                continue  # removed, or rescheduled since
+            if enemy.state == "DEATH":
+                self.remove(enemy)
+                continue
+            ex, ey = enemy.position
+            best_sq, target = None, None
+            for player, (px, py) in zip(players, positions):
+                dist_sq = (px - ex) * (px - ex) + (py - ey) * (py - ey)
+                if best_sq is None or dist_sq < best_sq:
+                    best_sq, target = dist_sq, player
+            entries.append((best_sq, enemy, target))
+
+        budget = self.budget
+        if budget is not None and len(entries) > budget:
+            entries.sort(key=lambda entry: entry[0] if entry[0] is not None else float("inf"))
+        updated = 0
+        schedule = self._schedule
+        for dist_sq, enemy, target in entries:
+            if dist_sq is not None and dist_sq <= self.near_sq:
+                bucket, interval = BUCKET_NEAR, 1
+            elif dist_sq is not None and dist_sq <= self.mid_sq:
+                bucket, interval = BUCKET_MID, self.mid_interval
+            elif view is not None and view.collidepoint(enemy.position):
+                bucket, interval = BUCKET_MID, self.mid_interval
+            else:
+                self._set_bucket(enemy, BUCKET_FAR)
+                schedule(enemy, tick + self.far_interval)
+                continue
+            if budget is not None and updated >= budget:
+                self.deferred += 1
+                schedule(enemy, tick + 1)
+                continue
+            self._set_bucket(enemy, bucket)
+            enemy.update(target)
+            updated += 1
+            self.updates[bucket] += 1
+            if enemy.state == "DEATH":
+                self.remove(enemy)
+            else:
+                schedule(enemy, tick + interval)
+
+        self.total_updates += updated
+        self.tick += 1
+        return updated
+
+    def __len__(self):
+        return len(self._bucket)
+
+    def __contains__(self, enemy):
+        return enemy in self._bucket
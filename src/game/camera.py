@@ -0,0 +1,57 @@
+import pygame as pyg
+
+
+class Camera:
+    """
+    Viewport over a map larger than the screen.
+
+    The camera is a rect in world coordinates, kept inside the world
+    bounds; drawing code subtracts its top-left corner to get screen
+    coordinates. On a map no bigger than the screen it stays at (0, 0)
+    (clamp_ip centers a rect larger than its bounds, so the view is
+    sized to the world in that case).
+
+    Attributes:
+        rect (pygame.Rect): Visible area, in world coordinates
+        world (pygame.Rect): World bounds
+    """
+
+    def __init__(self, view_size, world_size=None):
+        """
+        Initialize a camera at the world origin.
+
+        Args:
+            view_size (tuple): (width, height) of the screen
+            world_size (tuple): (width, height) of the map, defaults to
+                the view size
+        """
+        self.rect = pyg.Rect((0, 0), view_size)
+        self.world = pyg.Rect((0, 0), world_size or view_size)
+
+    def set_world(self, world_size):
+        """Change the world bounds (new map) and clamp the view to them."""
+        self.world.size = world_size
+        self.rect.clamp_ip(self.world)
+
+    def follow(self, position):
+        """
+        Center the view on a world position, clamped to the world.
+
+        Args:
+            position (tuple): (x, y) in world coordinates
+        """
+        self.rect.center = (int(position[0]), int(position[1]))
+        self.rect.clamp_ip(self.world)
+
+    def move(self, dx, dy):
+        """Scroll the view by (dx, dy) pixels, clamped to the world."""
+        self.rect.move_ip(dx, dy)
+        self.rect.clamp_ip(self.world)
+
+    def to_screen(self, position):
+        """World position -> screen position."""
+        return (position[0] - self.rect.x, position[1] - self.rect.y)
+
+    def to_world(self, position):
+        """Screen position (e.g. the mouse) -> world position."""
+        return (position[0] + self.rect.x, position[1] + self.rect.y)
@@ -1,6 +1,10 @@
+import threading
+
 import pygame as pyg
 
+from utils.display_format import to_display_format
 from utils.paths import get_asset_path
+from utils.sprite_sheet import SpriteSheet
 
 FURNACE_FRAME_WIDTH = 40
 FURNACE_FRAME_HEIGHT = 40
@@ -22,6 +26,17 @@ WATER_ANIMATION_SKILL1_SPEED = 100  # milliseconds between frames
 WATER_ANIMATION_SKILL2_SPEED = 100  # milliseconds between frames
 WATER_ANIMATION_SKILL3_SPEED = 100  # milliseconds between frames
 
+# Skill effect sheets that do not follow the effect-S<n>-Sheet.png naming.
+# Unlike the 40x40 character sheets, each has its own frame size:
+# character number -> effect key -> (filename, frame width, frame height, frames)
+EFFECT_SHEETS = {
+    2: {
+        'effect1': ('effect-Bash-Sheet.png', 112, 96, 3),
+        'effect2': ('effect-Spit-Sheet.png', 176, 64, 11),
+        'effect3': ('effect-Shot-Sheet.png', 144, 64, 3),
+    },
+}
+
 
 class Furnace:
     def __init__(self):
@@ -33,38 +48,24 @@ class Furnace:
         sprite_path_IDLE = get_asset_path("sprites", "Character-1", "FIRE-IDLE-Sheet.png")
         sprite_path_WALK = get_asset_path("sprites", "Character-1", "FIRE-WALK-Sheet.png")
 
-        self.player_spritesheet_IDLE = pyg.image.load(sprite_path_IDLE)
-        self.player_spritesheet_WALK = pyg.image.load(sprite_path_WALK)
+        # Both directions cut from the same decoded sheets (SpriteSheet cache)
+        self.player_spritesheet_IDLE = SpriteSheet.image(sprite_path_IDLE)
+        self.player_spritesheet_WALK = SpriteSheet.image(sprite_path_WALK)
 
-        self.frames_IDLE = []
-        for i in range(FURNACE_IDLE_FRAMES):
-            frame = self.player_spritesheet_IDLE.subsurface(
-                (i * FURNACE_FRAME_WIDTH, 0, FURNACE_FRAME_WIDTH, FURNACE_FRAME_HEIGHT)
-            )
-            self.frames_IDLE.append(frame)
-
-        self.fram_WALK = []
-        for i in range(FURNACE_WALK_FRAMES):
-            frame = self.player_spritesheet_WALK.subsurface(
-                (i * FURNACE_FRAME_WIDTH, 0, FURNACE_FRAME_WIDTH, FURNACE_FRAME_HEIGHT)
-            )
-            self.fram_WALK.append(frame)
-
-        self.frame_WALK_left = []
-        for i in range(FURNACE_WALK_FRAMES):
-            frame = self.player_spritesheet_WALK.subsurface(
-                (i * FURNACE_FRAME_WIDTH, 0, FURNACE_FRAME_WIDTH, FURNACE_FRAME_HEIGHT)
-            )
-            frame_flipped = pyg.transform.flip(frame, True, False)
-            self.frame_WALK_left.append(frame_flipped)
-
-        self.frame_IDLE_left = []
-        for i in range(FURNACE_IDLE_FRAMES):
-            frame = self.player_spritesheet_IDLE.subsurface(
-                (i * FURNACE_FRAME_WIDTH, 0, FURNACE_FRAME_WIDTH, FURNACE_FRAME_HEIGHT)
-            )
-            frame_flipped = pyg.transform.flip(frame, True, False)
-            self.frame_IDLE_left.append(frame_flipped)
+        self.frames_IDLE = SpriteSheet.load(
+            sprite_path_IDLE, FURNACE_FRAME_WIDTH, FURNACE_FRAME_HEIGHT, FURNACE_IDLE_FRAMES
+        )
+        self.fram_WALK = SpriteSheet.load(
+            sprite_path_WALK, FURNACE_FRAME_WIDTH, FURNACE_FRAME_HEIGHT, FURNACE_WALK_FRAMES
+        )
+        self.frame_WALK_left = SpriteSheet.load(
+            sprite_path_WALK, FURNACE_FRAME_WIDTH, FURNACE_FRAME_HEIGHT, FURNACE_WALK_FRAMES,
+            flip=True,
+        )
+        self.frame_IDLE_left = SpriteSheet.load(
+            sprite_path_IDLE, FURNACE_FRAME_WIDTH, FURNACE_FRAME_HEIGHT, FURNACE_IDLE_FRAMES,
+            flip=True,
+        )
         self.frame_IDLE = 0
         self.frame_WALK = 0
         self.tem_an_IDLE = 0
@@ -151,6 +152,8 @@ class Furnace:
         pass
 
 class Water:
+    char_number = 2  # Character-2 sprites, shares its effects with Character(2)
+
     def __init__(self):
         # CHARACTER STATS
         self.health = 100
@@ -175,31 +178,18 @@ class Water:
             "sprites", "Character-2", "S2-Sheet.png"
         )
         self.sprite_skill2 = get_asset_path(
-            "sprites", "Character-2", "effect-Bash-Sheet.png"
+            "sprites", "Character-2", "effect-Spit-Sheet.png"
         )
 
         self.sprite_character_skill3 = get_asset_path(
             "sprites", "Character-2", "S3-1-Sheet.png"
         )
         self.sprite_skill3 = get_asset_path(
-            "sprites", "Character-2", "effect-Bash-Sheet.png"
+            "sprites", "Character-2", "effect-Shot-Sheet.png"
         )
 
         # INITIALIZE ANIMATION FRAME LISTS
-        self.frames_IDLE = []
-        self.frames_IDLE_left = []
-        self.frames_MOVE_right = []
-        self.frames_MOVE_left = []
-        self.frames_HURT = []
-        self.frames_DEATH = [pyg.image.load(self.sprite_DEATH)]
-
-        self.frames_character_skill1 = []
-        self.frames_character_skill2 = []
-        self.frames_character_skill3 = []
-
-        self.frames_character_skill1_left = []
-        self.frames_character_skill2_left = []
-        self.frames_character_skill3_left = []
+        self.frames_DEATH = to_display_format([SpriteSheet.image(self.sprite_DEATH)])
 
         self.frames_effect_character_skill1 = []
         self.frames_effect_character_skill2 = []
@@ -211,63 +201,50 @@ class Water:
         self.frames_effect_character_skill3_1_left = []
         self.frames_effect_character_skill3_2_left = []
 
-        # EXTRACT IDLE ANIMATION FRAMES
-        for i in range(WATER_IDLE_FRAMES):
-            frame = pyg.image.load(self.sprite_IDLE).subsurface(
-                (i * WATER_FRAME_SIZE, 0, WATER_FRAME_SIZE, WATER_FRAME_SIZE)
-            )
-            self.frames_IDLE.append(frame)
-            frame_flipped = pyg.transform.flip(frame, True, False)
-            self.frames_IDLE_left.append(frame_flipped)
-
-        # EXTRACT MOVE ANIMATION FRAMES (BOTH DIRECTIONS)
-        for i in range(WATER_MOVE_FRAMES):
-            frame = pyg.image.load(self.sprite_MOVE).subsurface(
-                (i * WATER_FRAME_SIZE, 0, WATER_FRAME_SIZE, WATER_FRAME_SIZE)
-            )
-            self.frames_MOVE_right.append(frame)
-            # Create flipped version for left direction
-            frame_flipped = pyg.transform.flip(frame, True, False)
-            self.frames_MOVE_left.append(frame_flipped)
-
-        # EXTRACT HURT ANIMATION FRAMES
-        for i in range(WATER_HURT_FRAMES):
-            frame = pyg.image.load(self.sprite_HURT).subsurface(
-                (i * WATER_FRAME_SIZE, 0, WATER_FRAME_SIZE, WATER_FRAME_SIZE)
-            )
-            self.frames_HURT.append(frame)
+        # EXTRACT ANIMATION FRAMES (each sheet is decoded once by SpriteSheet)
+        size = WATER_FRAME_SIZE
+        self.frames_IDLE = SpriteSheet.load(self.sprite_IDLE, size, size, WATER_IDLE_FRAMES)
+        self.frames_IDLE_left = SpriteSheet.load(
+            self.sprite_IDLE, size, size, WATER_IDLE_FRAMES, flip=True
+        )
+        self.frames_MOVE_right = SpriteSheet.load(self.sprite_MOVE, size, size, WATER_MOVE_FRAMES)
+        self.frames_MOVE_left = SpriteSheet.load(
+            self.sprite_MOVE, size, size, WATER_MOVE_FRAMES, flip=True
+        )
+        self.frames_HURT = SpriteSheet.load(self.sprite_HURT, size, size, WATER_HURT_FRAMES)
 
         # EXTRACT ATTACK ANIMATION FRAMES
-
-        for i in range(WATER_SKILL1_FRAMES):
-            frame = pyg.image.load(self.sprite_character_skill1).subsurface(
-                i * WATER_FRAME_SIZE, 0, WATER_FRAME_SIZE, WATER_FRAME_SIZE
-            )
-            self.frames_character_skill1.append(frame)
-
-            frame_flipped = pyg.transform.flip(frame, True, False)
-            self.frames_character_skill1_left.append(frame_flipped)
-
-        for i in range(WATER_SKILL2_FRAMES):
-            frame = pyg.image.load(self.sprite_character_skill2).subsurface(
-                i * WATER_FRAME_SIZE, 0, WATER_FRAME_SIZE, WATER_FRAME_SIZE
-            )
-            self.frames_character_skill2.append(frame)
-
-            frame_flipped = pyg.transform.flip(frame, True, False)
-            self.frames_character_skill2_left.append(frame_flipped)
-
-        for i in range(WATER_SKILL3_FRAMES):
-            frame = pyg.image.load(self.sprite_character_skill3).subsurface(
-                i * WATER_FRAME_SIZE, 0, WATER_FRAME_SIZE, WATER_FRAME_SIZE
-            )
-            self.frames_character_skill3.append(frame)
-
-            frame_flipped = pyg.transform.flip(frame, True, False)
-            self.frames_character_skill3_left.append(frame_flipped)
+        self.frames_character_skill1 = SpriteSheet.load(
+            self.sprite_character_skill1, size, size, WATER_SKILL1_FRAMES
+        )
+        self.frames_character_skill1_left = SpriteSheet.load(
+            self.sprite_character_skill1, size, size, WATER_SKILL1_FRAMES, flip=True
+        )
+        self.frames_character_skill2 = SpriteSheet.load(
+            self.sprite_character_skill2, size, size, WATER_SKILL2_FRAMES
+        )
+        self.frames_character_skill2_left = SpriteSheet.load(
+            self.sprite_character_skill2, size, size, WATER_SKILL2_FRAMES, flip=True
+        )
+        self.frames_character_skill3 = SpriteSheet.load(
+            self.sprite_character_skill3, size, size, WATER_SKILL3_FRAMES
+        )
+        self.frames_character_skill3_left = SpriteSheet.load(
+            self.sprite_character_skill3, size, size, WATER_SKILL3_FRAMES, flip=True
+        )
 
         # EXTRACT ATTACK ANIMATIONS OF THE PROJECTILE
-
+        # Same layout as CharacterType.frames, read by ProjectilePool.fire_skill
+        self.frames = {}
+        for n, path in enumerate(
+            (self.sprite_skill1, self.sprite_skill2, self.sprite_skill3), 1
+        ):
+            key = f'effect{n}'
+            _, width, height, count = EFFECT_SHEETS[self.char_number][key]
+            self.frames[key] = {
+                'right': SpriteSheet.load(path, width, height, count),
+                'left': SpriteSheet.load(path, width, height, count, flip=True),
+            }
 
         # ANIMATION STATE VARIABLES
         self.frame_MOVE = 0  # Current move animation frame index
@@ -324,7 +301,7 @@ class Water:
             self.death()
 
     def death(self):
-        return pyg.image.load(self.sprite_DEATH)
+        return self.frames_DEATH[0]
 
     def heal(self, amount):
         self.health += amount
@@ -435,6 +412,18 @@ class Water:
             else:
                 return self.frames_IDLE[self.frame_IDLE]
 
+    def get_effect_sprite(self):
+        """
+        Bash effect while skill 1 plays, or None (scene effect layer).
+        Spit and Shot are fired as projectiles instead (ProjectilePool).
+        """
+        if not self.is_attacking_skill1:
+            return None
+        frames = self.frames['effect1'][self.direction]
+        # The effect frames are spread over the skill animation
+        index = self.frame_character_skill1 * len(frames) // len(self.frames_character_skill1)
+        return frames[min(index, len(frames) - 1)]
+
     # SKILL SYSTEM
 
     def skill1(self, delta_time, is_attacking_skill1):
@@ -455,20 +444,94 @@ class Water:
     def update(self):
         pass
 
-class Character:
+# Animation keys, in the order used by the per-instance timers/indices lists
+ANIM_KEYS = (
+    'idle', 'move', 'hurt', 'dead',
+    'skill1', 'skill2', 'skill3',
+    'effect1', 'effect2', 'effect3',
+)
+ANIM_INDEX = {key: i for i, key in enumerate(ANIM_KEYS)}
+
+# Shared CharacterType per character number, see get_character_type
+_character_types = {}
+# Character number -> FileNotFoundError of a type that failed to load
+_missing_character_types = {}
+_character_types_lock = threading.Lock()
+
+
+class FlippedFrames:
     """
-    Generic character class for all 9 characters.
-    Each Character-N folder must contain IDLE-Sheet.png and MOVE-Sheet.png.
-    Optional sprites (loaded if present):
-      HURT-Sheet.png, DEAD-Sheet.png
-      S1-Sheet.png, S2-Sheet.png, S3-Sheet.png  (fallback: S3-1-Sheet.png)
-      effect-S1-Sheet.png, effect-S2-Sheet.png, effect-S3-Sheet.png
-    Frame counts are auto-detected from spritesheet width.
-    Hitbox is inset by HITBOX_INSET pixels on each side (28x28 inside a 40x40 sprite).
+    Left-facing frames built lazily from the right-facing ones.
+    A frame is flipped the first time it is requested, then kept.
+    """
+
+    __slots__ = ('source', '_flipped')
+
+    def __init__(self, source):
+        self.source = source
+        self._flipped = [None] * len(source)
+
+    def __len__(self):
+        return len(self.source)
+
+    def __getitem__(self, index):
+        frame = self._flipped[index]
+        if frame is None:
+            frame = pyg.transform.flip(self.source[index], True, False)
+            self._flipped[index] = frame
+        return frame
+
+    def flipped_count(self):
+        """Number of left-facing frames already built."""
+        return sum(1 for frame in self._flipped if frame is not None)
+
+    def to_display_format(self):
+        """
+        Queue the left frames with the right ones for the display format:
+        frames flipped before set_mode, from unconverted right frames, get
+        converted by convert_pending too. Later flips copy the format of
+        the converted right frames.
+        """
+        to_display_format(self._flipped)
+        return self
+
+
+class LazyFrames(dict):
+    """
+    frames mapping of a CharacterType that loads a sheet the first time its
+    key is looked up (``in``, ``get`` or ``[]``), so sheets that were not
+    streamed in by the SpriteLoader yet are still available on demand.
+    """
+
+    def __init__(self, char_type):
+        super().__init__()
+        self._char_type = char_type
+
+    def __contains__(self, key):
+        self._char_type.load(key)
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        self._char_type.load(key)
+        return dict.get(self, key, default)
+
+    def __getitem__(self, key):
+        self._char_type.load(key)
+        return dict.__getitem__(self, key)
+
+
+class CharacterType:
+    """
+    Immutable data of one character type (Character-N folder): the frame
+    atlas and animation timings. Use get_character_type to share a single
+    instance per character number between every Character; left-facing
+    frames are flipped lazily on first use (FlippedFrames), or come
+    pre-flipped from the asset pack when build/assets.pack exists.
+    Only the idle sheet is loaded up front; the other sheets are loaded by
+    load()/load_all(), from the SpriteLoader thread or on first lookup.
     """
 
     FRAME_SIZE = 40
-    HITBOX_INSET = 6
 
     # Milliseconds per frame for each animation state
     ANIM_SPEED = {
@@ -503,72 +566,186 @@ class Character:
         'skill3': 'S3-1-Sheet.png',
     }
 
-    def __init__(self, char_number, position=(400, 400), health=100, speed=2):
+    def __init__(self, char_number):
         self.char_number = char_number
         self.char_folder = f"Character-{char_number}"
-        self.health = health
-        self.max_health = health
-        self.speed = speed
-        self.position = list(position)
-        self.direction = "right"
-
-        self.is_moving = False
-        self.is_hurt = False
-        self.is_dead = False
-        self.is_attacking = {1: False, 2: False, 3: False}
 
         # frames[key] = {'right': [Surface, ...], 'left': [Surface, ...]}
-        self.frames = {}
-        self.timers  = {k: 0 for k in self.ANIM_SPEED}
-        self.indices = {k: 0 for k in self.ANIM_SPEED}
+        self.frames = LazyFrames(self)
+        self._attempted = set()  # keys whose sheet loading was already tried
+        self._lock = threading.Lock()
+
+        self.load('idle')
+        if not dict.__contains__(self.frames, 'idle'):
+            raise FileNotFoundError(
+                f"Required IDLE-Sheet.png not found for {self.char_folder}"
+            )
 
-        self._load_sprites()
+        # Milliseconds per frame indexed like ANIM_KEYS
+        self.anim_speed = tuple(self.ANIM_SPEED[key] for key in ANIM_KEYS)
 
     # ------------------------------------------------------------------
     # SPRITE LOADING
     # ------------------------------------------------------------------
 
-    def _load_sheet(self, key, filename):
+    def _load_sheet(self, key, filename, width=None, height=None, count=None):
+        path = get_asset_path("sprites", self.char_folder, filename)
+        width = width or self.FRAME_SIZE
+        height = height or self.FRAME_SIZE
         try:
-            path = get_asset_path("sprites", self.char_folder, filename)
-            sheet = pyg.image.load(path)
-            frame_count = sheet.get_width() // self.FRAME_SIZE
-            right_frames, left_frames = [], []
-            for i in range(frame_count):
-                frame = sheet.subsurface(
-                    (i * self.FRAME_SIZE, 0, self.FRAME_SIZE, self.FRAME_SIZE)
-                )
-                right_frames.append(frame)
-                left_frames.append(pyg.transform.flip(frame, True, False))
-            self.frames[key] = {'right': right_frames, 'left': left_frames}
-            return True
+            right_frames = SpriteSheet.load(path, width, height, count)
+            if SpriteSheet.is_packed(path, width, height):
+                # Pre-flipped frames, mapped from build/assets.pack
+                left_frames = SpriteSheet.load(path, width, height, count, flip=True)
+            else:
+                left_frames = FlippedFrames(right_frames).to_display_format()
         except Exception:
             return False
-
-    def _load_sprites(self):
-        for key, filename in self.SPRITE_FILES.items():
-            if not self._load_sheet(key, filename):
+        self.frames[key] = {
+            'right': right_frames,
+            'left': left_frames,
+        }
+        return True
+
+    def load(self, key):
+        """Load the sheet of *key* if not tried yet (thread safe)."""
+        if key in self._attempted:
+            return
+        with self._lock:
+            if key in self._attempted:
+                return
+            filename = self.SPRITE_FILES.get(key)
+            if filename and not self._load_sheet(key, filename):
                 fallback = self.SPRITE_FILES_FALLBACK.get(key)
+                effect = EFFECT_SHEETS.get(self.char_number, {}).get(key)
                 if fallback:
                     self._load_sheet(key, fallback)
+                elif effect:
+                    self._load_sheet(key, *effect)
+            if key == 'move' and not dict.__contains__(self.frames, 'move'):
+                self.frames['move'] = dict.get(self.frames, 'idle')
+            self._attempted.add(key)
 
-        if 'idle' not in self.frames:
-            raise FileNotFoundError(
-                f"Required IDLE-Sheet.png not found for {self.char_folder}"
-            )
-        if 'move' not in self.frames:
-            self.frames['move'] = self.frames['idle']
+    def load_all(self):
+        """Load every remaining sheet (skills, effects, hurt, dead...)."""
+        for key in self.SPRITE_FILES:
+            self.load(key)
+
+    def is_resident(self):
+        """True once every sheet has been loaded (or found missing)."""
+        return all(key in self._attempted for key in self.SPRITE_FILES)
+
+
+def get_character_type(char_number):
+    """
+    Shared CharacterType for *char_number*, loaded on first request.
+    Raises FileNotFoundError if the character has no IDLE-Sheet.png; the
+    failure is remembered, later requests raise without touching the disk.
+    """
+    char_type = _character_types.get(char_number)
+    if char_type is None:
+        with _character_types_lock:
+            char_type = _character_types.get(char_number)
+            if char_type is None:
+                error = _missing_character_types.get(char_number)
+                if error is not None:
+                    raise FileNotFoundError(*error.args)
+                try:
+                    char_type = CharacterType(char_number)
+                except FileNotFoundError as e:
+                    _missing_character_types[char_number] = e
+                    raise
+                _character_types[char_number] = char_type
+    return char_type
+
+
+def clear_character_types():
+    """Forget every shared CharacterType (they are reloaded on demand)."""
+    _character_types.clear()
+    _missing_character_types.clear()
+
+
+class Character:
+    """
+    Generic character class for all 9 characters.
+    Each Character-N folder must contain IDLE-Sheet.png and MOVE-Sheet.png.
+    Optional sprites (loaded if present):
+      HURT-Sheet.png, DEAD-Sheet.png
+      S1-Sheet.png, S2-Sheet.png, S3-Sheet.png  (fallback: S3-1-Sheet.png)
+      effect-S1-Sheet.png, effect-S2-Sheet.png, effect-S3-Sheet.png
+        (or the sheets listed in EFFECT_SHEETS, with their own frame size)
+    Frame counts are auto-detected from spritesheet width.
+    Hitbox is inset by HITBOX_INSET pixels on each side (28x28 inside a 40x40 sprite).
+
+    Frames and timings live in the CharacterType shared by every instance
+    of the same character (get_character_type, or pass ``char_type``); an
+    instance only stores its slotted mutable state, with animation
+    timers/indices as lists indexed by ANIM_INDEX.
+    """
+
+    __slots__ = (
+        'char_type', 'health', 'max_health', 'speed', 'position',
+        'direction', 'grid', 'is_moving', 'is_hurt', 'is_dead',
+        'is_attacking', 'timers', 'indices',
+    )
+
+    FRAME_SIZE = CharacterType.FRAME_SIZE
+    HITBOX_INSET = 6
+    ANIM_SPEED = CharacterType.ANIM_SPEED
+    SPRITE_FILES = CharacterType.SPRITE_FILES
+    SPRITE_FILES_FALLBACK = CharacterType.SPRITE_FILES_FALLBACK
+
+    def __init__(self, char_number, position=(400, 400), health=100, speed=2,
+                 char_type=None):
+        if char_type is None:
+            char_type = get_character_type(char_number)
+        self.char_type = char_type
+        self.health = health
+        self.max_health = health
+        self.speed = speed
+        self.position = list(position)
+        self.direction = "right"
+        self.grid = None  # SpatialHash the character belongs to
+
+        self.is_moving = False
+        self.is_hurt = False
+        self.is_dead = False
+        self.is_attacking = [False, False, False]  # skills 1..3
+
+        self.timers  = [0] * len(ANIM_KEYS)
+        self.indices = [0] * len(ANIM_KEYS)
+
+    @property
+    def char_number(self):
+        return self.char_type.char_number
+
+    @property
+    def char_folder(self):
+        return self.char_type.char_folder
+
+    @property
+    def frames(self):
+        return self.char_type.frames
 
     # ------------------------------------------------------------------
     # HITBOX
     # ------------------------------------------------------------------
 
-    def get_hitbox(self):
-        """Returns a pygame.Rect slightly smaller than the sprite."""
+    def get_hitbox(self, rect=None):
+        """
+        Returns a pygame.Rect slightly smaller than the sprite.
+
+        Pass *rect* to update an existing Rect in place instead of
+        allocating one: CollisionWorld.step does, on the persistent
+        hitbox it keeps per entity.
+        """
         x, y = int(self.position[0]), int(self.position[1])
         inset = self.HITBOX_INSET
         size = self.FRAME_SIZE - 2 * inset
-        return pyg.Rect(x + inset, y + inset, size, size)
+        if rect is None:
+            return pyg.Rect(x + inset, y + inset, size, size)
+        rect.update(x + inset, y + inset, size, size)
+        return rect
 
     # ------------------------------------------------------------------
     # MOVEMENT & STATS
@@ -585,6 +762,8 @@ class Character:
         elif direction == "right":
             self.position[0] += self.speed
             self.direction = "right"
+        if self.grid is not None:
+            self.grid.update(self)
 
     def take_damage(self, amount):
         if self.is_dead:
@@ -593,12 +772,10 @@ class Character:
         if self.health <= 0:
             self.health = 0
             self.is_dead = True
-            self.indices['dead'] = 0
-            self.timers['dead'] = 0
+            self._restart('dead')
         else:
             self.is_hurt = True
-            self.indices['hurt'] = 0
-            self.timers['hurt'] = 0
+            self._restart('hurt')
 
     def heal(self, amount):
         if not self.is_dead:
@@ -611,6 +788,11 @@ class Character:
     # ANIMATION HELPERS
     # ------------------------------------------------------------------
 
+    def _restart(self, key):
+        i = ANIM_INDEX[key]
+        self.indices[i] = 0
+        self.timers[i] = 0
+
     def _advance(self, key, delta_time, loop=True):
         """
         Advance animation timer and index.
@@ -619,19 +801,20 @@ class Character:
         frames = self.frames.get(key, {}).get('right', [])
         if not frames:
             return True
+        i = ANIM_INDEX[key]
         # Stay frozen on last frame for non-looping animations that finished
-        if not loop and self.indices.get(key, 0) >= len(frames) - 1:
+        if not loop and self.indices[i] >= len(frames) - 1:
             return True
-        self.timers[key] += delta_time
-        if self.timers[key] < self.ANIM_SPEED[key]:
+        self.timers[i] += delta_time
+        if self.timers[i] < self.char_type.anim_speed[i]:
             return False
-        self.timers[key] = 0
-        self.indices[key] += 1
-        if self.indices[key] >= len(frames):
+        self.timers[i] = 0
+        self.indices[i] += 1
+        if self.indices[i] >= len(frames):
             if loop:
-                self.indices[key] = 0
+                self.indices[i] = 0
             else:
-                self.indices[key] = len(frames) - 1
+                self.indices[i] = len(frames) - 1
                 return True
         return False
 
@@ -640,7 +823,7 @@ class Character:
         frames = self.frames.get(key, {}).get(self.direction, [])
         if not frames:
             return None
-        return frames[min(self.indices.get(key, 0), len(frames) - 1)]
+        return frames[min(self.indices[ANIM_INDEX[key]], len(frames) - 1)]
 
     # ------------------------------------------------------------------
     # ANIMATION UPDATE  (same signature as Water.update_animation)
@@ -668,15 +851,15 @@ class Character:
         for n, pressed in enumerate(skill_inputs, 1):
             key     = f'skill{n}'
             eff_key = f'effect{n}'
-            self.is_attacking[n] = pressed and key in self.frames
+            self.is_attacking[n - 1] = pressed and key in self.frames
 
-            if self.is_attacking[n]:
+            if self.is_attacking[n - 1]:
                 done = self._advance(key, delta_time, loop=False)
                 if done:
-                    self.indices[key] = 0
+                    self.indices[ANIM_INDEX[key]] = 0
                     if eff_key in self.frames:
-                        self.indices[eff_key] = 0
-                    self.is_attacking[n] = False
+                        self.indices[ANIM_INDEX[eff_key]] = 0
+                    self.is_attacking[n - 1] = False
                 elif eff_key in self.frames:
                     self._advance(eff_key, delta_time, loop=True)
 
@@ -704,7 +887,7 @@ class Character:
             return self._get_frame('dead') or self._get_frame('idle')
 
         for n in (1, 2, 3):
-            if self.is_attacking[n]:
+            if self.is_attacking[n - 1]:
                 frame = self._get_frame(f'skill{n}')
                 if frame:
                     return frame
@@ -721,7 +904,7 @@ class Character:
     def get_effect_sprite(self):
         """Returns the effect/projectile sprite for the active skill, or None."""
         for n in (1, 2, 3):
-            if self.is_attacking[n]:
+            if self.is_attacking[n - 1]:
                 frame = self._get_frame(f'effect{n}')
                 if frame:
                     return frame
@@ -732,29 +915,29 @@ class Character:
     # ------------------------------------------------------------------
 
     def skill1(self):
-        if not self.is_attacking[1] and 'skill1' in self.frames:
-            self.is_attacking[1] = True
-            self.indices['skill1'] = 0
-            self.timers['skill1'] = 0
+        if not self.is_attacking[0] and 'skill1' in self.frames:
+            self.is_attacking[0] = True
+            self._restart('skill1')
 
     def skill2(self):
-        if not self.is_attacking[2] and 'skill2' in self.frames:
-            self.is_attacking[2] = True
-            self.indices['skill2'] = 0
-            self.timers['skill2'] = 0
+        if not self.is_attacking[1] and 'skill2' in self.frames:
+            self.is_attacking[1] = True
+            self._restart('skill2')
 
     def skill3(self):
-        if not self.is_attacking[3] and 'skill3' in self.frames:
-            self.is_attacking[3] = True
-            self.indices['skill3'] = 0
-            self.timers['skill3'] = 0
+        if not self.is_attacking[2] and 'skill3' in self.frames:
+            self.is_attacking[2] = True
+            self._restart('skill3')
 
     def update(self):
         pass
 
 
 def load_all_characters():
-    """Load every Character-N folder that contains at least IDLE-Sheet.png."""
+    """
+    Load every Character-N folder that contains at least IDLE-Sheet.png.
+    Only the idle sheets are loaded here, see SpriteLoader for the rest.
+    """
     characters = {}
     for i in range(1, 10):
         try:
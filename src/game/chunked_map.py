@@ -0,0 +1,249 @@
+import json
+import os
+from collections import OrderedDict
+
+import pygame as pyg
+
+from utils.display_format import display_ready
+
+CHUNK_SIZE = 512          # chunk width and height in pixels
+CHUNK_CACHE_SIZE = 48     # chunks kept in memory per layer (LRU)
+CHUNKED_MAP_DESCRIPTOR = "map.json"
+
+
+def _chunk_file(cx, cy):
+    return f"{cx}_{cy}.png"
+
+
+class ChunkedMap:
+    """
+    Map layer split into fixed-size square chunks.
+
+    Chunks are produced on demand by ``load_chunk`` (cut from a surface,
+    read from a chunk directory, rendered from a tile map...) and kept in
+    an LRU cache: drawing only touches the chunks intersecting the camera,
+    and the least recently drawn ones are evicted once the cache is full,
+    so memory stays bounded whatever the map size. ``load_chunk`` may
+    return None for an empty chunk (nothing drawn).
+
+    Attributes:
+        size (tuple): (width, height) of the map in pixels
+        chunk_size (int): Chunk width and height in pixels
+        capacity (int): Chunks kept in the cache
+        loads (int): Chunks loaded since creation
+        evictions (int): Chunks evicted since creation
+    """
+
+    def __init__(self, size, load_chunk, chunk_size=CHUNK_SIZE, capacity=CHUNK_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            size (tuple): (width, height) of the map in pixels
+            load_chunk (callable): (cx, cy) -> Surface or None
+            chunk_size (int): Chunk width and height in pixels
+            capacity (int): Chunks kept in the cache
+        """
+        self.size = tuple(size)
+        self.chunk_size = chunk_size
+        self.capacity = capacity
+        self.load_chunk = load_chunk
+        self.columns = -(-self.size[0] // chunk_size)
+        self.rows = -(-self.size[1] // chunk_size)
+        self._chunks = OrderedDict()  # (cx, cy) -> Surface or None
+        self.loads = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_surface(cls, surface, chunk_size=CHUNK_SIZE):
+        """
+        Chunk an already loaded surface (subsurfaces, no copy).
+
+        Args:
+            surface (pygame.Surface): Whole layer
+            chunk_size (int): Chunk width and height in pixels
+
+        Returns:
+            ChunkedMap: Layer whose cache can hold every chunk
+        """
+        bounds = surface.get_rect()
+
+        def load_chunk(cx, cy):
+            area = pyg.Rect(cx * chunk_size, cy * chunk_size, chunk_size, chunk_size)
+            return surface.subsurface(area.clip(bounds))
+
+        chunked = cls(surface.get_size(), load_chunk, chunk_size)
+        chunked.capacity = chunked.columns * chunked.rows
+        return chunked
+
+    def chunk(self, cx, cy):
+        """
+        Chunk (cx, cy), from the cache or loaded.
+
+        Returns:
+            pygame.Surface: The chunk, or None if it is empty
+        """
+        key = (cx, cy)
+        chunks = self._chunks
+        if key in chunks:
+            chunks.move_to_end(key)
+            return chunks[key]
+        surface = chunks[key] = self.load_chunk(cx, cy)
+        self.loads += 1
+        return surface
+
+    def chunk_range(self, rect):
+        """Chunk column and row ranges intersecting *rect* (world coordinates)."""
+        size = self.chunk_size
+        return (
+            range(max(rect.left // size, 0), min((rect.right - 1) // size + 1, self.columns)),
+            range(max(rect.top // size, 0), min((rect.bottom - 1) // size + 1, self.rows)),
+        )
+
+    def draw(self, surface, camera):
+        """
+        Draw the chunks visible by the camera.
+
+        Args:
+            surface: Target surface or RenderLayer
+            camera (Camera): Viewport, in world coordinates
+        """
+        view = camera.rect
+        size = self.chunk_size
+        columns, rows = self.chunk_range(view)
+        batch = []
+        for cy in rows:
+            for cx in columns:
+                chunk = self.chunk(cx, cy)
+                if chunk is not None:
+                    batch.append((chunk, (cx * size - view.x, cy * size - view.y)))
+        surface.blits(batch, doreturn=False)
+        self._evict(len(columns) * len(rows))
+
+    def prefetch(self, camera, budget=1, margin=1):
+        """
+        Load a few chunks around the view before the camera reaches them.
+
+        Spreads the loads of a ring of *margin* chunks over several frames
+        instead of paying them all in the frame the ring comes into view.
+
+        Args:
+            camera (Camera): Viewport, in world coordinates
+            budget (int): Maximum chunks loaded by this call
+            margin (int): Width of the ring, in chunks
+
+        Returns:
+            int: Chunks loaded
+        """
+        size = self.chunk_size
+        columns, rows = self.chunk_range(camera.rect.inflate(2 * margin * size, 2 * margin * size))
+        loaded = 0
+        for cy in rows:
+            for cx in columns:
+                if loaded >= budget:
+                    return loaded
+                if (cx, cy) not in self._chunks:
+                    self._chunks[(cx, cy)] = self.load_chunk(cx, cy)
+                    self.loads += 1
+                    loaded += 1
+        return loaded
+
+    def _evict(self, in_view):
+        # The chunks of the current view were just moved to the end: never
+        # evict them, even when the capacity is smaller than the view
+        chunks = self._chunks
+        while len(chunks) > max(self.capacity, in_view):
+            chunks.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def resident(self):
+        """Number of chunks currently in memory."""
+        return len(self._chunks)
+
+    def clear(self):
+        """Drop every cached chunk."""
+        self._chunks.clear()
+
+
+# ============================================================================
+# CHUNK DIRECTORY FORMAT
+# ============================================================================
+#
+#   <map>/map.json              {"size": [w, h], "chunk_size": 512,
+#                                "layers": {"back": {"alpha": false}, ...}}
+#   <map>/<layer>/<cx>_<cy>.png one file per non-empty chunk
+
+
+def save_chunked_map(path, layers, chunk_size=CHUNK_SIZE):
+    """
+    Split full-size layers into a chunk directory.
+
+    Fully transparent chunks of alpha layers are not written.
+
+    Args:
+        path (str): Output directory
+        layers (dict): Layer name -> (surface, alpha)
+        chunk_size (int): Chunk width and height in pixels
+
+    Returns:
+        int: Number of chunk files written
+    """
+    size = None
+    written = 0
+    for name, (surface, alpha) in layers.items():
+        if size is None:
+            size = surface.get_size()
+        chunked = ChunkedMap.from_surface(surface, chunk_size)
+        os.makedirs(os.path.join(path, name), exist_ok=True)
+        for cy in range(chunked.rows):
+            for cx in range(chunked.columns):
+                chunk = chunked.load_chunk(cx, cy)
+                if alpha and chunk.get_bounding_rect().width == 0:
+                    continue
+                pyg.image.save(chunk, os.path.join(path, name, _chunk_file(cx, cy)))
+                written += 1
+    descriptor = {
+        "size": list(size),
+        "chunk_size": chunk_size,
+        "layers": {name: {"alpha": alpha} for name, (_, alpha) in layers.items()},
+    }
+    with open(os.path.join(path, CHUNKED_MAP_DESCRIPTOR), "w", encoding="utf-8") as f:
+        json.dump(descriptor, f, indent=2)
+    return written
+
+
+def load_chunked_map(path, capacity=CHUNK_CACHE_SIZE):
+    """
+    Open a chunk directory; chunk files are only read when drawn.
+
+    Args:
+        path (str): Directory written by save_chunked_map
+        capacity (int): Chunks kept in memory per layer
+
+    Returns:
+        dict: Layer name -> ChunkedMap
+    """
+    with open(os.path.join(path, CHUNKED_MAP_DESCRIPTOR), encoding="utf-8") as f:
+        descriptor = json.load(f)
+
+    def loader(name, alpha):
+        def load_chunk(cx, cy):
+            chunk_path = os.path.join(path, name, _chunk_file(cx, cy))
+            if not os.path.exists(chunk_path):
+                return None
+            chunk = pyg.image.load(chunk_path)
+            if display_ready():
+                chunk = chunk.convert_alpha() if alpha else chunk.convert()
+            return chunk
+        return load_chunk
+
+    return {
+        name: ChunkedMap(
+            descriptor["size"],
+            loader(name, layer.get("alpha", True)),
+            descriptor["chunk_size"],
+            capacity,
+        )
+        for name, layer in descriptor["layers"].items()
+    }
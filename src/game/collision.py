@@ -0,0 +1,194 @@
+import pygame as pyg
+
+COLLISION_CELL_SIZE = 64   # broad-phase cell, about twice the largest hitbox
+DEFAULT_HITBOX_SIZE = 40   # sprite size of the entities without FRAME_SIZE
+
+
+def hitbox_box(entity):
+    """
+    Hitbox of an entity without ``get_hitbox``, relative to its position.
+
+    Uses the FRAME_SIZE / HITBOX_INSET class attributes when present,
+    otherwise the whole DEFAULT_HITBOX_SIZE sprite.
+
+    Returns:
+        tuple: (dx, dy, width, height)
+    """
+    size = getattr(entity, "FRAME_SIZE", DEFAULT_HITBOX_SIZE)
+    inset = getattr(entity, "HITBOX_INSET", 0)
+    return (inset, inset, size - 2 * inset, size - 2 * inset)
+
+
+class CollisionWorld:
+    """
+    Broad-phase + narrow-phase collision detection between entity kinds.
+
+    Every entity gets one persistent Rect (no allocation per frame), updated
+    by ``step``: in place by the entity's ``get_hitbox(rect)`` when it has
+    one (Character), so the hitbox formula lives with the entity, else
+    moved to its ``position``. Collisions are only looked for between
+    the kinds of a rule (``add_rule``): for each rule the entities of the
+    second kind are bucketed in a uniform grid (broad phase), then each
+    entity of the first kind tests the buckets of the cells it covers with
+    one ``Rect.collidedictall`` call per cell (narrow phase, in C).
+
+    Attributes:
+        cell_size (int): Broad-phase cell size in pixels
+        pairs (dict): (kind_a, kind_b) -> list of (entity_a, entity_b)
+            colliding during the last step
+        pair_counts (dict): (kind_a, kind_b) -> number of pairs of the last step
+        candidates (int): Rect tests done by the narrow phase in the last step
+    """
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        """
+        Initialize an empty world.
+
+        Args:
+            cell_size (int): Broad-phase cell size in pixels
+        """
+        self.cell_size = cell_size
+        self._boxes = {}    # entity -> (kind, rect, dx, dy, get_hitbox or None)
+        self._by_kind = {}  # kind -> {entity: rect}
+        self._rules = []
+        self.pairs = {}
+        self.pair_counts = {}
+        self.candidates = 0
+
+    # ========================================================================
+    # ENTITIES AND RULES
+    # ========================================================================
+
+    def add(self, entity, kind, box=None):
+        """
+        Register an entity.
+
+        Args:
+            entity: Object with a ``position`` (x, y)
+            kind (str): Entity kind (KIND_CHARACTER, KIND_ENEMY, ...)
+            box (tuple): (dx, dy, width, height) hitbox relative to the
+                position; by default the entity's ``get_hitbox(rect)``, or
+                hitbox_box(entity) for entities without one
+
+        Returns:
+            pygame.Rect: The entity's persistent hitbox
+        """
+        if entity in self._boxes:
+            self.remove(entity)
+        get_hitbox = getattr(entity, "get_hitbox", None) if box is None else None
+        if get_hitbox is not None:
+            rect = get_hitbox()
+            dx = dy = 0
+        else:
+            dx, dy, width, height = box if box is not None else hitbox_box(entity)
+            x, y = entity.position
+            rect = pyg.Rect(int(x) + dx, int(y) + dy, width, height)
+        self._boxes[entity] = (kind, rect, dx, dy, get_hitbox)
+        self._by_kind.setdefault(kind, {})[entity] = rect
+        return rect
+
+    def remove(self, entity):
+        """Unregister an entity (dead enemy, expired projectile...)."""
+        entry = self._boxes.pop(entity, None)
+        if entry is not None:
+            del self._by_kind[entry[0]][entity]
+
+    def rect(self, entity):
+        """Persistent hitbox of a registered entity (as of the last step)."""
+        return self._boxes[entity][1]
+
+    def rects(self, kind):
+        """Persistent hitboxes of the entities of a kind (entity -> Rect)."""
+        return self._by_kind.get(kind, {})
+
+    def add_rule(self, kind_a, kind_b):
+        """
+        Detect collisions between two kinds (possibly the same one).
+
+        Put the most numerous kind first: the second one is the one
+        bucketed in the grid.
+        """
+        rule = (kind_a, kind_b)
+        if rule not in self._rules:
+            self._rules.append(rule)
+            self.pairs[rule] = []
+            self.pair_counts[rule] = 0
+
+    # ========================================================================
+    # FRAME STEP
+    # ========================================================================
+
+    def step(self):
+        """
+        Move the hitboxes to the entities and find the colliding pairs.
+
+        Returns:
+            int: Total number of colliding pairs
+        """
+        for entity, (_, rect, dx, dy, get_hitbox) in self._boxes.items():
+            if get_hitbox is not None:
+                get_hitbox(rect)
+                continue
+            x, y = entity.position
+            rect.x = int(x) + dx
+            rect.y = int(y) + dy
+        self.candidates = 0
+        total = 0
+        for rule in self._rules:
+            pairs = self.pairs[rule]
+            pairs.clear()
+            self._collide(rule[0], rule[1], pairs)
+            self.pair_counts[rule] = len(pairs)
+            total += len(pairs)
+        return total
+
+    def _collide(self, kind_a, kind_b, pairs):
+        sources = self._by_kind.get(kind_a)
+        targets = self._by_kind.get(kind_b)
+        if not sources or not targets:
+            return
+        size = self.cell_size
+
+        # Broad phase: bucket the targets by cell
+        grid = {}
+        for entity, rect in targets.items():
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    bucket = grid.get((cx, cy))
+                    if bucket is None:
+                        grid[(cx, cy)] = {entity: rect}
+                    else:
+                        bucket[entity] = rect
+
+        # Narrow phase: one collidedictall per covered cell
+        same_kind = kind_a == kind_b
+        candidates = 0
+        for entity, rect in sources.items():
+            cx0, cx1 = rect.left // size, (rect.right - 1) // size
+            cy0, cy1 = rect.top // size, (rect.bottom - 1) // size
+            if cx0 == cx1 and cy0 == cy1:
+                bucket = grid.get((cx0, cy0))
+                if bucket is None:
+                    continue
+                candidates += len(bucket)
+                hits = [other for other, _ in rect.collidedictall(bucket, True)]
+            else:
+                hits = {}  # a target spanning several cells is found once
+                for cx in range(cx0, cx1 + 1):
+                    for cy in range(cy0, cy1 + 1):
+                        bucket = grid.get((cx, cy))
+                        if bucket is not None:
+                            candidates += len(bucket)
+                            for other, _ in rect.collidedictall(bucket, True):
+                                hits[other] = None
+            for other in hits:
+                if same_kind and (other is entity or id(other) < id(entity)):
+                    continue  # self, or pair already reported from the other side
+                pairs.append((entity, other))
+        self.candidates += candidates
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def __contains__(self, entity):
+        return entity in self._boxes
@@ -1,6 +1,8 @@
 import pygame as pyg
 from utils.paths import get_asset_path
 
+from game.spatial import KIND_CHARACTER, KIND_ENEMY
+
 
 ENEMY_BASE_HEALTH = 50
 ENEMY_BASE_SPEED = 3
@@ -19,7 +21,15 @@ class Enemy:
         position (tuple): Current (x, y) position on screen
         damage (int): Damage dealt on attack
         direction (str): Current facing direction
+        grid (SpatialHash): Spatial index the enemy belongs to, or None
+        pathfinder (PathFinder): Flow fields used to chase around
+            obstacles, or None to walk straight at the target
     """
+
+    __slots__ = (
+        "health", "speed", "position", "damage",
+        "direction", "state", "target", "grid", "pathfinder",
+    )
     
     def __init__(self, x=0, y=0, health=ENEMY_BASE_HEALTH, speed=ENEMY_BASE_SPEED):
         """
@@ -39,6 +49,8 @@ class Enemy:
         self.direction = "right"
         self.state = "IDLE"
         self.target = None
+        self.grid = None
+        self.pathfinder = None
     
     def move(self, direction):
         """
@@ -57,6 +69,8 @@ class Enemy:
         elif direction == "right":
             self.position = (self.position[0] + self.speed, self.position[1])
             self.direction = "right"
+        if self.grid is not None:
+            self.grid.update(self)
     
     def take_damage(self, amount):
         """
@@ -76,8 +90,8 @@ class Enemy:
         Args:
             target (Character): Target player to attack
         """
-        distance = self._calculate_distance(target.position)
-        if distance <= ENEMY_ATTACK_RANGE:
+        distance_sq = self._calculate_distance_squared(target.position)
+        if distance_sq <= ENEMY_ATTACK_RANGE * ENEMY_ATTACK_RANGE:
             target.take_damage(self.damage)
     
     def _calculate_distance(self, target_pos):
@@ -93,14 +107,41 @@ class Enemy:
         dx = target_pos[0] - self.position[0]
         dy = target_pos[1] - self.position[1]
         return (dx**2 + dy**2)**0.5
+
+    def _calculate_distance_squared(self, target_pos):
+        """
+        Calculate squared distance to target position (no square root).
+        
+        Args:
+            target_pos (tuple): Target (x, y) position
+            
+        Returns:
+            float: Squared distance to target
+        """
+        dx = target_pos[0] - self.position[0]
+        dy = target_pos[1] - self.position[1]
+        return dx * dx + dy * dy
     
     def chase_target(self, target):
         """
         Move towards target player.
+
+        With a pathfinder, follows the flow field of the target around
+        obstacles; walks straight at it otherwise, or once in its cell.
         
         Args:
             target (Character): Target player to chase
         """
+        if self.pathfinder is not None:
+            step = self.pathfinder.flow_step(self.position, target.position)
+            if step is not None:
+                dx, dy = step
+                if dx:
+                    self.move("right" if dx > 0 else "left")
+                if dy:
+                    self.move("down" if dy > 0 else "up")
+                return
+
         target_x, target_y = target.position
         current_x, current_y = self.position
         
@@ -124,8 +165,19 @@ class Enemy:
         Returns:
             bool: True if player is visible
         """
-        distance = self._calculate_distance(player.position)
-        return distance <= ENEMY_VISION_RANGE
+        distance_sq = self._calculate_distance_squared(player.position)
+        return distance_sq <= ENEMY_VISION_RANGE * ENEMY_VISION_RANGE
+
+    def find_target(self):
+        """
+        Find the closest character in vision range through the spatial grid.
+        
+        Returns:
+            Character: Closest visible character, or None
+        """
+        if self.grid is None:
+            return None
+        return self.grid.nearest(self.position, ENEMY_VISION_RANGE, KIND_CHARACTER)
     
     def death(self):
         """Handle enemy death."""
@@ -150,11 +202,24 @@ class Enemy:
         Implements basic AI behavior.
         
         Args:
-            player (Character): Player reference for AI decisions
+            player (Character): Player reference for AI decisions. When None
+                and the enemy belongs to a grid, the closest character in
+                vision range is used.
         """
         if self.state == "DEATH":
             return
+
+        if player is None:
+            player = self.find_target()
+        self._act(player)
+
+    def _act(self, player):
+        """
+        Run the chase/attack behaviour against *player*.
         
+        Args:
+            player (Character): Player reference for AI decisions
+        """
         # Basic AI: if player detected, chase and attack
         if player:
             if self.detect_player(player):
@@ -163,3 +228,35 @@ class Enemy:
                 self.attack(player)
             else:
                 self.state = "IDLE"
+
+
+def update_enemies(enemies, grid):
+    """
+    Update every enemy of a grid in one pass.
+
+    Instead of one vision query per enemy, each character queries the
+    enemies in its vision range, so enemies far from every character cost a
+    single state assignment. Each enemy then acts on its closest character.
+
+    Args:
+        enemies (list): Enemy objects to update
+        grid (SpatialHash): Grid holding the characters and the enemies
+    """
+    targets = {}  # enemy -> (distance squared, character)
+    for character in grid.entities(KIND_CHARACTER):
+        cx, cy = character.position
+        for enemy in grid.query_radius(character.position, ENEMY_VISION_RANGE, KIND_ENEMY):
+            ex, ey = enemy.position
+            dist_sq = (cx - ex) * (cx - ex) + (cy - ey) * (cy - ey)
+            best = targets.get(enemy)
+            if best is None or dist_sq < best[0]:
+                targets[enemy] = (dist_sq, character)
+
+    for enemy in enemies:
+        if enemy.state == "DEATH":
+            continue
+        target = targets.get(enemy)
+        if target is None:
+            enemy.state = "IDLE"
+        else:
+            enemy._act(target[1])
@@ -0,0 +1,325 @@
+import json
+import struct
+import threading
+import zlib
+
+from game.items import (
+    ITEM_RARITY_COMMON,
+    ITEM_RARITY_EPIC,
+    ITEM_RARITY_LEGENDARY,
+    ITEM_RARITY_RARE,
+    RARITY_COLORS,
+    MAX_STACK,
+    Consumable,
+    Equipment,
+    Inventory,
+    Item,
+)
+from utils.paths import get_asset_path
+
+ITEM_CATALOG_PATH = ("items", "items.json")  # under assets/
+
+RARITY_NAMES = {
+    "common": ITEM_RARITY_COMMON,
+    "rare": ITEM_RARITY_RARE,
+    "epic": ITEM_RARITY_EPIC,
+    "legendary": ITEM_RARITY_LEGENDARY,
+}
+ITEM_KINDS = {"item": Item, "consumable": Consumable, "equipment": Equipment}
+
+INVENTORY_MAGIC = b"INV1"
+# magic, catalog checksum, max size, number of slot entries
+INVENTORY_HEADER = struct.Struct("<4sIII")
+# slot, definition id, stack count (MAX_STACK fits in a byte)
+INVENTORY_ENTRY = struct.Struct("<IHB")
+# Largest inventory the binary format accepts, so a bad header cannot
+# make unpack_inventory allocate millions of slots
+MAX_INVENTORY_SLOTS = 4096
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+class ItemDefinition:
+    """
+    Shared, read-only data of one kind of item, loaded from the catalog.
+
+    Attributes:
+        id (int): Index in the catalog, used by the binary formats
+        key (str): Stable name in the data file (e.g. 'small_potion')
+        item_class (type): Item, Consumable or Equipment, what instances
+            of this definition count as in Inventory queries
+        name, description, value, rarity: As on Item
+        effect, amount: As on Consumable (None / 0 otherwise)
+        slot, armor, damage_bonus: As on Equipment (None / 0 otherwise)
+    """
+
+    __slots__ = (
+        "id", "key", "item_class", "name", "description", "value", "rarity",
+        "effect", "amount", "slot", "armor", "damage_bonus",
+    )
+
+    def __init__(self, id, key, item_class, name, description="", value=0,
+                 rarity=ITEM_RARITY_COMMON, effect=None, amount=0, slot=None, armor=0,
+                 damage_bonus=0):
+        self.id = id
+        self.key = key
+        self.item_class = item_class
+        self.name = name
+        self.description = description
+        self.value = value
+        self.rarity = rarity
+        self.effect = effect
+        self.amount = amount
+        self.slot = slot
+        self.armor = armor
+        self.damage_bonus = damage_bonus
+
+    @property
+    def stackable(self):
+        return self.item_class is Consumable
+
+
+class CatalogItem:
+    """
+    Flyweight item instance: a definition plus the per-instance state.
+
+    Exposes the Item / Consumable / Equipment API by reading the shared
+    ItemDefinition, so a dropped item only stores three references.
+
+    Attributes:
+        definition (ItemDefinition): Shared item data
+        position (tuple): Current (x, y) position on map
+        picked_up (bool): Picked up or used
+    """
+
+    __slots__ = ("definition", "position", "picked_up")
+
+    def __init__(self, definition, x=0, y=0):
+        self.definition = definition
+        self.position = (x, y)
+        self.picked_up = False
+
+    name = property(lambda self: self.definition.name)
+    description = property(lambda self: self.definition.description)
+    value = property(lambda self: self.definition.value)
+    rarity = property(lambda self: self.definition.rarity)
+    effect = property(lambda self: self.definition.effect)
+    amount = property(lambda self: self.definition.amount)
+    slot = property(lambda self: self.definition.slot)
+    armor = property(lambda self: self.definition.armor)
+    damage_bonus = property(lambda self: self.definition.damage_bonus)
+
+    def get_info(self):
+        """
+        Get item information dictionary.
+
+        Returns:
+            dict: Item name, description, value, and rarity
+        """
+        definition = self.definition
+        return {
+            "name": definition.name,
+            "description": definition.description,
+            "value": definition.value,
+            "rarity": definition.rarity,
+        }
+
+    def get_rarity_color(self):
+        """RGB color for UI display based on rarity."""
+        return RARITY_COLORS.get(self.definition.rarity, RARITY_COLORS[ITEM_RARITY_COMMON])
+
+    def get_stats(self):
+        """Equipment stat bonuses."""
+        return {"armor": self.definition.armor, "damage_bonus": self.definition.damage_bonus}
+
+    def use(self, player=None):
+        """
+        Use the item; consumables apply their effect like Consumable.use.
+
+        Args:
+            player (Character): Player to apply effect on
+        """
+        definition = self.definition
+        if definition.item_class is not Consumable:
+            return
+        if player and definition.effect == "heal":
+            player.heal(definition.amount)
+        self.picked_up = True
+
+    def update(self):
+        """Update item state - for animated items or effects."""
+        pass
+
+
+class ItemCatalog:
+    """
+    Every item definition of the game, loaded once from a JSON file.
+
+    Attributes:
+        definitions (list): ItemDefinition by id
+        checksum (int): CRC32 of the data file, stored in the binary
+            inventories so data written against another catalog is refused
+    """
+
+    def __init__(self, definitions, checksum=0):
+        self.definitions = definitions
+        self.checksum = checksum
+        self._by_key = {definition.key: definition for definition in definitions}
+        self._by_name = {definition.name: definition for definition in definitions}
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a catalog file.
+
+        Args:
+            path (str): JSON file with an "items" list; each entry has a
+                key, a kind (item / consumable / equipment), a name and
+                optional description, value, rarity name and kind fields
+
+        Returns:
+            ItemCatalog: The catalog
+        """
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw)
+        definitions = []
+        for entry in data["items"]:
+            definitions.append(ItemDefinition(
+                len(definitions),
+                entry["key"],
+                ITEM_KINDS[entry.get("kind", "item")],
+                entry["name"],
+                entry.get("description", ""),
+                entry.get("value", 0),
+                RARITY_NAMES[entry.get("rarity", "common")],
+                entry.get("effect"),
+                entry.get("amount", 0),
+                entry.get("slot"),
+                entry.get("armor", 0),
+                entry.get("damage_bonus", 0),
+            ))
+        return cls(definitions, zlib.crc32(raw))
+
+    def get(self, key):
+        """Definition of a key, None if unknown."""
+        return self._by_key.get(key)
+
+    def by_name(self, name):
+        """Definition with a display name, None if unknown."""
+        return self._by_name.get(name)
+
+    def create(self, key, x=0, y=0):
+        """
+        New flyweight instance of a definition.
+
+        Args:
+            key (str): Definition key
+            x (int): Initial X position
+            y (int): Initial Y position
+
+        Returns:
+            CatalogItem: The instance
+        """
+        return CatalogItem(self._by_key[key], x, y)
+
+    def __getitem__(self, definition_id):
+        return self.definitions[definition_id]
+
+    def __len__(self):
+        return len(self.definitions)
+
+
+def get_item_catalog():
+    """Shared ItemCatalog of assets/items/items.json, loaded on first request."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = ItemCatalog.load(get_asset_path(*ITEM_CATALOG_PATH))
+    return _catalog
+
+
+# ============================================================================
+# BINARY INVENTORIES
+# ============================================================================
+
+def pack_inventory(inventory, catalog=None):
+    """
+    Compact binary form of an inventory, for network sync and saves.
+
+    Each used slot takes 7 bytes: slot index, definition id and stack
+    count. Items that are not CatalogItem are matched to the catalog by
+    name.
+
+    Args:
+        inventory (Inventory): Inventory to write
+        catalog (ItemCatalog): Catalog of the definition ids, the shared
+            one by default
+
+    Returns:
+        bytes: Header then one entry per used slot
+
+    Raises:
+        ValueError: If an item has no definition in the catalog or the
+            inventory has more than MAX_INVENTORY_SLOTS slots
+    """
+    catalog = catalog or get_item_catalog()
+    if inventory.max_size > MAX_INVENTORY_SLOTS:
+        raise ValueError(f"Inventaire trop grand: {inventory.max_size} emplacements")
+    entries = []
+    for slot, item, count in inventory.slots():
+        definition = getattr(item, "definition", None) or catalog.by_name(item.name)
+        if definition is None:
+            raise ValueError(f"Item absent du catalogue: {item.name}")
+        entries.append(INVENTORY_ENTRY.pack(slot, definition.id, count))
+    header = INVENTORY_HEADER.pack(
+        INVENTORY_MAGIC, catalog.checksum, inventory.max_size, len(entries)
+    )
+    return header + b"".join(entries)
+
+
+def unpack_inventory(data, catalog=None):
+    """
+    Rebuild an inventory written by pack_inventory, slots included.
+
+    Args:
+        data (bytes): Binary inventory
+        catalog (ItemCatalog): Catalog it was written with, the shared
+            one by default
+
+    Returns:
+        Inventory: Inventory of CatalogItem instances (marked picked up)
+
+    Raises:
+        ValueError: If the data is not an inventory, was written with
+            another catalog, or holds an unknown item, an invalid slot,
+            a size above MAX_INVENTORY_SLOTS or an invalid stack count
+    """
+    catalog = catalog or get_item_catalog()
+    if len(data) < INVENTORY_HEADER.size:
+        raise ValueError("Inventaire binaire tronqué")
+    magic, checksum, max_size, count = INVENTORY_HEADER.unpack_from(data, 0)
+    if magic != INVENTORY_MAGIC:
+        raise ValueError("Pas un inventaire binaire")
+    if checksum != catalog.checksum:
+        raise ValueError("Inventaire écrit avec un autre catalogue d'objets")
+    if len(data) != INVENTORY_HEADER.size + count * INVENTORY_ENTRY.size:
+        raise ValueError("Inventaire binaire tronqué")
+    if max_size > MAX_INVENTORY_SLOTS:
+        raise ValueError(f"Inventaire trop grand: {max_size} emplacements")
+    inventory = Inventory(max_size)
+    definitions = catalog.definitions
+    for slot, definition_id, stack in INVENTORY_ENTRY.iter_unpack(data[INVENTORY_HEADER.size:]):
+        if definition_id >= len(definitions):
+            raise ValueError("Objet inconnu dans l'inventaire binaire")
+        definition = definitions[definition_id]
+        if not 1 <= stack <= (MAX_STACK if definition.stackable else 1):
+            raise ValueError(f"Pile invalide dans l'inventaire binaire: {stack}")
+        item = CatalogItem(definition)
+        item.picked_up = True
+        if not inventory.place(slot, item, stack):
+            raise ValueError("Emplacement invalide ou en double dans l'inventaire binaire")
+    return inventory
+
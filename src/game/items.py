@@ -7,6 +7,8 @@ ITEM_RARITY_RARE = 2
 ITEM_RARITY_EPIC = 3
 ITEM_RARITY_LEGENDARY = 4
 
+MAX_STACK = 99  # identical consumables per inventory slot
+
 # Rarity colors for UI
 RARITY_COLORS = {
     ITEM_RARITY_COMMON: (200, 200, 200),      # Gray
@@ -27,6 +29,8 @@ class Item:
         rarity (int): Item rarity level
         position (tuple): Current (x, y) position on map
     """
+
+    __slots__ = ("name", "description", "value", "rarity", "position", "picked_up")
     
     def __init__(self, name, description="", value=0, rarity=ITEM_RARITY_COMMON, x=0, y=0):
         """
@@ -92,6 +96,8 @@ class Consumable(Item):
         effect (str): Type of effect (heal, buff, etc.)
         amount (int): Effect amount (healing, damage, etc.)
     """
+
+    __slots__ = ("effect", "amount")
     
     def __init__(self, name, effect, amount, description="", value=0, rarity=ITEM_RARITY_COMMON):
         """
@@ -134,6 +140,8 @@ class Equipment(Item):
         armor (int): Armor value
         damage_bonus (int): Damage bonus
     """
+
+    __slots__ = ("slot", "armor", "damage_bonus")
     
     def __init__(self, name, slot, armor=0, damage_bonus=0, description="", value=0, rarity=ITEM_RARITY_COMMON):
         """
@@ -169,82 +177,271 @@ class Equipment(Item):
 class Inventory:
     """
     Inventory system for managing player items.
-    
+
+    Items live in a fixed slot array with a free-slot stack, and every
+    occupied slot is indexed by item class, name and rarity, so adding,
+    removing and filtering never scan the whole inventory. Identical
+    consumables (same class, name, effect, amount, value and rarity)
+    share one slot with a stack count, up to MAX_STACK. The total value
+    is kept up to date on every change.
+
     Attributes:
-        items (list): List of Item objects in inventory
-        max_size (int): Maximum inventory size
+        max_size (int): Maximum number of slots (a stack uses one slot)
+        count (int): Number of items, stacked ones included
     """
-    
+
     def __init__(self, max_size=20):
         """
         Initialize inventory.
-        
+
         Args:
-            max_size (int): Maximum number of items (default 20)
+            max_size (int): Maximum number of slots (default 20)
         """
-        self.items = []
         self.max_size = max_size
-    
+        self.count = 0
+        self._slots = [None] * max_size          # slot -> item (stack representative)
+        self._stacks = [0] * max_size            # slot -> number of items
+        self._free = list(range(max_size - 1, -1, -1))  # lowest slot popped first
+        self._used = 0
+        self._slot_of = {}                       # item -> slot, items that do not stack
+        self._stack_slot = {}                    # consumable stack key -> slot
+        self._by_class = {}                      # class -> {slot: None}
+        self._by_name = {}                       # name -> {slot: None}
+        self._by_rarity = {}                     # rarity -> {slot: None}
+        self._value = 0
+
+    @staticmethod
+    def _stack_key(item):
+        definition = getattr(item, "definition", None)
+        if definition is not None:
+            # Catalog flyweights: same definition, same item
+            return definition if definition.stackable else None
+        if not isinstance(item, Consumable):
+            return None
+        return (type(item), item.name, item.effect, item.amount, item.value, item.rarity)
+
+    @staticmethod
+    def _class_of(item):
+        definition = getattr(item, "definition", None)
+        return definition.item_class if definition is not None else type(item)
+
+    @property
+    def used_slots(self):
+        """Number of occupied slots."""
+        return self._used
+
+    @property
+    def items(self):
+        """Items in slot order, one entry per slot (stacks appear once)."""
+        return [item for item in self._slots if item is not None]
+
     # ========================================================================
     # INVENTORY MANAGEMENT METHODS
     # ========================================================================
-    
+
     def add_item(self, item):
         """
-        Add item to inventory.
-        
+        Add item to inventory, on its stack if an identical consumable
+        is already there.
+
         Args:
             item (Item): Item to add
-            
+
         Returns:
             bool: True if added successfully, False if inventory full
         """
-        if len(self.items) < self.max_size:
-            self.items.append(item)
-            return True
-        return False
-    
+        key = self._stack_key(item)
+        if key is None and item in self._slot_of:
+            return False  # already in the inventory
+        if key is not None:
+            # A stack holds copies, not objects: a consumable taken out
+            # of it can be put back
+            slot = self._stack_slot.get(key)
+            if slot is not None and self._stacks[slot] < MAX_STACK:
+                self._stacks[slot] += 1
+                self.count += 1
+                self._value += item.value
+                return True
+        if self._used >= self.max_size:
+            return False
+        slot = self._free.pop()
+        while self._slots[slot] is not None:
+            slot = self._free.pop()  # taken by place()
+        self._fill(slot, item, 1, key)
+        return True
+
+    def place(self, slot, item, count=1):
+        """
+        Put a stack of *count* items in a given free slot (loading a
+        saved inventory).
+
+        Returns:
+            bool: False if the slot is out of range or already used
+        """
+        if not 0 <= slot < self.max_size or self._slots[slot] is not None:
+            return False
+        # The slot stays on the free stack, add_item skips it
+        self._fill(slot, item, count, self._stack_key(item))
+        return True
+
+    def _fill(self, slot, item, count, key):
+        self._slots[slot] = item
+        self._stacks[slot] = count
+        if key is None:
+            self._slot_of[item] = slot
+        else:
+            current = self._stack_slot.get(key)
+            if current is None or self._stacks[current] >= MAX_STACK:
+                self._stack_slot[key] = slot
+        self._by_class.setdefault(self._class_of(item), {})[slot] = None
+        self._by_name.setdefault(item.name, {})[slot] = None
+        self._by_rarity.setdefault(item.rarity, {})[slot] = None
+        self._used += 1
+        self.count += count
+        self._value += item.value * count
+
     def remove_item(self, item):
         """
-        Remove item from inventory.
-        
+        Remove item from inventory. For a stacked consumable, any
+        identical consumable removes one item from the stack.
+
         Args:
             item (Item): Item to remove
-            
+
         Returns:
             bool: True if removed, False if not found
         """
-        if item in self.items:
-            self.items.remove(item)
-            return True
-        return False
-    
+        slot = self._slot_of.get(item)
+        if slot is None:
+            key = self._stack_key(item)
+            slot = self._stack_slot.get(key) if key is not None else None
+            if slot is None:
+                return False
+        stored = self._slots[slot]
+        self.count -= 1
+        self._value -= stored.value
+        self._stacks[slot] -= 1
+        if self._stacks[slot] == 0:
+            self._free_slot(slot, stored)
+        else:
+            key = self._stack_key(stored)
+            if key is not None:
+                self._stack_slot[key] = slot  # room again, fill it before opening a slot
+        return True
+
+    def _free_slot(self, slot, item):
+        self._slots[slot] = None
+        self._slot_of.pop(item, None)
+        for index, field in (
+            (self._by_class, self._class_of(item)),
+            (self._by_name, item.name),
+            (self._by_rarity, item.rarity),
+        ):
+            slots = index[field]
+            del slots[slot]
+            if not slots:
+                del index[field]
+        key = self._stack_key(item)
+        if key is not None and self._stack_slot.get(key) == slot:
+            # Point the key at another stack of the same item, one with
+            # room first, or the full stacks left behind are unreachable
+            del self._stack_slot[key]
+            for other in self._by_name.get(item.name, ()):
+                if self._stack_key(self._slots[other]) == key:
+                    self._stack_slot[key] = other
+                    if self._stacks[other] < MAX_STACK:
+                        break
+        self._used -= 1
+        self._free.append(slot)
+
     def get_inventory_value(self):
         """
         Calculate total inventory value.
-        
+
         Returns:
-            int: Total value of all items
+            int: Total value of all items, stacks included
         """
-        return sum(item.value for item in self.items)
-    
+        return self._value
+
     def is_full(self):
         """
         Check if inventory is full.
-        
+
         Returns:
-            bool: True if at maximum capacity
+            bool: True if every slot is used
         """
-        return len(self.items) >= self.max_size
-    
+        return self._used >= self.max_size
+
+    def stack_count(self, item):
+        """
+        Number of items in the stack of *item*.
+
+        Returns:
+            int: 0 if the item is not in the inventory
+        """
+        slot = self._slot_of.get(item)
+        if slot is None:
+            key = self._stack_key(item)
+            slot = self._stack_slot.get(key) if key is not None else None
+            if slot is None:
+                return 0
+        return self._stacks[slot]
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def slots(self):
+        """
+        Used slots in slot order.
+
+        Yields:
+            tuple: (slot index, item, stack count)
+        """
+        stacks = self._stacks
+        for slot, item in enumerate(self._slots):
+            if item is not None:
+                yield slot, item, stacks[slot]
+
     def get_items_by_type(self, item_type):
         """
         Get all items of specific type.
-        
+
         Args:
-            item_type (type): Item class type to filter
-            
+            item_type (type): Item class type to filter (subclasses match)
+
         Returns:
-            list: Items matching the type
+            list: Items matching the type, one entry per slot
         """
-        return [item for item in self.items if isinstance(item, item_type)]
+        slots = self._slots
+        return [
+            slots[slot]
+            for cls, indexed in self._by_class.items() if issubclass(cls, item_type)
+            for slot in indexed
+        ]
+
+    def get_items_by_name(self, name):
+        """
+        Get all items with a given name.
+
+        Returns:
+            list: Matching items, one entry per slot
+        """
+        slots = self._slots
+        return [slots[slot] for slot in self._by_name.get(name, ())]
+
+    def get_items_by_rarity(self, rarity):
+        """
+        Get all items of a rarity level.
+
+        Returns:
+            list: Matching items, one entry per slot
+        """
+        slots = self._slots
+        return [slots[slot] for slot in self._by_rarity.get(rarity, ())]
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, item):
+        return self.stack_count(item) > 0
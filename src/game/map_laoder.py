@@ -1,10 +1,13 @@
 import pygame as pyg
 import os
+from game.tile_map import load_tile_map
 from ui.console import print_info
 
 
 MAP_PATH_BACKGROUND = 'assets/maps/map-1-BACKGROUND-Sheet.png'
 MAP_PATH_FOREGROUND = 'assets/maps/map-1-FOREGROUND-Sheet.png'
+# Tile map built from the two images above by tools/build_tile_map.py
+MAP_PATH_TILES = 'build/maps/map-1'
 
 
 class MapLoader:
@@ -15,6 +18,7 @@ class MapLoader:
         base_path (str): Base path to project assets
         map_path_back (str): Full path to background sprite sheet
         map_path_fore (str): Full path to foreground sprite sheet
+        map_path_tiles (str): Tile map directory (map.json + tileset)
     """
     
     def __init__(self, map_data):
@@ -22,7 +26,8 @@ class MapLoader:
         Initialize map loader and resolve asset paths.
         
         Args:
-            map_data: Map configuration data (can be None for default map)
+            map_data: Tile map directory, relative to the project root
+                (None for the default map)
         """
 
         base_path = os.path.abspath(
@@ -32,6 +37,7 @@ class MapLoader:
 
         self.map_path_back = os.path.join(base_path, MAP_PATH_BACKGROUND)
         self.map_path_fore = os.path.join(base_path, MAP_PATH_FOREGROUND)
+        self.map_path_tiles = os.path.join(base_path, map_data or MAP_PATH_TILES)
 
     def load_map(self):
         """
@@ -50,3 +56,25 @@ class MapLoader:
             
         print_info("Map layers loaded successfully")
         return background, foreground
+
+    def has_tile_map(self):
+        """True if the tile map directory exists (built by tools/build_tile_map.py)."""
+        return os.path.exists(os.path.join(self.map_path_tiles, "map.json"))
+
+    def load_tile_map(self, scale=1):
+        """
+        Load the tile map: layers to draw through ChunkedMap and the
+        walkability grid.
+
+        Args:
+            scale (int): Integer scale applied to the tiles
+
+        Returns:
+            TileMap: The map (see TileMap.chunked and TileMap.walk_grid)
+        """
+        tile_map = load_tile_map(self.map_path_tiles, scale)
+        print_info(
+            f"Tile map loaded: {tile_map.width}x{tile_map.height} tiles, "
+            f"{len(tile_map.tileset.tiles)} distinct"
+        )
+        return tile_map
@@ -0,0 +1,349 @@
+import heapq
+from collections import OrderedDict
+
+import numpy as np
+
+from game.enemy import ENEMY_VISION_RANGE
+
+FLOW_FIELD_RADIUS = 2 * ENEMY_VISION_RANGE  # pixels around the target
+FLOW_FIELD_CACHE_SIZE = 16
+PATH_SEARCH_LIMIT = 20000  # cells expanded before A* gives up
+
+# 8 neighbours, diagonals first so ties move on both axes like chase_target
+NEIGHBOURS = ((1, 1), (-1, 1), (1, -1), (-1, -1), (1, 0), (-1, 0), (0, 1), (0, -1))
+UNREACHABLE = -1
+
+
+class FlowField:
+    """
+    Distances to one target cell, and the step to take from every cell.
+
+    Covers a square window of the grid around the target. ``step_x`` /
+    ``step_y`` hold the move (-1, 0 or 1 per axis) toward the neighbour
+    closest to the target, only meaningful where ``distance`` > 0.
+
+    Attributes:
+        target (tuple): Target cell (tx, ty)
+        origin (tuple): Cell of the window's top-left corner
+        tile_size (int): Tile size in pixels
+        distance (numpy.ndarray): (rows, columns) steps to the target,
+            UNREACHABLE if blocked or cut off
+        step_x (numpy.ndarray): (rows, columns) X move toward the target
+        step_y (numpy.ndarray): (rows, columns) Y move toward the target
+    """
+
+    __slots__ = ("target", "origin", "tile_size", "distance", "step_x", "step_y")
+
+    def __init__(self, target, origin, tile_size, distance, step_x, step_y):
+        self.target = target
+        self.origin = origin
+        self.tile_size = tile_size
+        self.distance = distance
+        self.step_x = step_x
+        self.step_y = step_y
+
+    def step(self, position):
+        """
+        Move toward the target from a world position.
+
+        Returns:
+            tuple: (dx, dy) in -1..1, or None outside the field, on the
+            target cell or on a cell that cannot reach it (chase straight)
+        """
+        col = int(position[0]) // self.tile_size - self.origin[0]
+        row = int(position[1]) // self.tile_size - self.origin[1]
+        rows, cols = self.distance.shape
+        if not (0 <= col < cols and 0 <= row < rows) or self.distance[row, col] <= 0:
+            return None
+        return int(self.step_x[row, col]), int(self.step_y[row, col])
+
+    def steps(self, positions):
+        """
+        Batched ``step`` for an array of world positions.
+
+        Args:
+            positions (numpy.ndarray): (n, 2) world positions
+
+        Returns:
+            tuple: ((n, 2) int8 moves, (n,) bool mask of the positions the
+            field covers; the others should chase straight)
+        """
+        cells = positions.astype(np.int64) // self.tile_size - self.origin
+        rows, cols = self.distance.shape
+        inside = (
+            (cells[:, 0] >= 0) & (cells[:, 0] < cols) & (cells[:, 1] >= 0) & (cells[:, 1] < rows)
+        )
+        moves = np.zeros((len(positions), 2), dtype=np.int8)
+        col, row = cells[inside, 0], cells[inside, 1]
+        covered = inside.copy()
+        covered[inside] = self.distance[row, col] > 0
+        moves[inside, 0] = self.step_x[row, col]
+        moves[inside, 1] = self.step_y[row, col]
+        moves[~covered] = 0
+        return moves, covered
+
+
+class PathFinder:
+    """
+    Pathfinding service over a WalkGrid, shared by every enemy.
+
+    Chasers use flow fields: one breadth-first search from the target
+    cell gives the move of every cell around it, so all the enemies
+    chasing a target share one search instead of one each. Fields are
+    kept per target cell (LRU), so a target standing in the same cell
+    costs nothing on the next ticks, and they are at most built once per
+    target cell and per tick.
+
+    Single agents can also follow cached A* paths (``next_waypoint``):
+    an agent's path is reused while its goal stays in the same cell and
+    the agent stays on it, and searched again when the goal crosses into
+    another cell.
+
+    Paths move in 8 directions, without cutting the corner of a blocked
+    cell. Call ``invalidate`` after changing the grid.
+
+    Attributes:
+        grid (WalkGrid): Walkability grid
+        radius (int): Flow field reach around the target, in cells
+        fields_built (int): Flow fields computed
+        field_hits (int): Flow field requests served from the cache
+        searches (int): A* searches run
+        path_hits (int): Waypoint requests served from a cached path
+    """
+
+    def __init__(self, grid, radius=FLOW_FIELD_RADIUS, capacity=FLOW_FIELD_CACHE_SIZE):
+        """
+        Args:
+            grid (WalkGrid): Walkability grid
+            radius (int): Flow field reach around the target, in pixels
+            capacity (int): Flow fields kept in the cache
+        """
+        self.grid = grid
+        self.radius = max(1, -(-radius // grid.tile_size))
+        self.capacity = capacity
+        self._fields = OrderedDict()  # target cell -> FlowField, LRU order
+        self._paths = {}  # agent -> [goal cell, path, next index, start cell]
+        self.fields_built = 0
+        self.field_hits = 0
+        self.searches = 0
+        self.path_hits = 0
+        self.invalidate()
+
+    def invalidate(self):
+        """Reload the walkability grid and drop every cached field and path."""
+        grid = self.grid
+        bits = np.frombuffer(bytes(grid.bits), dtype=np.uint8)
+        blocked = np.unpackbits(bits, bitorder="little")[:grid.width * grid.height]
+        self._blocked = blocked.reshape(grid.height, grid.width).astype(bool)
+        self._walkable = bytearray((~self._blocked).tobytes())  # flat, for A*
+        self._fields.clear()
+        self._paths.clear()
+
+    def cell_of(self, position):
+        """Grid cell (tx, ty) of a world position."""
+        size = self.grid.tile_size
+        return int(position[0]) // size, int(position[1]) // size
+
+    def cell_center(self, cell):
+        """World position of the center of a cell."""
+        size = self.grid.tile_size
+        return cell[0] * size + size // 2, cell[1] * size + size // 2
+
+    # ========================================================================
+    # FLOW FIELDS
+    # ========================================================================
+
+    def flow_field(self, target_position):
+        """
+        Flow field toward a world position, cached per target cell.
+
+        Args:
+            target_position (tuple): Target (x, y), usually a player position
+
+        Returns:
+            FlowField: Field around the target cell
+        """
+        cell = self.cell_of(target_position)
+        field = self._fields.get(cell)
+        if field is not None:
+            self._fields.move_to_end(cell)
+            self.field_hits += 1
+            return field
+        field = self._build_field(cell)
+        self._fields[cell] = field
+        if len(self._fields) > self.capacity:
+            self._fields.popitem(last=False)
+        self.fields_built += 1
+        return field
+
+    def flow_step(self, position, target_position):
+        """Move (dx, dy) from *position* toward *target_position*, or None."""
+        return self.flow_field(target_position).step(position)
+
+    def _build_field(self, target):
+        grid = self.grid
+        radius = self.radius
+        x0, y0 = max(0, target[0] - radius), max(0, target[1] - radius)
+        x1 = min(grid.width, target[0] + radius + 1)
+        y1 = min(grid.height, target[1] + radius + 1)
+        cols, rows = x1 - x0, y1 - y0
+        walkable = ~self._blocked[y0:y1, x0:x1]
+        distance = np.full((rows, cols), UNREACHABLE, dtype=np.int32)
+        step_x = np.zeros((rows, cols), dtype=np.int8)
+        step_y = np.zeros((rows, cols), dtype=np.int8)
+        field = FlowField(target, (x0, y0), grid.tile_size, distance, step_x, step_y)
+        tx, ty = target[0] - x0, target[1] - y0
+        if not (0 <= tx < cols and 0 <= ty < rows) or not walkable[ty, tx]:
+            return field
+
+        # Breadth-first search on the flat window, padded with a blocked
+        # border so neighbours need no bounds check (uniform cost, 8 neighbours)
+        stride = cols + 2
+        open_padded = np.zeros((rows + 2, stride), dtype=bool)
+        open_padded[1:-1, 1:-1] = walkable
+        open_cells = open_padded.ravel().tolist()
+        dist = [UNREACHABLE] * len(open_cells)
+        offsets = [
+            (dy * stride + dx, dx if dx and dy else 0, dy * stride if dx and dy else 0)
+            for dx, dy in NEIGHBOURS
+        ]
+        start = (ty + 1) * stride + tx + 1
+        dist[start] = 0
+        frontier = [start]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for index in frontier:
+                for offset, side_x, side_y in offsets:
+                    neighbour = index + offset
+                    if dist[neighbour] != UNREACHABLE or not open_cells[neighbour]:
+                        continue
+                    if side_x and not (open_cells[index + side_x] and open_cells[index + side_y]):
+                        continue  # corner of a blocked cell
+                    dist[neighbour] = depth
+                    next_frontier.append(neighbour)
+            frontier = next_frontier
+        distance[:] = np.array(dist, dtype=np.int32).reshape(rows + 2, stride)[1:-1, 1:-1]
+
+        # Steepest descent: the neighbour with the smallest distance
+        big = np.iinfo(np.int32).max
+        padded = np.full((rows + 2, cols + 2), big, dtype=np.int32)
+        padded[1:-1, 1:-1] = np.where(distance == UNREACHABLE, big, distance)
+        best = np.where(distance == UNREACHABLE, big, distance)
+        for dx, dy in NEIGHBOURS:
+            neighbour = padded[1 + dy:rows + 1 + dy, 1 + dx:cols + 1 + dx]
+            better = neighbour < best
+            if dx and dy:
+                better &= open_padded[1:-1, 1 + dx:cols + 1 + dx]
+                better &= open_padded[1 + dy:rows + 1 + dy, 1:-1]
+            best = np.where(better, neighbour, best)
+            step_x[better] = dx
+            step_y[better] = dy
+        return field
+
+    # ========================================================================
+    # CACHED A*
+    # ========================================================================
+
+    def find_path(self, start, goal):
+        """
+        A* search between two cells.
+
+        Args:
+            start (tuple): Start cell (tx, ty)
+            goal (tuple): Goal cell (tx, ty)
+
+        Returns:
+            list: Cells after *start* up to *goal* included ([] if start is
+            the goal), or None if the goal cannot be reached
+        """
+        self.searches += 1
+        width, height = self.grid.width, self.grid.height
+        walkable = self._walkable
+        gx, gy = goal
+        if not (0 <= gx < width and 0 <= gy < height) or not walkable[gy * width + gx]:
+            return None
+        start_index = start[1] * width + start[0]
+        goal_index = gy * width + gx
+        if start_index == goal_index:
+            return []
+        came_from = {start_index: None}
+        cost = {start_index: 0}
+        heap = [(max(abs(start[0] - gx), abs(start[1] - gy)), 0, start_index)]
+        expanded = 0
+        while heap:
+            _, g, index = heapq.heappop(heap)
+            if index == goal_index:
+                break
+            if g > cost[index]:
+                continue  # stale entry
+            expanded += 1
+            if expanded > PATH_SEARCH_LIMIT:
+                return None
+            y, x = divmod(index, width)
+            for dx, dy in NEIGHBOURS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbour = ny * width + nx
+                if not walkable[neighbour]:
+                    continue
+                if dx and dy and not (walkable[y * width + nx] and walkable[ny * width + x]):
+                    continue
+                new_cost = g + 1
+                if new_cost < cost.get(neighbour, new_cost + 1):
+                    cost[neighbour] = new_cost
+                    came_from[neighbour] = index
+                    estimate = new_cost + max(abs(nx - gx), abs(ny - gy))
+                    heapq.heappush(heap, (estimate, new_cost, neighbour))
+        else:
+            return None
+        path = []
+        index = goal_index
+        while index != start_index:
+            path.append((index % width, index // width))
+            index = came_from[index]
+        path.reverse()
+        return path
+
+    def next_waypoint(self, agent, position, goal_position):
+        """
+        Next cell center on the cached A* path of an agent.
+
+        The agent's path is reused while the goal stays in the same cell
+        and the agent is on the path; it is searched again when the goal
+        moves to another cell or the agent leaves the path.
+
+        Args:
+            agent (hashable): Path owner, e.g. the enemy
+            position (tuple): Agent world position
+            goal_position (tuple): Goal world position
+
+        Returns:
+            tuple: World position to head to, *goal_position* once in the
+            goal cell, or None if the goal cannot be reached
+        """
+        start, goal = self.cell_of(position), self.cell_of(goal_position)
+        if start == goal:
+            return goal_position
+        entry = self._paths.get(agent)
+        if entry is not None and entry[0] == goal:
+            path, index = entry[1], entry[2]
+            if index < len(path) and path[index] == start:
+                index += 1  # waypoint reached
+                entry[2] = index
+            previous = path[index - 1] if index else entry[3]
+            if index < len(path) and previous == start:
+                self.path_hits += 1
+                return self.cell_center(path[index])
+        path = self.find_path(start, goal)
+        if not path:
+            self._paths.pop(agent, None)
+            return None
+        self._paths[agent] = [goal, path, 0, start]
+        return self.cell_center(path[0])
+
+    def forget(self, agent):
+        """Drop the cached path of an agent (dead enemy...)."""
+        self._paths.pop(agent, None)
@@ -0,0 +1,294 @@
+import numpy as np
+
+DEFAULT_PROJECTILE_CAPACITY = 1024
+PROJECTILE_SPEED = 0.5        # pixels per millisecond (30 px per 60 FPS frame)
+PROJECTILE_LIFETIME = 1200    # milliseconds
+PROJECTILE_ANIM_SPEED = 80    # milliseconds per effect frame, like CharacterType
+PROJECTILE_HITBOX_SIZE = 64   # square hitbox, the height of the effect sheets
+PROJECTILE_DAMAGE = 10        # per hit, like ENEMY_BASE_DAMAGE
+NO_OWNER = -1
+
+
+class ProjectilePool:
+    """
+    Preallocated struct-of-arrays pool of projectiles and skill effects.
+
+    Every projectile is a slot index into NumPy arrays (position, velocity,
+    remaining lifetime, age, owner, effect id). Free slots sit on a stack
+    (``_free``), so ``spawn`` pops an index and writes a few scalars: firing
+    never allocates Python objects in the hot loop, and the arrays only
+    grow (by doubling) when every slot is in use. ``update`` moves, ages
+    and expires the whole pool as array operations; ``draw`` sends every
+    visible projectile to one ``blits`` call.
+
+    Effects are registered once (``effect_id``) as a list of animation
+    frames; a projectile shows the frame matching its age.
+
+    Attributes:
+        capacity (int): Number of slots
+        live (int): Number of live projectiles
+        positions (numpy.ndarray): (capacity, 2) world positions (top-left)
+        velocities (numpy.ndarray): (capacity, 2) pixels per millisecond
+        lifetimes (numpy.ndarray): Remaining lifetime in milliseconds
+        ages (numpy.ndarray): Time since spawn in milliseconds
+        owners (numpy.ndarray): Owner id (player id), NO_OWNER if none
+        effects (numpy.ndarray): Effect id, index into the registered effects
+        alive (numpy.ndarray): Slot in use
+    """
+
+    def __init__(self, capacity=DEFAULT_PROJECTILE_CAPACITY):
+        """
+        Preallocate the arrays.
+
+        Args:
+            capacity (int): Initial number of slots (grows by doubling)
+        """
+        self.capacity = 0
+        self.live = 0
+        self._effect_ids = {}   # effect key -> effect id
+        self._effect_frames = []  # effect id -> list of frames
+        self._margin = 0          # largest effect frame, for culling
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity):
+        old = self.capacity
+        positions = np.zeros((capacity, 2), dtype=np.float32)
+        velocities = np.zeros((capacity, 2), dtype=np.float32)
+        lifetimes = np.zeros(capacity, dtype=np.float32)
+        ages = np.zeros(capacity, dtype=np.float32)
+        owners = np.full(capacity, NO_OWNER, dtype=np.int32)
+        effects = np.zeros(capacity, dtype=np.int16)
+        alive = np.zeros(capacity, dtype=bool)
+        free = np.empty(capacity, dtype=np.int32)
+        if old:
+            positions[:old] = self.positions
+            velocities[:old] = self.velocities
+            lifetimes[:old] = self.lifetimes
+            ages[:old] = self.ages
+            owners[:old] = self.owners
+            effects[:old] = self.effects
+            alive[:old] = self.alive
+            free[:self._free_top] = self._free[:self._free_top]
+        # New slots go on top of the stack, lowest index popped first
+        added = capacity - old
+        top = self._free_top if old else 0
+        free[top:top + added] = np.arange(capacity - 1, old - 1, -1, dtype=np.int32)
+        self.positions = positions
+        self.velocities = velocities
+        self.lifetimes = lifetimes
+        self.ages = ages
+        self.owners = owners
+        self.effects = effects
+        self.alive = alive
+        self._free = free
+        self._free_top = top + added
+        self.capacity = capacity
+
+    # ========================================================================
+    # EFFECTS
+    # ========================================================================
+
+    def effect_id(self, key, frames):
+        """
+        Id of an effect animation, registered on first use.
+
+        Args:
+            key (hashable): Effect key, e.g. (char_number, 'effect1', 'right')
+            frames (list): Animation frames (Surfaces)
+
+        Returns:
+            int: Effect id to pass to spawn
+        """
+        effect = self._effect_ids.get(key)
+        if effect is None:
+            effect = self._effect_ids[key] = len(self._effect_frames)
+            self._effect_frames.append(list(frames))
+            for frame in self._effect_frames[effect]:
+                self._margin = max(self._margin, *frame.get_size())
+        return effect
+
+    # ========================================================================
+    # SPAWNING
+    # ========================================================================
+
+    def spawn(self, x, y, vx, vy, effect, lifetime=PROJECTILE_LIFETIME, owner=NO_OWNER):
+        """
+        Fire one projectile.
+
+        Args:
+            x (float): Start X (top-left of the sprite)
+            y (float): Start Y
+            vx (float): X velocity in pixels per millisecond
+            vy (float): Y velocity in pixels per millisecond
+            effect (int): Effect id (see effect_id)
+            lifetime (float): Lifetime in milliseconds
+            owner (int): Owner id, for friendly fire and scoring
+
+        Returns:
+            int: Slot index of the projectile
+        """
+        if self._free_top == 0:
+            self._allocate(self.capacity * 2)
+        self._free_top -= 1
+        index = int(self._free[self._free_top])
+        self.positions[index] = (x, y)
+        self.velocities[index] = (vx, vy)
+        self.lifetimes[index] = lifetime
+        self.ages[index] = 0
+        self.owners[index] = owner
+        self.effects[index] = effect
+        self.alive[index] = True
+        self.live += 1
+        return index
+
+    def fire_skill(self, character, n, speed=PROJECTILE_SPEED, lifetime=PROJECTILE_LIFETIME,
+                   owner=NO_OWNER):
+        """
+        Fire the effect of skill *n* of a character, in its facing direction,
+        centred on the caster's sprite.
+
+        Args:
+            character (Character | Water): Caster; its effect{n} frames are
+                used (characters without a ``frames`` table fire nothing)
+            n (int): Skill number (1..3)
+            speed (float): Pixels per millisecond
+            lifetime (float): Lifetime in milliseconds
+            owner (int): Owner id
+
+        Returns:
+            int: Slot index, or -1 if the character has no effect{n} frames
+        """
+        key = f'effect{n}'
+        frames = getattr(character, "frames", None)
+        directions = frames.get(key) if frames is not None else None
+        if not directions:
+            return -1
+        direction = character.direction
+        frames = directions[direction]
+        effect = self.effect_id((character.char_number, key, direction), frames)
+        width, height = frames[0].get_size()
+        sprite_w, sprite_h = character.get_current_sprite().get_size()
+        x = character.position[0] + (sprite_w - width) / 2
+        y = character.position[1] + (sprite_h - height) / 2
+        vx = speed if direction == "right" else -speed
+        return self.spawn(x, y, vx, 0.0, effect, lifetime, owner)
+
+    def kill(self, indices):
+        """
+        Release slots before the end of their lifetime (hits).
+
+        Args:
+            indices (int | array-like): Slot indices; dead slots are ignored
+        """
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.int32))
+        indices = np.unique(indices[self.alive[indices]])
+        self._release(indices)
+
+    def _release(self, indices):
+        count = len(indices)
+        if count == 0:
+            return
+        self.alive[indices] = False
+        self._free[self._free_top:self._free_top + count] = indices
+        self._free_top += count
+        self.live -= count
+
+    # ========================================================================
+    # BATCHED UPDATE AND DRAW
+    # ========================================================================
+
+    def update(self, delta_time, bounds=None):
+        """
+        Move and age every live projectile, expire the finished ones.
+
+        Args:
+            delta_time (float): Frame time in milliseconds
+            bounds (pygame.Rect): World bounds; projectiles leaving them expire
+
+        Returns:
+            numpy.ndarray: Slot indices expired by this update
+        """
+        if self.live == 0:
+            return np.empty(0, dtype=np.int32)
+        alive = self.alive
+        self.positions[alive] += self.velocities[alive] * delta_time
+        self.lifetimes[alive] -= delta_time
+        self.ages[alive] += delta_time
+        expired = alive & (self.lifetimes <= 0)
+        if bounds is not None:
+            x, y = self.positions[:, 0], self.positions[:, 1]
+            expired |= alive & (
+                (x < bounds.left) | (x >= bounds.right) | (y < bounds.top) | (y >= bounds.bottom)
+            )
+        indices = np.flatnonzero(expired).astype(np.int32)
+        self._release(indices)
+        return indices
+
+    def query_rect(self, rect, size):
+        """
+        Live projectiles overlapping a rect.
+
+        Args:
+            rect (pygame.Rect): Hitbox in world coordinates
+            size (int): Projectile hitbox size (square, at the position)
+
+        Returns:
+            numpy.ndarray: Slot indices
+        """
+        x, y = self.positions[:, 0], self.positions[:, 1]
+        hit = (
+            self.alive
+            & (x < rect.right) & (x + size > rect.left)
+            & (y < rect.bottom) & (y + size > rect.top)
+        )
+        return np.flatnonzero(hit)
+
+    def collide(self, rects, size=PROJECTILE_HITBOX_SIZE):
+        """
+        Kill the live projectiles overlapping the given hitboxes (hits).
+
+        Args:
+            rects (dict): Entity -> pygame.Rect, e.g. CollisionWorld.rects(kind)
+            size (int): Projectile hitbox size
+
+        Returns:
+            list: (entity, number of projectiles that hit it)
+        """
+        hits = []
+        if self.live == 0:
+            return hits
+        for entity, rect in rects.items():
+            indices = self.query_rect(rect, size)
+            if len(indices):
+                self._release(indices.astype(np.int32))
+                hits.append((entity, len(indices)))
+        return hits
+
+    def draw(self, surface, view):
+        """
+        Draw the live projectiles inside the view with one blits call.
+
+        Args:
+            surface: Target surface or RenderLayer
+            view (pygame.Rect): Visible area (camera rect), world coordinates
+        """
+        if self.live == 0:
+            return
+        x, y = self.positions[:, 0], self.positions[:, 1]
+        margin = self._margin
+        visible = np.flatnonzero(
+            self.alive
+            & (x < view.right) & (x > view.left - margin)
+            & (y < view.bottom) & (y > view.top - margin)
+        )
+        if len(visible) == 0:
+            return
+        effects = self.effects[visible]
+        steps = (self.ages[visible] // PROJECTILE_ANIM_SPEED).astype(np.int32).tolist()
+        screen = (self.positions[visible] - (view.x, view.y)).astype(np.int32).tolist()
+        all_frames = self._effect_frames
+        images = []
+        for effect, step in zip(effects.tolist(), steps):
+            frames = all_frames[effect]
+            images.append(frames[step % len(frames)])
+        surface.blits(zip(images, screen), doreturn=False)
@@ -0,0 +1,195 @@
+import pygame as pyg
+
+# Scene layers, drawn in increasing order inside the entity render layer
+SCENE_LAYER_ITEMS = 0    # items lying on the ground
+SCENE_LAYER_ACTORS = 1   # local and remote players, enemies
+SCENE_LAYER_EFFECTS = 2  # skill effects, drawn over the actors
+
+# Inside a scene layer sprites are y-sorted: the LayeredDirty layer of a
+# sprite is base_layer * SCENE_Y_SPAN + rect.bottom
+SCENE_Y_SPAN = 1 << 20
+
+
+def layer_key(base_layer, bottom):
+    """LayeredDirty layer of a sprite of *base_layer* whose feet are at *bottom*."""
+    return base_layer * SCENE_Y_SPAN + bottom
+
+
+def current_sprite(entity):
+    """Default image getter: the entity's current animation frame."""
+    return entity.get_current_sprite()
+
+
+class SceneSprite(pyg.sprite.DirtySprite):
+    """
+    Scene node following one entity.
+
+    The entity keeps its own state (``position``, animation); ``sync``
+    copies its current image and position and only marks the sprite dirty
+    when one of them changed.
+
+    Attributes:
+        entity: Followed object, with a ``position`` (x, y)
+        get_image (callable): entity -> Surface, or None to hide the sprite
+        base_layer (int): Scene layer (SCENE_LAYER_*)
+        centered (bool): Centre the image on the entity's current sprite
+            instead of drawing it at ``position`` (effects larger than
+            the character)
+    """
+
+    def __init__(self, entity, get_image, base_layer, centered=False):
+        super().__init__()
+        self.entity = entity
+        self.get_image = get_image
+        self.base_layer = base_layer
+        self.centered = centered
+        self.image = get_image(entity)
+        size = self.image.get_size() if self.image is not None else (0, 0)
+        self.rect = pyg.Rect(self._topleft(self.image), size)
+        self.visible = int(self.image is not None)
+        self._layer = layer_key(base_layer, self.rect.bottom)
+
+    def sync(self, view):
+        """
+        Pull the entity's position, and its image when it is in *view*.
+
+        Off-screen sprites are hidden without asking the entity for its
+        image. ``visible`` is only written when it changes (the property
+        marks the sprite dirty).
+
+        Args:
+            view (pygame.Rect): Visible area
+
+        Returns:
+            bool: True if the sprite moved
+        """
+        x, y = self._topleft(self.image)
+        rect = self.rect
+        moved = x != rect.x or y != rect.y
+        if moved:
+            rect.topleft = (x, y)
+            self.dirty = 1
+        # An empty rect (no image yet, e.g. an effect not playing) never
+        # collides: ask the entity for its image instead of culling it
+        if rect.width and not view.colliderect(rect):
+            if self._visible:
+                self.visible = 0
+            return moved
+        image = self.get_image(self.entity)
+        if image is None:
+            if self._visible:
+                self.visible = 0
+            return moved
+        if image is not self.image:
+            if image.get_size() != rect.size:
+                rect.size = image.get_size()
+                if self.centered:
+                    rect.topleft = self._topleft(image)
+                    moved = True
+            self.image = image
+            self.dirty = 1
+        if not self._visible:
+            self.visible = 1
+        return moved
+
+    def _topleft(self, image):
+        x, y = self.entity.position
+        if self.centered and image is not None:
+            width, height = self.entity.get_current_sprite().get_size()
+            x += (width - image.get_width()) // 2
+            y += (height - image.get_height()) // 2
+        return int(x), int(y)
+
+
+class Scene(pyg.sprite.LayeredDirty):
+    """
+    Layered scene graph of the game entities.
+
+    Sprites are ordered by scene layer (items, actors, effects) and, inside
+    a layer, by the bottom of their rect so that an actor standing lower on
+    the screen is drawn over the ones behind it. Each frame ``update``
+    syncs the sprites with their entities, re-sorts only the ones that
+    moved, and hides the ones outside the view rect (culling): hidden
+    sprites cost neither a blit nor a dirty rect.
+
+    Two ways to draw:
+        - ``queue(layer)``: blits of the visible sprites appended to a
+          RenderLayer, for screens redrawn every frame (Game.run)
+        - ``draw(surface)`` (LayeredDirty): repaints only the dirty rects
+          over the background given to ``clear``, for a static background
+          and a view at the origin
+
+    Attributes:
+        view (pygame.Rect): Visible area, in world coordinates (pass the
+            camera rect to share it)
+        visible_count (int): Sprites drawn by the last update
+        culled_count (int): Sprites skipped by the last update
+    """
+
+    def __init__(self, view):
+        super().__init__()
+        self.view = view if isinstance(view, pyg.Rect) else pyg.Rect(view)
+        self._nodes = {}  # (entity, base_layer) -> SceneSprite
+        self._drawn = []  # visible sprites in draw order, set by update
+        self.visible_count = 0
+        self.culled_count = 0
+
+    def add_entity(self, entity, base_layer=SCENE_LAYER_ACTORS, get_image=current_sprite,
+                   centered=False):
+        """
+        Follow an entity.
+
+        An entity can be added once per layer, e.g. a character on the actor
+        layer and its skill effect (``get_effect_sprite``) on the effect
+        layer.
+
+        Args:
+            entity: Object with a ``position`` (x, y)
+            base_layer (int): Scene layer (SCENE_LAYER_*)
+            get_image (callable): entity -> Surface or None (hidden)
+            centered (bool): Centre the image on the entity's current sprite
+
+        Returns:
+            SceneSprite: Node of the entity
+        """
+        key = (entity, base_layer)
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = SceneSprite(entity, get_image, base_layer, centered)
+            self.add(node)
+        return node
+
+    def remove_entity(self, entity):
+        """Stop following an entity (on every layer)."""
+        for key in [key for key in self._nodes if key[0] is entity]:
+            self.remove(self._nodes.pop(key))
+
+    def update(self):
+        """Sync every sprite with its entity, y-sort the moved ones and cull."""
+        view = self.view
+        for node in self.sprites():
+            if node.sync(view):
+                layer = layer_key(node.base_layer, node.rect.bottom)
+                if layer != node._layer:
+                    self.change_layer(node, layer)
+        self._drawn = [node for node in self.sprites() if node._visible]
+        self.visible_count = len(self._drawn)
+        self.culled_count = len(self._nodes) - self.visible_count
+
+    def queue(self, layer):
+        """
+        Queue the sprites left visible by ``update``, in draw order, on a
+        render layer, in screen coordinates (relative to the view).
+
+        Args:
+            layer (RenderLayer): Layer to draw into (or any surface)
+        """
+        offset_x, offset_y = self.view.topleft
+        if offset_x or offset_y:
+            batch = [(node.image, node.rect.move(-offset_x, -offset_y)) for node in self._drawn]
+        else:
+            batch = [(node.image, node.rect) for node in self._drawn]
+        layer.blits(batch, doreturn=False)
+        for node in self._drawn:
+            if node.dirty == 1:
+                node.dirty = 0
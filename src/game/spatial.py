@@ -0,0 +1,183 @@
+DEFAULT_CELL_SIZE = 200
+
+KIND_CHARACTER = "character"
+KIND_ENEMY = "enemy"
+KIND_PROJECTILE = "projectile"
+KIND_ITEM = "item"
+
+
+class SpatialHash:
+    """
+    Uniform grid spatial index over characters and enemies.
+
+    Entities are bucketed by the cell containing their ``position``. Moving
+    entities call ``update`` (Enemy.move and Character.move do it when they
+    belong to a grid), which only touches the buckets when the entity
+    crosses a cell boundary. Range queries visit the cells overlapping the
+    query circle and compare squared distances, without any square root.
+
+    Attributes:
+        cell_size (int): Width and height of a cell in pixels
+    """
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size (int): Cell size in pixels, ideally close to the
+                largest query radius (vision range)
+        """
+        self.cell_size = cell_size
+        self._cells = {}    # (cx, cy) -> {kind: set(entity)}
+        self._entries = {}  # entity -> (kind, cell)
+        self._by_kind = {}  # kind -> set(entity)
+
+    def _cell_of(self, position):
+        return (int(position[0] // self.cell_size), int(position[1] // self.cell_size))
+
+    # ========================================================================
+    # INDEX MAINTENANCE
+    # ========================================================================
+
+    def insert(self, entity, kind):
+        """
+        Add an entity to the grid and attach the grid to it.
+
+        Args:
+            entity: Object with a ``position`` (x, y) and a ``grid`` attribute
+            kind (str): Entity kind (KIND_CHARACTER, KIND_ENEMY, ...)
+        """
+        if entity in self._entries:
+            self.remove(entity)
+        cell = self._cell_of(entity.position)
+        self._cells.setdefault(cell, {}).setdefault(kind, set()).add(entity)
+        self._entries[entity] = (kind, cell)
+        self._by_kind.setdefault(kind, set()).add(entity)
+        entity.grid = self
+
+    def remove(self, entity):
+        """
+        Remove an entity from the grid.
+
+        Args:
+            entity: Entity previously inserted
+        """
+        entry = self._entries.pop(entity, None)
+        if entry is None:
+            return
+        kind, cell = entry
+        self._discard(entity, kind, cell)
+        self._by_kind[kind].discard(entity)
+        entity.grid = None
+
+    def update(self, entity):
+        """
+        Re-bucket an entity after it moved; O(1) and a no-op inside a cell.
+
+        Args:
+            entity: Entity previously inserted
+        """
+        entry = self._entries.get(entity)
+        if entry is None:
+            return
+        kind, old_cell = entry
+        cell = self._cell_of(entity.position)
+        if cell == old_cell:
+            return
+        self._discard(entity, kind, old_cell)
+        self._cells.setdefault(cell, {}).setdefault(kind, set()).add(entity)
+        self._entries[entity] = (kind, cell)
+
+    def _discard(self, entity, kind, cell):
+        buckets = self._cells.get(cell)
+        if buckets is None:
+            return
+        bucket = buckets.get(kind)
+        if bucket is not None:
+            bucket.discard(entity)
+            if not bucket:
+                del buckets[kind]
+        if not buckets:
+            del self._cells[cell]
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def entities(self, kind):
+        """
+        Get every entity of a kind.
+
+        Args:
+            kind (str): Entity kind
+
+        Returns:
+            set: Entities of that kind (do not modify)
+        """
+        return self._by_kind.get(kind, set())
+
+    def query_radius(self, position, radius, kind=None):
+        """
+        Get the entities within ``radius`` of ``position``.
+
+        Args:
+            position (tuple): Query center (x, y)
+            radius (float): Query radius in pixels
+            kind (str): Only return entities of this kind (default: all)
+
+        Returns:
+            list: Entities whose position is inside the circle
+        """
+        x, y = position
+        radius_sq = radius * radius
+        size = self.cell_size
+        min_cx, max_cx = int((x - radius) // size), int((x + radius) // size)
+        min_cy, max_cy = int((y - radius) // size), int((y + radius) // size)
+        cells = self._cells
+        found = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                buckets = cells.get((cx, cy))
+                if buckets is None:
+                    continue
+                if kind is None:
+                    candidates = [e for bucket in buckets.values() for e in bucket]
+                else:
+                    candidates = buckets.get(kind, ())
+                for entity in candidates:
+                    ex, ey = entity.position
+                    dx = ex - x
+                    dy = ey - y
+                    if dx * dx + dy * dy <= radius_sq:
+                        found.append(entity)
+        return found
+
+    def nearest(self, position, radius, kind=None):
+        """
+        Get the closest entity within ``radius`` of ``position``.
+
+        Args:
+            position (tuple): Query center (x, y)
+            radius (float): Maximum distance in pixels
+            kind (str): Only consider entities of this kind (default: all)
+
+        Returns:
+            object: Closest entity, or None if nothing is in range
+        """
+        x, y = position
+        best = None
+        best_sq = radius * radius
+        for entity in self.query_radius(position, radius, kind):
+            ex, ey = entity.position
+            dist_sq = (ex - x) * (ex - x) + (ey - y) * (ey - y)
+            if dist_sq <= best_sq:
+                best = entity
+                best_sq = dist_sq
+        return best
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, entity):
+        return entity in self._entries
@@ -0,0 +1,99 @@
+import itertools
+import queue
+import threading
+
+from game.characters import get_character_type
+from ui.console import print_warning
+
+PRIORITY_SELECTED = 0    # characters picked in the menu (character_1..3)
+PRIORITY_BACKGROUND = 10  # every other character, streamed when idle
+
+CHARACTER_NUMBERS = range(1, 10)
+
+
+class SpriteLoader:
+    """
+    Background loader streaming the non-idle character sheets.
+
+    CharacterType only loads its idle sheet; this loader finishes the skill,
+    effect, hurt and dead sheets in a daemon thread, in priority order.
+    The menu pushes the characters currently selected with
+    PRIORITY_SELECTED so they are loaded first, and ensure_resident
+    completes them synchronously before the game starts.
+
+    Attributes:
+        loaded (set): Character numbers fully resident
+    """
+
+    def __init__(self):
+        self._queue = queue.PriorityQueue()
+        self._order = itertools.count()  # FIFO between equal priorities
+        self._thread = None
+        self._running = False
+        self.loaded = set()
+
+    def start(self, char_numbers=CHARACTER_NUMBERS):
+        """
+        Start the worker thread and queue every character in background.
+
+        Args:
+            char_numbers (iterable): Characters to stream
+        """
+        for char_number in char_numbers:
+            self.request(char_number, PRIORITY_BACKGROUND)
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the worker thread after the current sheet."""
+        self._running = False
+        self._queue.put((-1, next(self._order), None))
+
+    def request(self, char_number, priority=PRIORITY_BACKGROUND):
+        """
+        Queue a character for full loading.
+
+        Args:
+            char_number (int): Character number (Character-N folder)
+            priority (int): Lower values are loaded first
+        """
+        if char_number and char_number not in self.loaded:
+            self._queue.put((priority, next(self._order), char_number))
+
+    def prioritize(self, char_numbers):
+        """Move the given characters (menu selection) to the front of the queue."""
+        for char_number in char_numbers:
+            self.request(char_number, PRIORITY_SELECTED)
+
+    def ensure_resident(self, char_numbers):
+        """
+        Load the given characters completely on the calling thread.
+        Sheets already loaded by the worker are skipped.
+
+        Args:
+            char_numbers (iterable): Characters that must be resident
+        """
+        for char_number in char_numbers:
+            self._load(char_number)
+
+    def _load(self, char_number):
+        if not char_number or char_number in self.loaded:
+            return
+        try:
+            get_character_type(char_number).load_all()
+        except FileNotFoundError:
+            # No sprites for this character (selection icon only)
+            pass
+        self.loaded.add(char_number)
+
+    def _run(self):
+        while self._running:
+            _, _, char_number = self._queue.get()
+            if char_number is None:
+                continue
+            try:
+                self._load(char_number)
+            except Exception as e:
+                print_warning(f"SpriteLoader: Character-{char_number} non chargé: {e}")
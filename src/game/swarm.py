@@ -0,0 +1,286 @@
+import numpy as np
+
+from game.enemy import (
+    ENEMY_ATTACK_RANGE,
+    ENEMY_BASE_DAMAGE,
+    ENEMY_BASE_HEALTH,
+    ENEMY_BASE_SPEED,
+    ENEMY_VISION_RANGE,
+)
+
+STATE_IDLE = 0
+STATE_CHASE = 1
+STATE_DEATH = 2
+STATE_NAMES = ("IDLE", "CHASE", "DEATH")
+
+FACING_LEFT = -1
+FACING_RIGHT = 1
+
+DEFAULT_CAPACITY = 1024
+
+
+class EnemySwarm:
+    """
+    Struct-of-arrays container for horde modes.
+
+    Every enemy is a row index into NumPy arrays (positions, health, speed,
+    damage, state, facing). ``update`` runs vision, chase, attack and death
+    checks for the whole swarm as batched array operations, reproducing
+    Enemy.update: chase the closest visible player axis by axis, then attack
+    if in range. ``swarm[i]`` returns an EnemyView exposing the Enemy API
+    (position, health, state, get_status, take_damage).
+
+    Attributes:
+        count (int): Number of spawned enemies (alive or dead)
+        positions (numpy.ndarray): (capacity, 2) float positions
+        health (numpy.ndarray): Health points
+        speed (numpy.ndarray): Movement speed in pixels per tick
+        damage (numpy.ndarray): Damage dealt per attack
+        state (numpy.ndarray): STATE_IDLE / STATE_CHASE / STATE_DEATH
+        facing (numpy.ndarray): FACING_LEFT / FACING_RIGHT
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Preallocate the arrays.
+
+        Args:
+            capacity (int): Initial number of enemy slots (grows by doubling)
+        """
+        self.count = 0
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity):
+        old = self.count
+        positions = np.zeros((capacity, 2), dtype=np.float64)
+        health = np.zeros(capacity, dtype=np.float64)
+        speed = np.zeros(capacity, dtype=np.float64)
+        damage = np.zeros(capacity, dtype=np.float64)
+        state = np.full(capacity, STATE_IDLE, dtype=np.int8)
+        facing = np.full(capacity, FACING_RIGHT, dtype=np.int8)
+        if old:
+            positions[:old] = self.positions[:old]
+            health[:old] = self.health[:old]
+            speed[:old] = self.speed[:old]
+            damage[:old] = self.damage[:old]
+            state[:old] = self.state[:old]
+            facing[:old] = self.facing[:old]
+        self.positions = positions
+        self.health = health
+        self.speed = speed
+        self.damage = damage
+        self.state = state
+        self.facing = facing
+
+    # ========================================================================
+    # SPAWNING
+    # ========================================================================
+
+    def spawn(self, x=0, y=0, health=ENEMY_BASE_HEALTH, speed=ENEMY_BASE_SPEED):
+        """
+        Add one enemy.
+
+        Args:
+            x (float): Initial X position
+            y (float): Initial Y position
+            health (float): Initial health
+            speed (float): Movement speed
+
+        Returns:
+            int: Index of the new enemy
+        """
+        return self.spawn_many([x], [y], health, speed)[0]
+
+    def spawn_many(self, xs, ys, health=ENEMY_BASE_HEALTH, speed=ENEMY_BASE_SPEED):
+        """
+        Add a batch of enemies.
+
+        Args:
+            xs (array-like): X positions
+            ys (array-like): Y positions
+            health (float | array-like): Initial health
+            speed (float | array-like): Movement speed
+
+        Returns:
+            range: Indices of the new enemies
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        n = len(xs)
+        start, end = self.count, self.count + n
+        if end > len(self.health):
+            capacity = len(self.health)
+            while capacity < end:
+                capacity *= 2
+            self._allocate(capacity)
+        self.positions[start:end, 0] = xs
+        self.positions[start:end, 1] = ys
+        self.health[start:end] = health
+        self.speed[start:end] = speed
+        self.damage[start:end] = ENEMY_BASE_DAMAGE
+        self.state[start:end] = STATE_IDLE
+        self.facing[start:end] = FACING_RIGHT
+        self.count = end
+        return range(start, end)
+
+    # ========================================================================
+    # BATCHED SIMULATION
+    # ========================================================================
+
+    def update(self, players, pathfinder=None):
+        """
+        Run one AI tick for the whole swarm.
+
+        Args:
+            players (list): Characters exposing ``position`` and ``take_damage``
+            pathfinder (PathFinder): Chase along the players' flow fields,
+                around obstacles; None walks straight at them
+
+        Returns:
+            numpy.ndarray: Indices of the enemies that attacked this tick
+        """
+        n = self.count
+        if n == 0 or not players:
+            self.state[:n][self.state[:n] != STATE_DEATH] = STATE_IDLE
+            return np.empty(0, dtype=np.intp)
+
+        positions = self.positions[:n]
+        state = self.state[:n]
+        alive = state != STATE_DEATH
+        targets = np.array([p.position for p in players], dtype=np.float64)
+
+        # VISION: closest player per enemy, squared distances only
+        delta = targets[None, :, :] - positions[:, None, :]
+        dist_sq = np.einsum("ijk,ijk->ij", delta, delta)
+        nearest = dist_sq.argmin(axis=1)
+        nearest_sq = dist_sq[np.arange(n), nearest]
+        chasing = alive & (nearest_sq <= ENEMY_VISION_RANGE * ENEMY_VISION_RANGE)
+        state[alive] = STATE_IDLE
+        state[chasing] = STATE_CHASE
+
+        # CHASE: one step per axis toward the target, like Enemy.chase_target
+        to_target = targets[nearest] - positions
+        direction = np.sign(to_target)
+        if pathfinder is not None:
+            # One shared flow field per chased player
+            for p in np.unique(nearest[chasing]).tolist():
+                chasers = np.flatnonzero(chasing & (nearest == p))
+                moves, covered = pathfinder.flow_field(players[p].position).steps(
+                    positions[chasers]
+                )
+                direction[chasers[covered]] = moves[covered]
+        step = direction * self.speed[:n, None]
+        positions[chasing] += step[chasing]
+        moved_x = chasing & (direction[:, 0] != 0)
+        self.facing[:n][moved_x] = np.where(
+            direction[moved_x, 0] > 0, FACING_RIGHT, FACING_LEFT
+        )
+
+        # ATTACK: distance after the chase step, like Enemy.attack
+        after = targets[nearest] - positions
+        after_sq = np.einsum("ij,ij->i", after, after)
+        attackers = np.flatnonzero(
+            chasing & (after_sq <= ENEMY_ATTACK_RANGE * ENEMY_ATTACK_RANGE)
+        )
+        if len(attackers):
+            # One take_damage call per player with the summed damage
+            totals = np.bincount(
+                nearest[attackers],
+                weights=self.damage[attackers],
+                minlength=len(players),
+            )
+            for player, amount in zip(players, totals):
+                if amount:
+                    player.take_damage(amount)
+        return attackers
+
+    def take_damage(self, indices, amount):
+        """
+        Damage one or several enemies and run the death check.
+
+        Args:
+            indices (int | array-like): Enemy indices
+            amount (float | array-like): Damage per enemy
+        """
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.intp))
+        np.subtract.at(self.health, indices, amount)
+        hit = self.health[indices]
+        dead = indices[hit <= 0]
+        self.state[dead] = STATE_DEATH
+
+    def alive_count(self):
+        """Number of enemies not in the DEATH state."""
+        return int(np.count_nonzero(self.state[: self.count] != STATE_DEATH))
+
+    # ========================================================================
+    # COMPATIBILITY VIEW
+    # ========================================================================
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not -self.count <= index < self.count:
+            raise IndexError("enemy index out of range")
+        return EnemyView(self, index % self.count)
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield EnemyView(self, index)
+
+
+class EnemyView:
+    """
+    Enemy-like view on one row of an EnemySwarm.
+
+    Reads and writes go straight to the swarm arrays, so code written for
+    Enemy (get_status, take_damage, position, state) keeps working.
+    """
+
+    __slots__ = ("swarm", "index")
+
+    def __init__(self, swarm, index):
+        self.swarm = swarm
+        self.index = index
+
+    @property
+    def position(self):
+        x, y = self.swarm.positions[self.index]
+        return (float(x), float(y))
+
+    @position.setter
+    def position(self, value):
+        self.swarm.positions[self.index] = value
+
+    @property
+    def health(self):
+        return float(self.swarm.health[self.index])
+
+    @property
+    def speed(self):
+        return float(self.swarm.speed[self.index])
+
+    @property
+    def damage(self):
+        return float(self.swarm.damage[self.index])
+
+    @property
+    def state(self):
+        return STATE_NAMES[self.swarm.state[self.index]]
+
+    @property
+    def direction(self):
+        return "left" if self.swarm.facing[self.index] == FACING_LEFT else "right"
+
+    def take_damage(self, amount):
+        self.swarm.take_damage(self.index, amount)
+
+    def death(self):
+        self.swarm.state[self.index] = STATE_DEATH
+
+    def get_status(self):
+        """Same dictionary as Enemy.get_status."""
+        return {
+            "health": self.health,
+            "position": self.position,
+            "state": self.state,
+        }
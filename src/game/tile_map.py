@@ -0,0 +1,422 @@
+import base64
+import json
+import os
+import sys
+import zlib
+from array import array
+
+import pygame as pyg
+
+from game.chunked_map import CHUNK_CACHE_SIZE, CHUNK_SIZE, ChunkedMap
+from utils.display_format import display_ready
+
+TILE_SIZE = 16
+TILE_EMPTY = 0  # tile id of an empty cell; tileset tiles are numbered from 1
+TILE_MAP_DESCRIPTOR = "map.json"
+TILESET_IMAGE = "tileset.png"
+
+
+class Tileset:
+    """
+    Tiles cut from a tileset image, numbered from 1 in reading order.
+
+    Attributes:
+        tile_size (int): Tile width and height in pixels, after scaling
+        tiles (list): Tile surfaces; tile id N is tiles[N - 1]
+        solid (frozenset): Ids of the tiles that block movement
+    """
+
+    def __init__(self, tiles, tile_size, solid=()):
+        self.tiles = tiles
+        self.tile_size = tile_size
+        self.solid = frozenset(solid)
+
+    @classmethod
+    def load(cls, path, tile_size, count=None, solid=(), scale=1):
+        """
+        Cut a tileset image.
+
+        Args:
+            path (str): Tileset image path
+            tile_size (int): Tile width and height in the image
+            count (int): Number of tiles (default: every cell of the image)
+            solid (iterable): Ids of the blocking tiles
+            scale (int): Integer scale applied once to every tile
+
+        Returns:
+            Tileset: The tiles, in the display format when a display exists
+        """
+        image = pyg.image.load(path)
+        columns = image.get_width() // tile_size
+        rows = image.get_height() // tile_size
+        count = columns * rows if count is None else count
+        size = tile_size * scale
+        tiles = []
+        for i in range(count):
+            tile = image.subsurface(
+                ((i % columns) * tile_size, (i // columns) * tile_size, tile_size, tile_size)
+            )
+            if scale != 1:
+                tile = pyg.transform.scale(tile, (size, size))
+            if display_ready():
+                tile = tile.convert_alpha()
+            tiles.append(tile)
+        return cls(tiles, size, solid)
+
+    def image(self, columns=16):
+        """Tiles laid out on a single surface, *columns* tiles per row."""
+        size = self.tile_size
+        rows = -(-len(self.tiles) // columns)
+        sheet = pyg.Surface((columns * size, max(rows, 1) * size), pyg.SRCALPHA)
+        sheet.blits(
+            [
+                (tile, ((i % columns) * size, (i // columns) * size))
+                for i, tile in enumerate(self.tiles)
+            ],
+            doreturn=False,
+        )
+        return sheet
+
+
+class WalkGrid:
+    """
+    Bit-packed walkability grid, one bit per tile (1 = blocked).
+
+    A 1024 x 1024 tile map fits in 128 KB; cells outside the map are
+    blocked.
+
+    Attributes:
+        width (int): Columns, in tiles
+        height (int): Rows, in tiles
+        tile_size (int): Tile size in pixels, for the pixel queries
+    """
+
+    __slots__ = ("width", "height", "tile_size", "bits")
+
+    def __init__(self, width, height, tile_size, bits=None):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.bits = bits if bits is not None else bytearray((width * height + 7) // 8)
+
+    @property
+    def nbytes(self):
+        return len(self.bits)
+
+    def set_blocked(self, tx, ty, blocked=True):
+        """Mark tile (tx, ty) as blocked or walkable."""
+        index = ty * self.width + tx
+        if blocked:
+            self.bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def walkable(self, tx, ty):
+        """True if tile (tx, ty) is inside the map and not blocked."""
+        if not (0 <= tx < self.width and 0 <= ty < self.height):
+            return False
+        index = ty * self.width + tx
+        return not self.bits[index >> 3] & (1 << (index & 7))
+
+    def walkable_at(self, x, y):
+        """True if the world pixel (x, y) is on a walkable tile."""
+        return self.walkable(int(x) // self.tile_size, int(y) // self.tile_size)
+
+    def rect_walkable(self, rect):
+        """True if every tile covered by *rect* (world pixels) is walkable."""
+        size = self.tile_size
+        for ty in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for tx in range(rect.left // size, (rect.right - 1) // size + 1):
+                if not self.walkable(tx, ty):
+                    return False
+        return True
+
+
+class TileMap:
+    """
+    Map made of tile ids referencing a Tileset.
+
+    Each layer is a flat row-major ``array('H')`` of tile ids (2 bytes per
+    cell). Layers are rendered chunk by chunk for ChunkedMap (``chunked``),
+    and the solid tiles of every layer give the WalkGrid used for collision
+    and pathfinding (``walk_grid``).
+
+    Attributes:
+        width (int): Columns, in tiles
+        height (int): Rows, in tiles
+        tileset (Tileset): Tiles referenced by the layers
+        layers (dict): Layer name -> array('H') of width * height tile ids
+        alpha (dict): Layer name -> True if the layer is drawn over others
+    """
+
+    def __init__(self, width, height, tileset, layers, alpha=None):
+        self.width = width
+        self.height = height
+        self.tileset = tileset
+        self.layers = layers
+        self.alpha = alpha or {name: True for name in layers}
+
+    @property
+    def tile_size(self):
+        return self.tileset.tile_size
+
+    @property
+    def pixel_size(self):
+        """(width, height) of the map in pixels."""
+        return (self.width * self.tile_size, self.height * self.tile_size)
+
+    def tile(self, name, tx, ty):
+        """Tile id of layer *name* at (tx, ty)."""
+        return self.layers[name][ty * self.width + tx]
+
+    # ========================================================================
+    # RENDERING
+    # ========================================================================
+
+    def render_chunk(self, name, cx, cy, chunk_size=CHUNK_SIZE):
+        """
+        Draw the tiles of one chunk of a layer.
+
+        Args:
+            name (str): Layer name
+            cx (int): Chunk column
+            cy (int): Chunk row
+            chunk_size (int): Chunk size in pixels, a multiple of the tile size
+
+        Returns:
+            pygame.Surface: The chunk, or None if it holds no tile
+        """
+        size = self.tile_size
+        per_chunk = chunk_size // size
+        data = self.layers[name]
+        tiles = self.tileset.tiles
+        tx0, ty0 = cx * per_chunk, cy * per_chunk
+        tx1, ty1 = min(tx0 + per_chunk, self.width), min(ty0 + per_chunk, self.height)
+        batch = []
+        for ty in range(ty0, ty1):
+            row = ty * self.width
+            y = (ty - ty0) * size
+            for tx in range(tx0, tx1):
+                tile_id = data[row + tx]
+                if tile_id != TILE_EMPTY:
+                    batch.append((tiles[tile_id - 1], ((tx - tx0) * size, y)))
+        if not batch:
+            return None
+        chunk_w, chunk_h = (tx1 - tx0) * size, (ty1 - ty0) * size
+        if self.alpha.get(name, True):
+            chunk = pyg.Surface((chunk_w, chunk_h), pyg.SRCALPHA)
+        else:
+            chunk = pyg.Surface((chunk_w, chunk_h))
+        chunk.blits(batch, doreturn=False)
+        if display_ready():
+            chunk = chunk.convert_alpha() if self.alpha.get(name, True) else chunk.convert()
+        return chunk
+
+    def chunked(self, name, chunk_size=CHUNK_SIZE, capacity=CHUNK_CACHE_SIZE):
+        """
+        Layer as a ChunkedMap whose chunks are rendered from the tiles.
+
+        Args:
+            name (str): Layer name
+            chunk_size (int): Chunk size in pixels, a multiple of the tile size
+            capacity (int): Chunks kept in memory
+
+        Returns:
+            ChunkedMap: Drawable layer
+        """
+        if chunk_size % self.tile_size:
+            raise ValueError(f"chunk_size {chunk_size} is not a multiple of {self.tile_size}")
+        return ChunkedMap(
+            self.pixel_size,
+            lambda cx, cy: self.render_chunk(name, cx, cy, chunk_size),
+            chunk_size,
+            capacity,
+        )
+
+    # ========================================================================
+    # COLLISION
+    # ========================================================================
+
+    def walk_grid(self):
+        """
+        Walkability of every cell: blocked if any layer holds a solid tile.
+
+        Returns:
+            WalkGrid: Bit-packed grid
+        """
+        grid = WalkGrid(self.width, self.height, self.tile_size)
+        solid = self.tileset.solid
+        if not solid:
+            return grid
+        # Each layer becomes a string of binary digits (b"1" = solid) read
+        # as one integer whose bit i is cell i, so the lookups, the packing
+        # and the union of the layers all run in C: the low byte of the ids
+        # goes through a translate table per high byte value in use
+        blocked = 0
+        for data in self.layers.values():
+            raw = array("H", data)
+            if sys.byteorder != "little":
+                raw.byteswap()
+            raw = raw.tobytes()
+            low, high = raw[0::2], raw[1::2]
+            for page in {tile_id >> 8 for tile_id in solid}:
+                low_table = bytes(
+                    0x31 if (page << 8) | low_id in solid else 0x30 for low_id in range(256)
+                )
+                cells = int(low.translate(low_table)[::-1], 2)
+                high_table = bytes(0x31 if high_id == page else 0x30 for high_id in range(256))
+                blocked |= cells & int(high.translate(high_table)[::-1], 2)
+        grid.bits[:] = blocked.to_bytes(len(grid.bits), "little")
+        return grid
+
+
+# ============================================================================
+# DESCRIPTOR FORMAT
+# ============================================================================
+#
+#   <map>/map.json     {"size": [columns, rows], "tile_size": 16,
+#                       "tileset": {"image": "tileset.png", "count": N,
+#                                   "solid": [ids]},
+#                       "layers": {"back": {"alpha": false,
+#                                           "encoding": "base64",
+#                                           "compression": "zlib",
+#                                           "data": "..."}, ...}}
+#   <map>/tileset.png  tiles in reading order, 16 per row
+#
+# "data" holds the little-endian uint16 tile ids of the layer, row-major;
+# it may also be a plain JSON list of ids (no encoding / compression).
+
+
+def _encode_layer(data):
+    raw = array("H", data)
+    if raw.itemsize != 2:
+        raise ValueError("array('H') must be 16 bits")
+    if sys.byteorder != "little":
+        raw.byteswap()
+    return base64.b64encode(zlib.compress(raw.tobytes(), 9)).decode("ascii")
+
+
+def _decode_layer(layer, cells):
+    data = layer["data"]
+    if isinstance(data, list):
+        decoded = array("H", data)
+    else:
+        raw = base64.b64decode(data)
+        if layer.get("compression") == "zlib":
+            raw = zlib.decompress(raw)
+        decoded = array("H")
+        decoded.frombytes(raw)
+        if sys.byteorder != "little":
+            decoded.byteswap()
+    if len(decoded) != cells:
+        raise ValueError(f"layer has {len(decoded)} tiles, {cells} expected")
+    return decoded
+
+
+def load_tile_map(path, scale=1):
+    """
+    Load a tile map directory.
+
+    Args:
+        path (str): Directory holding map.json and the tileset image
+        scale (int): Integer scale applied to the tiles
+
+    Returns:
+        TileMap: The map
+    """
+    with open(os.path.join(path, TILE_MAP_DESCRIPTOR), encoding="utf-8") as f:
+        descriptor = json.load(f)
+    columns, rows = descriptor["size"]
+    tileset_info = descriptor["tileset"]
+    tileset = Tileset.load(
+        os.path.join(path, tileset_info["image"]),
+        descriptor["tile_size"],
+        tileset_info.get("count"),
+        tileset_info.get("solid", ()),
+        scale,
+    )
+    layers = {}
+    alpha = {}
+    for name, layer in descriptor["layers"].items():
+        layers[name] = _decode_layer(layer, columns * rows)
+        alpha[name] = layer.get("alpha", True)
+    return TileMap(columns, rows, tileset, layers, alpha)
+
+
+def save_tile_map(path, tile_map):
+    """
+    Write a tile map directory (map.json + tileset.png).
+
+    Args:
+        path (str): Output directory
+        tile_map (TileMap): Map to write (unscaled tileset)
+    """
+    os.makedirs(path, exist_ok=True)
+    tileset = tile_map.tileset
+    pyg.image.save(tileset.image(), os.path.join(path, TILESET_IMAGE))
+    descriptor = {
+        "size": [tile_map.width, tile_map.height],
+        "tile_size": tileset.tile_size,
+        "tileset": {
+            "image": TILESET_IMAGE,
+            "count": len(tileset.tiles),
+            "solid": sorted(tileset.solid),
+        },
+        "layers": {
+            name: {
+                "alpha": tile_map.alpha.get(name, True),
+                "encoding": "base64",
+                "compression": "zlib",
+                "data": _encode_layer(data),
+            }
+            for name, data in tile_map.layers.items()
+        },
+    }
+    with open(os.path.join(path, TILE_MAP_DESCRIPTOR), "w", encoding="utf-8") as f:
+        json.dump(descriptor, f, indent=2)
+
+
+def tile_map_from_images(layers, tile_size=TILE_SIZE, solid_layer=None):
+    """
+    Convert whole-map images into a tile map, de-duplicating identical tiles.
+
+    Images are padded with transparent pixels up to a multiple of the tile
+    size. Solidity is per tile id, so the solid layer's tiles are never
+    shared with the other layers: a back tile identical to a wall stays
+    walkable.
+
+    Args:
+        layers (dict): Layer name -> (surface, alpha), all the same size
+        tile_size (int): Tile size in pixels
+        solid_layer (str): Layer whose non-empty tiles block movement
+
+    Returns:
+        TileMap: The map, its tileset holding each distinct tile once
+    """
+    first = next(iter(layers.values()))[0]
+    columns = -(-first.get_width() // tile_size)
+    rows = -(-first.get_height() // tile_size)
+    tiles = []
+    ids = {}  # (solid, tile pixels) -> tile id
+    solid = set()
+    tile_layers = {}
+    for name, (surface, alpha) in layers.items():
+        padded = pyg.Surface((columns * tile_size, rows * tile_size), pyg.SRCALPHA)
+        padded.blit(surface, (0, 0))
+        data = array("H", bytes(2 * columns * rows))
+        for ty in range(rows):
+            for tx in range(columns):
+                tile = padded.subsurface((tx * tile_size, ty * tile_size, tile_size, tile_size))
+                if alpha and tile.get_bounding_rect().width == 0:
+                    continue
+                key = (name == solid_layer, pyg.image.tobytes(tile, "RGBA"))
+                tile_id = ids.get(key)
+                if tile_id is None:
+                    tiles.append(tile.copy())
+                    tile_id = ids[key] = len(tiles)
+                    if key[0]:
+                        solid.add(tile_id)
+                data[ty * columns + tx] = tile_id
+        tile_layers[name] = data
+    alpha = {name: layer_alpha for name, (_, layer_alpha) in layers.items()}
+    return TileMap(columns, rows, Tileset(tiles, tile_size, solid), tile_layers, alpha)
@@ -10,7 +10,15 @@ import game.characters as player_module
 import ui.menu as menu
 import ui.Music as music_module
 import utils.paths as __path__
+from game.camera import Camera
+from game.chunked_map import ChunkedMap
+from game.collision import CollisionWorld
 from game.map_laoder import MapLoader
+from game.projectiles import PROJECTILE_DAMAGE, ProjectilePool
+from game.scene import SCENE_LAYER_EFFECTS, Scene
+from game.spatial import KIND_CHARACTER, KIND_ENEMY, KIND_ITEM
+from ui.backgrounds import BackgroundLayers
+from ui.bots import INPUT_PREFIX, SKILLS
 from ui.console import (
     print_error,
     print_info,
@@ -18,6 +26,18 @@ from ui.console import (
     print_success,
     print_warning,
 )
+from ui.input_dispatcher import InputDispatcher
+from ui.render_queue import (
+    LAYER_BACKGROUND,
+    LAYER_ENTITIES,
+    LAYER_FOREGROUND,
+    LAYER_NAMES,
+    LAYER_OVERLAY,
+    RenderQueue,
+)
+from ui.text_cache import BitmapFont, TextCache
+from utils.display_format import convert_pending, expect_display
+from utils.layer_cache import LayerCache
 
 MESSAGE_DELIMITER = '\n'
 
@@ -34,6 +54,7 @@ class Game:
         self.game_started = False
         self.dev_display_ = False
         self.delta_time_sessions_send = 0
+        expect_display()
         self.Menu = menu.Menu(
             width=self.width, height=self.height, fullscreen=self.fullscreen
         )
@@ -41,8 +62,10 @@ class Game:
         try:
             # Reuse menu's pygame resources (screen, clock, font, colors)
             self.screen = self.Menu.screen
-            self.wallpaper = self.Menu.wallpaper
+            self.backgrounds = self.Menu.backgrounds
             self.clock = self.Menu.clock
+            self.text_cache = self.Menu.text_cache
+            self.render_queue = self.Menu.render_queue
             try:
                 self.font = self.Menu.font
                 self.TEXT_COL = self.Menu.TEXT_COL
@@ -56,19 +79,76 @@ class Game:
             # Minimal fallback if Menu initialization fails
             flags = pyg.FULLSCREEN if self.fullscreen else 0
             self.screen = pyg.display.set_mode((self.width, self.height), flags)
-            self.wallpaper = pyg.Surface((self.width, self.height))
+            convert_pending()
+            self.backgrounds = BackgroundLayers((self.width, self.height), cache=LayerCache())
+            self.backgrounds.register("wallpaper", pyg.Surface((self.width, self.height)))
             self.clock = pyg.time.Clock()
-
-        # LOAD GAME MAP
+            self.text_cache = TextCache()
+            self.render_queue = RenderQueue()
+            self.font = pyg.font.SysFont("arialblack", 40)
+            self.TEXT_COL = (255, 255, 255)
+            self.TEXT_COL2 = (255, 0, 0)
+
+        # Glyph font for the numbers of the dev display
+        self.dev_font = BitmapFont(self.font, self.TEXT_COL2)
+        self.bg_layer = self.render_queue.layer(LAYER_BACKGROUND)
+        self.entity_layer = self.render_queue.layer(LAYER_ENTITIES)
+        self.fg_layer = self.render_queue.layer(LAYER_FOREGROUND)
+        self.overlay_layer = self.render_queue.layer(LAYER_OVERLAY)
+
+        # LOAD GAME MAP: layers registered by path, read back already scaled
+        # from the layer cache when this resolution was seen before
+        map_start = time.perf_counter()
         map_loader = MapLoader(None)
-        background, foreground = map_loader.load_map()
-        self.map_back = pyg.transform.scale(background, (self.width, self.height))
-        self.map_front = pyg.transform.scale(foreground, (self.width, self.height))
+        self.backgrounds.register("map_back", map_loader.map_path_back, alpha=False)
+        self.backgrounds.register("map_front", map_loader.map_path_fore)
+        # Map layers drawn through the camera, chunk by chunk
+        self.camera = Camera((self.width, self.height))
+        self.map_layers = {}
+        self._build_map_layers()
+        self.map_stage_ms = (time.perf_counter() - map_start) * 1000
+        cache = self.backgrounds.cache
+        print_info(
+            f"Map stage: {self.map_stage_ms:.1f} ms"
+            + (f" (layer cache: {cache.hits} hit(s), {cache.misses} miss(es))" if cache else "")
+        )
+
+        # INPUT: one event pump per frame, dispatched to subscriptions
+        self.input = InputDispatcher()
+        self.input.subscribe(pyg.QUIT, self._on_quit)
+        self.input.subscribe_key(pyg.K_ESCAPE, self._on_escape)
+        self.input.subscribe_key(pyg.K_F2, self._on_toggle_dev_display)
+        self.input.subscribe_mouse(4, self._on_scroll_up)  # MOUSE UP
+        self.input.subscribe_mouse(5, self._on_scroll_down)  # MOUSE down
+        self.input.subscribe_text(self._on_text_input)
 
         # LOAD PLAYER CHARACTER
         self.player = player_module.Water()
         self.running = False 
 
+        # SCENE: players, enemies, effects and items, y-sorted and culled
+        self.scene = Scene(self.camera.rect)
+        self.scene.add_entity(self.player)
+        self.scene.add_entity(
+            self.player, SCENE_LAYER_EFFECTS, lambda player: player.get_effect_sprite(),
+            centered=True,
+        )
+
+        # COLLISIONS: persistent hitboxes, checked once per frame
+        self.collisions = CollisionWorld()
+        self.collisions.add(self.player, KIND_CHARACTER)
+        self.collisions.add_rule(KIND_ENEMY, KIND_CHARACTER)
+        self.collisions.add_rule(KIND_CHARACTER, KIND_ITEM)
+
+        # PROJECTILES: pooled skill effects, updated and drawn in batch,
+        # hit-tested against the enemy hitboxes of the collision world
+        self.projectiles = ProjectilePool()
+        self.projectile_hits = 0
+
+        # REMOTE PLAYERS: player id -> [character, reported position],
+        # driven by the [PlayerInput] relayed by the server (session bots)
+        self.remote_players = {}
+
         # NETWORK CONFIGURATION
         # self.host = "127.0.0.1"
         # self.port = 12345
@@ -109,14 +189,57 @@ class Game:
         else:
             self.current_music+=1
 
+    # INPUT HANDLERS
+
+    def _leave_joined_session(self):
+        if self.current_joined_session:
+            self.send_to_server(f"[LeaveSession]:{self.current_joined_session}")
+            self.current_joined_session = None
+
+    def _on_quit(self, event):
+        if self.etat == "menu":
+            self._leave_joined_session()
+        self.running = False
+        return True
+
+    def _on_escape(self, event):
+        if self.etat == "menu":
+            self._leave_joined_session()
+            self.running = False
+        elif self.etat == "game":
+            self.running = False
+            self.send_to_server(message="ESC appuyé")
+        return True
+
+    def _on_toggle_dev_display(self, event):
+        self.dev_display_ = not self.dev_display_
+        return True
+
+    def _on_scroll_up(self, event):
+        if self.etat == "menu":
+            self.Menu.scroll_y = max(0, self.Menu.scroll_y - 30)
+            return True
+        return False
+
+    def _on_scroll_down(self, event):
+        if self.etat == "menu":
+            self.Menu.scroll_y += 30
+            return True
+        return False
+
+    def _on_text_input(self, event):
+        if self.etat == "menu" and self.Menu.menu_state == "creation_parameters_session_menu":
+            return self.Menu.input_box.handle_event(event)
+        return False
+
     def draw_text(self, text, font, text_col, x, y):
-        img = font.render(text, True, text_col)
-        self.screen.blit(img, (x, y))
+        img = self.text_cache.render(font, text, text_col)
+        self.overlay_layer.blit(img, (x, y))
 
     def draw_text_center(self, text, font, text_col, y):
-        img = font.render(text, True, text_col)
+        img = self.text_cache.render(font, text, text_col)
         x = (self.width - img.get_width()) // 2
-        self.screen.blit(img, (x, y))
+        self.overlay_layer.blit(img, (x, y))
 
     def center_x(self, image, scale=1):
         w = int(image.get_width() * scale)
@@ -175,9 +298,72 @@ class Game:
                     player_id = int(message.split(":", 1)[1])
                     self.Menu.players_characters[player_id] = [None, None, None]
                     self.Menu.players_ready[player_id] = False
+                    self._remove_remote_player(player_id)
                 except Exception as e:
                     print_error(f"Erreur PlayerLeft: {e}")
 
+            elif message.startswith(INPUT_PREFIX):
+                try:
+                    self._apply_remote_input(json.loads(message.split(":", 1)[1]))
+                except Exception as e:
+                    print_error(f"Erreur PlayerInput: {e}")
+
+    # REMOTE PLAYERS
+
+    def _apply_remote_input(self, data):
+        """Apply a [PlayerInput] to the character of its slot."""
+        player_id = data["player_id"]
+        if player_id == self.Menu.my_player_id:
+            return
+        remote = self.remote_players.get(player_id)
+        if remote is None:
+            character = player_module.Water()
+            character.position = tuple(data["position"])
+            self.scene.add_entity(character)
+            self.scene.add_entity(
+                character, SCENE_LAYER_EFFECTS, lambda player: player.get_effect_sprite(),
+                centered=True,
+            )
+            self.collisions.add(character, KIND_CHARACTER)
+            remote = self.remote_players[player_id] = [character, None]
+        character = remote[0]
+        remote[1] = tuple(data["position"])
+
+        # Same skill keys as the local player: 1 is drawn by the scene,
+        # 2 and 3 are fired as projectiles
+        for n, skill in enumerate(SKILLS, 1):
+            if skill in data["keys"] and not getattr(character, f"is_attacking_skill{n}"):
+                setattr(character, f"is_attacking_skill{n}", True)
+                setattr(character, f"frame_character_skill{n}", 0)
+                if n > 1:
+                    self.projectiles.fire_skill(character, n, owner=player_id)
+
+    def _remove_remote_player(self, player_id):
+        remote = self.remote_players.pop(player_id, None)
+        if remote is not None:
+            self.scene.remove_entity(remote[0])
+            self.collisions.remove(remote[0])
+
+    def _update_remote_players(self, delta_time):
+        """Walk each remote character to its reported position."""
+        for character, target in self.remote_players.values():
+            x, y = character.position
+            moving = False
+            for direction, delta in (
+                ("right", target[0] - x), ("left", x - target[0]),
+                ("down", target[1] - y), ("up", y - target[1]),
+            ):
+                if delta >= character.speed:
+                    character.move(direction)
+                    moving = True
+            character.update_animation(
+                delta_time,
+                moving,
+                character.is_attacking_skill1,
+                character.is_attacking_skill2,
+                character.is_attacking_skill3,
+            )
+
     def _connect_to_server(self):
         try:
             # Close existing socket if any
@@ -286,6 +472,7 @@ class Game:
             self.current_joined_session = None
 
         self.running = False
+        self.Menu.sprite_loader.stop()
 
         # Close client socket safely
         with self._client_lock:
@@ -317,11 +504,78 @@ class Game:
 
     # Some dev display
     def dev_display(self, liste_image=None):
-        x, y = pyg.mouse.get_pos()
-        self.draw_text_center(
-            f"pos mouse --> X: {x}, Y: {y}", self.font, self.TEXT_COL2, 10
+        x, y = self.input.snapshot.mouse_pos
+        self.draw_dev_line([("pos mouse --> X: ", x), (", Y: ", y)], 10)
+        self.draw_text_center("text renders", self.font, self.TEXT_COL2, 60)
+        self.draw_dev_line(
+            [
+                ("saved: ", self.text_cache.saved_last_frame),
+                (" rendered: ", self.text_cache.rendered_last_frame),
+            ],
+            110,
+        )
+        self.draw_dev_line(
+            [
+                ("input latency ms: ", self.input.last_latency),
+                (" avg: ", self.input.average_latency),
+            ],
+            160,
+        )
+        # Time spent blitting each layer of the previous frame
+        self.draw_dev_line(
+            [
+                (f" {LAYER_NAMES.get(layer, layer)} ms: ", f"{ms:.2f}")
+                for layer, ms in sorted(self.render_queue.last_timings.items())
+            ]
+            or [("render ms: ", 0)],
+            210,
+        )
+        self.draw_dev_line(
+            [
+                ("scene visible: ", self.scene.visible_count),
+                (" culled: ", self.scene.culled_count),
+            ],
+            260,
+        )
+        self.draw_dev_line(
+            [
+                ("collision pairs: ", sum(self.collisions.pair_counts.values())),
+                (" tests: ", self.collisions.candidates),
+            ],
+            310,
+        )
+        self.draw_dev_line(
+            [
+                ("projectiles: ", self.projectiles.live),
+                (" pool: ", self.projectiles.capacity),
+                (" hits: ", self.projectile_hits),
+            ],
+            360,
         )
 
+    def draw_dev_line(self, fields, y):
+        """Draw centered (label, value) pairs: labels come from the text cache,
+        values from the bitmap font so changing numbers never call font.render."""
+        parts = []
+        width = 0
+        for label, value in fields:
+            label_img = self.text_cache.render(self.font, label, self.TEXT_COL2)
+            value = str(value)
+            parts.append((label_img, value))
+            width += label_img.get_width() + self.dev_font.size(value)[0]
+
+        x = (self.width - width) // 2
+        for label_img, value in parts:
+            self.overlay_layer.blit(label_img, (x, y))
+            x = self.dev_font.draw(self.overlay_layer, value, (x + label_img.get_width(), y))
+
+
+    def _build_map_layers(self):
+        """Chunk the map layers at the current display size; the camera
+        world is the map size."""
+        for name in ("map_back", "map_front"):
+            self.map_layers[name] = ChunkedMap.from_surface(self.backgrounds.get(name))
+        self.camera.set_world(self.map_layers["map_back"].size)
 
     # MAIN GAME LOOP
 
@@ -337,6 +591,8 @@ class Game:
 
         self.etat = "menu"  # Start directly in menu
         # self.etat = "game"  # Start directly in game
+        # Stream the non-idle character sheets while the menu is shown
+        self.Menu.sprite_loader.start()
         pyg.mixer.init()
         self.musics[self.current_music].play()
         while self.running:
@@ -344,43 +600,24 @@ class Game:
             # Launch music
 
             self._process_network_messages()
+            # Single event pump of the frame, shared by every button
+            snapshot = self.input.pump()
+            # Frames streamed in by the SpriteLoader thread
+            convert_pending()
+            # Rescale the background layers only if the display mode changed
+            if self.backgrounds.sync():
+                self._build_map_layers()
             # MENU STATE
             if self.etat == "menu":
-                screen.blit(self.wallpaper, (0, 0))
+                self.backgrounds.draw(self.bg_layer, "wallpaper")
 
                 self.Menu.method_menu()
                 if self.Menu.etat == "game":
+                    # The chosen characters must be fully loaded to play
+                    self.Menu.sprite_loader.ensure_resident(
+                        self.Menu.selected_characters()
+                    )
                     self.etat = "game"
-                if self.Menu.menu_state == "creation_parameters_session_menu":
-                    for event in pyg.event.get():
-                        self.Menu.input_box.handle_event(event)
-
-                # Handle menu events
-                for event in pyg.event.get():
-                    if event.type == pyg.QUIT:
-                        if self.current_joined_session:
-                            self.send_to_server(f"[LeaveSession]:{self.current_joined_session}")
-                            self.current_joined_session = None
-                        self.running = False
-                    elif event.type == pyg.KEYDOWN:
-                        if event.key == pyg.K_ESCAPE:
-                            if self.current_joined_session:
-                                self.send_to_server(f"[LeaveSession]:{self.current_joined_session}")
-                                self.current_joined_session = None
-                            self.running = False
-                        if event.key == pyg.K_F2:
-                            self.dev_display_ = not self.dev_display_
-                    elif event.type == pyg.MOUSEBUTTONDOWN:
-                        if event.button == 4:  # MOUSE UP
-                            self.Menu.scroll_y = max(0, self.Menu.scroll_y - 30)
-                        if event.button == 5:  # MOUSE down
-                            self.Menu.scroll_y += 30
-
-                    if self.Menu.menu_state == "creation_parameters_session_menu":
-                        self.Menu.input_box.handle_event(
-                            event
-                        )
-
 
             self.delta_time_sessions_send += 1
             # Send sessions to server
@@ -424,25 +661,11 @@ class Game:
 
             # GAME STATE - Actual gameplay
             if self.etat == "game":
-                # Event handling
-                for event in pyg.event.get():
-                    if event.type == pyg.QUIT:
-                        self.running = False
-                    elif event.type == pyg.KEYDOWN:
-                        if event.key == pyg.K_ESCAPE:
-                            self.running = False
-                            self.send_to_server(message="ESC appuyé")
-                        if event.key == pyg.K_F2:
-                            self.dev_display_ = not self.dev_display_
-
-                # Draw game background
-                self.screen.blit(self.map_back, (0, 0))
-
                 # Get frame time
                 delta_time = self.clock.tick(60)
 
                 # Get current key presses
-                keys_pressed = pyg.key.get_pressed()
+                keys_pressed = snapshot.keys
 
                 # Check if any movement key is active
                 is_moving = (
@@ -455,14 +678,17 @@ class Game:
                 if keys_pressed[pyg.K_q] and not self.player.is_attacking_skill1:
                     self.player.is_attacking_skill1 = True
                     self.player.frame_character_skill1 = 0
+                    # Bash is a melee effect, drawn on the player by the scene
 
                 if keys_pressed[pyg.K_s] and not self.player.is_attacking_skill2:
                     self.player.is_attacking_skill2 = True
                     self.player.frame_character_skill2 = 0
+                    self.projectiles.fire_skill(self.player, 2)
 
                 if keys_pressed[pyg.K_d] and not self.player.is_attacking_skill3:
                     self.player.is_attacking_skill3 = True
                     self.player.frame_character_skill3 = 0
+                    self.projectiles.fire_skill(self.player, 3)
 
                 # Handle player movement
                 if keys_pressed[pyg.K_UP]:
@@ -482,13 +708,32 @@ class Game:
                     self.player.is_attacking_skill3,
                 )
 
-                # Get and draw current player sprite
-                current_sprite = self.player.get_current_sprite()
+                self._update_remote_players(delta_time)
+
+                # Move the skill projectiles, drop the expired ones
+                self.projectiles.update(delta_time, self.camera.world)
+
+                # Colliding pairs of the frame, in self.collisions.pairs
+                self.collisions.step()
+
+                # Skill projectiles that reach an enemy hitbox are spent on it
+                self.projectile_hits = 0
+                for enemy, count in self.projectiles.collide(self.collisions.rects(KIND_ENEMY)):
+                    enemy.take_damage(PROJECTILE_DAMAGE * count)
+                    self.projectile_hits += count
+
+                # Follow the player; only the chunks in view are drawn
                 player_pos = self.player.position
-                self.screen.blit(current_sprite, player_pos)
+                self.camera.follow(player_pos)
+                self.map_layers["map_back"].draw(self.bg_layer, self.camera)
+
+                # Draw the scene (player, enemies, effects, items) in y order
+                self.scene.update()
+                self.scene.queue(self.entity_layer)
+                self.projectiles.draw(self.entity_layer, self.camera.rect)
 
                 # Draw foreground on top of player
-                self.screen.blit(self.map_front, (0, 0))
+                self.map_layers["map_front"].draw(self.fg_layer, self.camera)
 
                 # Send player position to server
                 self.send_to_server(
@@ -501,9 +746,15 @@ class Game:
                 except Exception as e:
                     print(f"Error dev display| Error --> {e}")
 
+            # One blits call per layer, in layer order
+            self.render_queue.flush(screen)
+            self.render_queue.end_frame()
+            self.text_cache.end_frame()
+
             # Update display
             pyg.display.update()
             pyg.display.flip()
+            self.input.present()
 
         # Graceful shutdown
         self.shutdown()
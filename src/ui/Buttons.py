@@ -1,53 +1,28 @@
-import pygame as pyg
 from utils.paths import get_asset_path
+from utils.sprite_sheet import SpriteSheet
+
+BUTTON_SHEET_WIDTH = 1260
+BUTTON_FRAMES = 12
+BUTTON_HEIGHT = 32
 
-class PlayButton:
-    def __init__(self):
-        self.play_button_frames = []
-        frames_PlayButton = 12
-        height = 32
-        width_frame = 1260//frames_PlayButton
 
-        path = get_asset_path("buttons", "21-MENUS", "BUTTONS-IDLE-PLAY-Sheet.png")
+def load_button_frames(filename):
+    """Frames of a 21-MENUS button sheet (the sheet is decoded once, see SpriteSheet)."""
+    path = get_asset_path("buttons", "21-MENUS", filename)
+    width_frame = BUTTON_SHEET_WIDTH // BUTTON_FRAMES
+    return SpriteSheet.load(path, width_frame, BUTTON_HEIGHT, BUTTON_FRAMES)
 
-        for i in range(frames_PlayButton):
-            self.play_button_frames.append(
-                pyg.image.load(
-                    path
-                ).subsurface(i * width_frame, 0, width_frame, height)
-            )
 
+class PlayButton:
+    def __init__(self):
+        self.play_button_frames = load_button_frames("BUTTONS-IDLE-PLAY-Sheet.png")
 
 
 class OptionsButton:
     def __init__(self):
-        self.settings_button_frames = []
-        frames_OptionsButton = 12
-        height = 32
-        width_frame = 1260//frames_OptionsButton
+        self.settings_button_frames = load_button_frames("BUTTONS-IDLE-OPTIONS-Sheet.png")
 
-        path = get_asset_path("buttons", "21-MENUS", "BUTTONS-IDLE-OPTIONS-Sheet.png")
-
-        for i in range(frames_OptionsButton):
-            self.settings_button_frames.append(
-                pyg.image.load(
-                    path
-                ).subsurface(i * width_frame, 0, width_frame, height)
-            )
 
 class ExitButton:
     def __init__(self):
-        self.exit_button_frames = []
-        frames_ExitButton = 12
-        height = 32
-        width_frame = 1260//frames_ExitButton
-
-        path = get_asset_path("buttons", "21-MENUS", "BUTTONS-IDLE-EXIT-Sheet.png")
-
-        for i in range(frames_ExitButton):
-            self.exit_button_frames.append(
-                pyg.image.load(
-                    path
-                ).subsurface(i * width_frame, 0, width_frame, height)
-            )
-
+        self.exit_button_frames = load_button_frames("BUTTONS-IDLE-EXIT-Sheet.png")
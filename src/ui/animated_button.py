@@ -1,5 +1,6 @@
 import pygame
 
+from .input_dispatcher import current_snapshot
 
 DEFAULT_SCALE = 1
 DEFAULT_ANIMATION_SPEED = 1  # frames per second
@@ -42,7 +43,8 @@ class AnimatedButton:
         self.update()
         if not self.frames:
             return False
-        pos = pygame.mouse.get_pos()
+        snapshot = current_snapshot()
+        pos = snapshot.mouse_pos
         # DRAW BUTTON
         current_image = self.frames[self.current_frame]
         surface.blit(current_image, (self.rect.x, self.rect.y))
@@ -50,13 +52,14 @@ class AnimatedButton:
         # Check if mouse is over button
         if self.rect.collidepoint(pos):
             # Get current mouse button state
-            if pygame.mouse.get_pressed()[0] == 1:  # Left mouse button pressed
+            if snapshot.mouse_pressed(0):  # Left mouse button pressed
                 if not self.clicked:
                     self.clicked = True
             else:
                 # Mouse button released
                 if self.clicked:
                     action = True  # Register click
+                    snapshot.mark_action()
                     self.clicked = False
         else:
             # Mouse left button area
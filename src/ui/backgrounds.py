@@ -0,0 +1,121 @@
+import pygame as pyg
+
+from utils.display_format import display_ready
+
+
+class BackgroundLayers:
+    """
+    Full-screen layers scaled once per display mode.
+
+    The pristine source image of each layer is kept, and the scaled copy is
+    built from it the first time the layer is requested for the current
+    display mode. Scaled copies are only rebuilt when the display size or
+    flags change, never by rescaling a previous result.
+
+    Layers registered from a path are only decoded when needed: with a
+    LayerCache, a scaled copy already on disk for this resolution is read
+    back instead, without decoding nor scaling the source.
+
+    Attributes:
+        size (tuple): Current (width, height) the layers are scaled to
+        rebuilds (int): Number of scaled copies built since creation
+        cache (LayerCache): On-disk cache of the scaled copies, or None
+    """
+
+    def __init__(self, size, cache=None):
+        """
+        Initialize an empty layer set.
+
+        Args:
+            size (tuple): Initial (width, height) of the display
+            cache (LayerCache): On-disk cache of the scaled copies
+        """
+        self.size = tuple(size)
+        self.cache = cache
+        self._mode = None
+        self._sources = {}
+        self._decoded = {}
+        self._scaled = {}
+        self.rebuilds = 0
+        self.sync()
+
+    def register(self, name, source, alpha=True):
+        """
+        Register a layer from an image path or an already loaded Surface.
+
+        Args:
+            name (str): Layer name used by get/draw
+            source (str | pygame.Surface): Image path (decoded on first
+                use) or pristine Surface
+            alpha (bool): Keep per-pixel alpha when converting the scaled copy
+        """
+        self._sources[name] = (source, alpha)
+        self._decoded.pop(name, None)
+        self._scaled.pop(name, None)
+
+    def sync(self, size=None):
+        """
+        Follow the display mode; drop the scaled copies when it changed.
+
+        Args:
+            size (tuple): New (width, height), defaults to the display size
+
+        Returns:
+            bool: True if the mode changed
+        """
+        display = pyg.display.get_surface()
+        if size is None and display is not None:
+            size = display.get_size()
+        if size is not None:
+            self.size = tuple(size)
+        flags = display.get_flags() if display is not None else 0
+        mode = (self.size, flags)
+        if mode == self._mode:
+            return False
+        self._mode = mode
+        self._scaled.clear()
+        return True
+
+    def get(self, name):
+        """
+        Get the layer scaled to the current display mode.
+
+        Args:
+            name (str): Layer name
+
+        Returns:
+            pygame.Surface: Scaled layer
+        """
+        scaled = self._scaled.get(name)
+        if scaled is None:
+            source, alpha = self._sources[name]
+            path = source if isinstance(source, str) else None
+            cached = path is not None and self.cache is not None and display_ready()
+            if cached:
+                scaled = self.cache.load(path, self.size, alpha)
+            if scaled is None:
+                scaled = pyg.transform.scale(self._decode(name), self.size)
+                if pyg.display.get_surface() is not None:
+                    scaled = scaled.convert_alpha() if alpha else scaled.convert()
+                if cached:
+                    self.cache.store(path, self.size, alpha, scaled)
+                self.rebuilds += 1
+            self._scaled[name] = scaled
+        return scaled
+
+    def _decode(self, name):
+        # Pristine surface of a layer, decoded once if registered by path
+        source = self._sources[name][0]
+        if not isinstance(source, str):
+            return source
+        decoded = self._decoded.get(name)
+        if decoded is None:
+            decoded = self._decoded[name] = pyg.image.load(source)
+        return decoded
+
+    def draw(self, surface, name, pos=(0, 0)):
+        """Blit the scaled layer ``name`` on ``surface``."""
+        surface.blit(self.get(name), pos)
+
+    def __contains__(self, name):
+        return name in self._sources
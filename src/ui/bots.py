@@ -0,0 +1,278 @@
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ui.console import print_error
+
+BOT_TICK_RATE = 10        # bot decisions per second
+SIM_TICK_RATE = 60        # client simulation ticks per second
+BOT_WORKERS = 2
+BOT_SPEED = 2             # pixels per simulation tick, like Water.speed
+BOT_START_POSITION = (400, 400)
+BOT_FOLLOW_DISTANCE = 80  # stop walking when this close to a human
+BOT_SKILL_RANGE = 150     # use a skill when a human is this close
+BOT_SKILL_CHANCE = 0.1    # per decision, when in skill range
+BOT_WANDER_TURN = 0.2     # chance to pick a new wander direction per decision
+
+INPUT_PREFIX = "[PlayerInput]:"
+DIRECTIONS = ("up", "down", "left", "right")
+SKILLS = ("skill1", "skill2", "skill3")
+
+
+def input_message(session_name, player_id, keys, position):
+    """
+    Wire message of one bot input. The server relays it to the clients
+    of the session, which walk the slot's character to *position*
+    (Game._apply_remote_input).
+
+    Args:
+        session_name (str): Session title
+        player_id (int): Player slot (1..4)
+        keys (list): Held actions ('up', 'left', 'skill1'...)
+        position (tuple): Player (x, y) after the input
+
+    Returns:
+        str: "[PlayerInput]:{json}"
+    """
+    return INPUT_PREFIX + json.dumps({
+        "session_name": session_name,
+        "player_id": player_id,
+        "keys": list(keys),
+        "position": [position[0], position[1]],
+    })
+
+
+class BotController:
+    """
+    Decision logic of one bot slot.
+
+    Follows the closest human of its session, uses a skill now and then
+    when close, and wanders when the session has no human position yet.
+    ``decide`` only reads the observation snapshot it is given and the
+    bot's own state, so it can run on a worker thread.
+
+    Attributes:
+        session_name (str): Session title
+        player_id (int): Slot of the bot (1..4)
+        position (list): Dead-reckoned (x, y), moved by BOT_SPEED per
+            simulation tick between two decisions
+        decisions (int): Decisions taken
+        decision_ms (float): Duration of the last decision
+        total_ms (float): Sum of the decision durations
+        max_ms (float): Longest decision
+    """
+
+    def __init__(self, session_name, player_id, seed=None):
+        self.session_name = session_name
+        self.player_id = player_id
+        self.position = list(BOT_START_POSITION)
+        self._rng = random.Random(seed)
+        self._wander = self._rng.choice(DIRECTIONS)
+        self.decisions = 0
+        self.decision_ms = 0.0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def mean_ms(self):
+        """Average decision duration."""
+        return self.total_ms / self.decisions if self.decisions else 0.0
+
+    def decide(self, observation, ticks):
+        """
+        Choose the input held until the next decision.
+
+        Args:
+            observation (dict): Human player id -> (x, y) of the session
+            ticks (int): Simulation ticks until the next decision
+
+        Returns:
+            str: PlayerInput message
+        """
+        start = time.perf_counter()
+        x, y = self.position
+        keys = []
+        target = None
+        best = None
+        for player_id, (px, py) in observation.items():
+            dist_sq = (px - x) * (px - x) + (py - y) * (py - y)
+            if best is None or dist_sq < best:
+                best, target = dist_sq, (px, py)
+
+        if target is None:
+            if self._rng.random() < BOT_WANDER_TURN:
+                self._wander = self._rng.choice(DIRECTIONS)
+            keys.append(self._wander)
+        elif best > BOT_FOLLOW_DISTANCE * BOT_FOLLOW_DISTANCE:
+            # Axis by axis, like Enemy.chase_target
+            if target[0] > x:
+                keys.append("right")
+            elif target[0] < x:
+                keys.append("left")
+            if target[1] > y:
+                keys.append("down")
+            elif target[1] < y:
+                keys.append("up")
+        if best is not None and best <= BOT_SKILL_RANGE * BOT_SKILL_RANGE:
+            if self._rng.random() < BOT_SKILL_CHANCE:
+                keys.append(self._rng.choice(SKILLS))
+
+        step = BOT_SPEED * ticks
+        if "right" in keys:
+            x += step
+        elif "left" in keys:
+            x -= step
+        if "down" in keys:
+            y += step
+        elif "up" in keys:
+            y -= step
+        self.position[0], self.position[1] = x, y
+        message = input_message(self.session_name, self.player_id, keys, (x, y))
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self.decisions += 1
+        self.decision_ms = elapsed
+        self.total_ms += elapsed
+        self.max_ms = max(self.max_ms, elapsed)
+        return message
+
+
+class BotPool:
+    """
+    Runs the bots of every session on a worker pool, off the network
+    threads and off the game loop.
+
+    A scheduler thread ticks at ``tick_rate`` (below the simulation
+    rate): it snapshots the human positions of each session through
+    ``observe``, hands each bot's decision to the executor and forwards
+    the finished decisions to ``submit`` — the server's message handler,
+    which relays them to the clients of the session. The scheduler never
+    waits for a decision: a bot whose previous decision is still running
+    skips the tick (``skipped``) instead of delaying the others.
+
+    Attributes:
+        tick_rate (int): Decisions per second and per bot
+        bots (dict): (session name, player id) -> BotController
+        ticks (int): Scheduler ticks run
+        skipped (int): Decisions skipped because the previous one was late
+        late_ticks (int): Scheduler ticks that overran their period
+    """
+
+    def __init__(self, submit, observe, workers=BOT_WORKERS, tick_rate=BOT_TICK_RATE,
+                 executor=None):
+        """
+        Args:
+            submit (callable): submit(message), called with each PlayerInput
+            observe (callable): observe(session_name) -> {player_id: (x, y)}
+                of the humans; called on the scheduler thread
+            workers (int): Worker threads of the default executor
+            tick_rate (int): Decisions per second and per bot
+            executor (concurrent.futures.Executor): Pool running the
+                decisions, a ThreadPoolExecutor by default
+        """
+        self.submit = submit
+        self.observe = observe
+        self.tick_rate = tick_rate
+        self.bots = {}
+        self.ticks = 0
+        self.skipped = 0
+        self.late_ticks = 0
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="bot"
+        )
+        self._pending = {}  # bot key -> Future
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread = None
+
+    # ========================================================================
+    # BOTS
+    # ========================================================================
+
+    def add_session(self, session_name, player_ids):
+        """Create the bot controllers of a session's bot slots."""
+        with self._lock:
+            for player_id in player_ids:
+                key = (session_name, player_id)
+                if key not in self.bots:
+                    self.bots[key] = BotController(session_name, player_id, seed=hash(key))
+
+    def remove_session(self, session_name):
+        """Stop driving the bots of a session."""
+        with self._lock:
+            for key in [key for key in self.bots if key[0] == session_name]:
+                del self.bots[key]
+                self._pending.pop(key, None)
+
+    def decision_stats(self):
+        """
+        Decision time of every bot.
+
+        Returns:
+            dict: (session name, player id) -> (last ms, mean ms, max ms)
+        """
+        with self._lock:
+            return {
+                key: (bot.decision_ms, bot.mean_ms, bot.max_ms)
+                for key, bot in self.bots.items()
+            }
+
+    # ========================================================================
+    # SCHEDULER
+    # ========================================================================
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="bot-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self):
+        period = 1.0 / self.tick_rate
+        next_tick = time.perf_counter()
+        while self._running:
+            self.tick()
+            next_tick += period
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                self.late_ticks += 1
+                next_tick = time.perf_counter()
+
+    def tick(self):
+        """Forward the finished decisions and start the next ones."""
+        ticks = SIM_TICK_RATE // self.tick_rate
+        with self._lock:
+            bots = list(self.bots.items())
+        observations = {}
+        for key, bot in bots:
+            if key not in self.bots:
+                continue  # session removed since the snapshot
+            future = self._pending.get(key)
+            if future is not None:
+                if not future.done():
+                    self.skipped += 1
+                    continue
+                self._pending.pop(key, None)
+                try:
+                    self.submit(future.result())
+                except Exception as e:
+                    print_error(f"Erreur bot {key}: {e}")
+            session_name = key[0]
+            if session_name not in observations:
+                observations[session_name] = self.observe(session_name)
+            self._pending[key] = self._executor.submit(
+                bot.decide, observations[session_name], ticks
+            )
+        self.ticks += 1
@@ -1,5 +1,6 @@
 import pygame
 
+from .input_dispatcher import current_snapshot
 
 DEFAULT_SCALE = 1
 
@@ -23,15 +24,17 @@ class Button:
         self.clicked = False
 
     def draw(self, surface):
+        """Draw the button and return True when it was clicked."""
         if self.image is None:
             return False
         action = False
-        pos = pygame.mouse.get_pos()
+        snapshot = current_snapshot()
+        pos = snapshot.mouse_pos
         surface.blit(self.image, (self.rect.x, self.rect.y))
         # Check if mouse is over button
         if self.rect.collidepoint(pos):
             # Check if mouse button is pressed
-            if pygame.mouse.get_pressed()[0]:
+            if snapshot.mouse_pressed(0):
                 # If not already clicked, set clicked flag
                 if not self.clicked:
                     self.clicked = True
@@ -41,10 +44,11 @@ class Button:
                 if self.clicked:
                     self.clicked = False
                     action = True
+                    snapshot.mark_action()
         else:
             # Mouse moved outside button
             # Reset clicked state if button is released
-            if not pygame.mouse.get_pressed()[0]:
+            if not snapshot.mouse_pressed(0):
                 self.clicked = False
 
         return action
@@ -37,6 +37,14 @@ def run_offline_server():
                 for session in server.sessions_clients_joined.items():
                     if session[1] != []:
                         print_info(f"{session[0]}:{session[1]}")
+            stats = server.bots.decision_stats()
+            if stats:
+                mean_ms = sum(s[1] for s in stats.values()) / len(stats)
+                max_ms = max(s[2] for s in stats.values())
+                print_info(
+                    f"Bots: {len(stats)} | décision moyenne {mean_ms:.3f} ms, "
+                    f"max {max_ms:.3f} ms | sautées {server.bots.skipped}"
+                )
             time.sleep(10)  # Check every 10 seconds
 
     except KeyboardInterrupt:
@@ -0,0 +1,173 @@
+from collections import deque
+
+import pygame as pyg
+
+LATENCY_SAMPLES = 60
+
+# Snapshot of the last pump, shared by every button drawn this frame
+_current_snapshot = None
+
+
+class InputSnapshot:
+    """
+    Input state of one frame.
+
+    Built once per frame by InputDispatcher.pump and shared by every widget,
+    so all buttons see the same mouse position and button state.
+
+    Attributes:
+        events (list): Events pumped this frame
+        mouse_pos (tuple): Mouse (x, y) position
+        mouse_buttons (tuple): Pressed state of the mouse buttons
+        keys: Result of ``pygame.key.get_pressed``
+        pumped_at (int): ``pygame.time.get_ticks`` when the events were pumped
+        action_taken (bool): True once an input produced an action this frame
+    """
+
+    def __init__(self, events, mouse_pos, mouse_buttons, keys, previous=None):
+        self.events = events
+        self.mouse_pos = mouse_pos
+        self.mouse_buttons = mouse_buttons
+        self.keys = keys
+        self.pumped_at = pyg.time.get_ticks()
+        self.action_taken = False
+        self._previous_buttons = (
+            previous.mouse_buttons if previous is not None else mouse_buttons
+        )
+
+    def mouse_pressed(self, button=0):
+        """True while ``button`` (0 = left) is held down."""
+        return bool(self.mouse_buttons[button])
+
+    def mouse_just_pressed(self, button=0):
+        """True only on the frame ``button`` went down."""
+        return bool(self.mouse_buttons[button]) and not self._previous_buttons[button]
+
+    def mark_action(self):
+        """Flag this frame for the input-to-action latency measurement."""
+        self.action_taken = True
+
+
+def current_snapshot():
+    """
+    Get the snapshot of the current frame.
+
+    Falls back to polling pygame directly when no dispatcher pumped events,
+    so widgets still work outside Game.run.
+
+    Returns:
+        InputSnapshot: Shared input state
+    """
+    if _current_snapshot is not None:
+        return _current_snapshot
+    return InputSnapshot(
+        [], pyg.mouse.get_pos(), pyg.mouse.get_pressed(), pyg.key.get_pressed()
+    )
+
+
+class InputDispatcher:
+    """
+    Single event pump feeding subscriptions.
+
+    ``pump`` calls ``pygame.event.get`` once per frame, builds the frame's
+    InputSnapshot and dispatches every event to its subscribers:
+    keys (KEYDOWN by key), mouse (MOUSEBUTTONDOWN by button), text
+    (KEYDOWN, MOUSEBUTTONDOWN and TEXTINPUT, for the focused text field)
+    and raw event types.
+
+    Handlers return True when the event produced an action (a state
+    change the next frame shows); only those frames are measured by the
+    input-to-action latency.
+
+    Attributes:
+        last_latency (int): Last input-to-action latency in milliseconds
+    """
+
+    def __init__(self):
+        self._key_handlers = {}
+        self._mouse_handlers = {}
+        self._event_handlers = {}
+        self._text_handlers = []
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.last_latency = 0
+        self.snapshot = None
+
+    # ------------------------------------------------------------------
+    # SUBSCRIPTIONS
+    # ------------------------------------------------------------------
+
+    def subscribe_key(self, key, callback):
+        """Call ``callback(event) -> bool`` on KEYDOWN of ``key``."""
+        self._key_handlers.setdefault(key, []).append(callback)
+
+    def subscribe_mouse(self, button, callback):
+        """Call ``callback(event) -> bool`` on MOUSEBUTTONDOWN of ``button``."""
+        self._mouse_handlers.setdefault(button, []).append(callback)
+
+    def subscribe_text(self, callback):
+        """
+        Call ``callback(event) -> bool`` for text entry events (KEYDOWN,
+        MOUSEBUTTONDOWN and TEXTINPUT).
+        """
+        self._text_handlers.append(callback)
+
+    def subscribe(self, event_type, callback):
+        """Call ``callback(event) -> bool`` for every event of ``event_type``."""
+        self._event_handlers.setdefault(event_type, []).append(callback)
+
+    # ------------------------------------------------------------------
+    # FRAME
+    # ------------------------------------------------------------------
+
+    def pump(self):
+        """
+        Pump the pygame events once and dispatch them.
+
+        Returns:
+            InputSnapshot: Input state shared by the whole frame
+        """
+        global _current_snapshot
+
+        events = pyg.event.get()
+        snapshot = InputSnapshot(
+            events,
+            pyg.mouse.get_pos(),
+            pyg.mouse.get_pressed(),
+            pyg.key.get_pressed(),
+            previous=self.snapshot,
+        )
+        self.snapshot = snapshot
+        _current_snapshot = snapshot
+
+        for event in events:
+            handlers = list(self._event_handlers.get(event.type, ()))
+            if event.type == pyg.KEYDOWN:
+                handlers += self._key_handlers.get(event.key, ())
+                handlers += self._text_handlers
+            elif event.type == pyg.MOUSEBUTTONDOWN:
+                handlers += self._mouse_handlers.get(event.button, ())
+                handlers += self._text_handlers
+            elif event.type == pyg.TEXTINPUT:
+                handlers += self._text_handlers
+            for handler in handlers:
+                if handler(event):
+                    snapshot.mark_action()
+        return snapshot
+
+    def present(self):
+        """
+        Call right after the display flip: if an input produced an action
+        this frame, record the delay between the pump and the flip.
+        """
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.action_taken:
+            self.last_latency = pyg.time.get_ticks() - snapshot.pumped_at
+            self._latencies.append(self.last_latency)
+            snapshot.action_taken = False
+
+    @property
+    def average_latency(self):
+        """Average input-to-action latency over the last samples, in ms."""
+        if not self._latencies:
+            return 0
+        return sum(self._latencies) // len(self._latencies)
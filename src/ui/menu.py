@@ -4,10 +4,17 @@ import sys
 import pygame as pyg
 
 import game.characters as player_module
+from game.sprite_loader import SpriteLoader
 from ui import Buttons as ObjButton
-from utils.paths import get_asset_path
+from utils.display_format import convert_pending, expect_display
+from utils.layer_cache import LayerCache
 
 from . import animated_button, button
+from .backgrounds import BackgroundLayers
+from .input_dispatcher import current_snapshot
+from .render_queue import LAYER_BACKGROUND, LAYER_UI, RenderQueue
+from .session_list import SessionList
+from .text_cache import TextCache
 
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
@@ -20,6 +27,8 @@ class Menu:
         self.width = width
         self.height = height
         self.fullscreen = fullscreen
+        # The window is opened below: frames loaded until then are queued
+        expect_display()
         # PLAYER INITIALIZATION
         self.player = player_module.Furnace()
         # MENU STATE VARIABLES
@@ -37,6 +46,8 @@ class Menu:
         # Display setup
         flags = pyg.FULLSCREEN if self.fullscreen else 0
         self.screen = pyg.display.set_mode((self.width, self.height), flags)
+        # Frames loaded before the window existed (the Furnace)
+        convert_pending()
         pyg.display.set_caption("Jeu Multijoueur")
         self.clock = pyg.time.Clock()
         # FONT AND COLOR SETUP
@@ -45,16 +56,20 @@ class Menu:
         self.little_font = pyg.font.SysFont("arialblack", 10)
         self.TEXT_COL = (255, 255, 255)
         self.TEXT_COL2 = (255, 0, 0)
-        # LOAD MENU BACKGROUNDS
-        self.wallpaper = pyg.image.load(
-            "assets/buttons/21-MENUS/MAIN MENU-Sheet.png"
-        ).convert_alpha()
-        self.wallpaper = pyg.transform.scale(self.wallpaper, (self.width, self.height))
-        self.choice_chracters = pyg.image.load(
-            "assets/wallpapers/SELECT-SCREEN.png"
-        ).convert_alpha()
-        self.choice_chracters = pyg.transform.scale(
-            self.choice_chracters, (self.width, self.height)
+        # Rendered text surfaces, shared with Game, Session and InputBox
+        self.text_cache = TextCache()
+        # Frame render queue, shared with Game: backgrounds and widgets are
+        # queued on their layer and drawn with one blits call per layer
+        self.render_queue = RenderQueue()
+        self.bg_layer = self.render_queue.layer(LAYER_BACKGROUND)
+        self.ui_layer = self.render_queue.layer(LAYER_UI)
+        # LOAD MENU BACKGROUNDS (scaled once per display mode)
+        self.backgrounds = BackgroundLayers((self.width, self.height), cache=LayerCache())
+        self.backgrounds.register(
+            "wallpaper", "assets/buttons/21-MENUS/MAIN MENU-Sheet.png"
+        )
+        self.backgrounds.register(
+            "choice_chracters", "assets/wallpapers/SELECT-SCREEN.png"
         )
         # PLAY BUTTON FRAMES
         play_button = ObjButton.PlayButton()
@@ -98,9 +113,9 @@ class Menu:
             "assets/buttons/Back_selection_character.png"
         ).convert_alpha()
         # IMAGES FOR SESSION INTERFACE
-        self.bg_session = pyg.image.load(
-            "assets/Menus_assets/sessions_section/Browse_Sessions.png"
-        ).convert_alpha()
+        self.backgrounds.register(
+            "bg_session", "assets/Menus_assets/sessions_section/Browse_Sessions.png"
+        )
         # self.bar_session = pyg.image.load("assets/Menus_assets/sessions_section/BAR.png").convert_alpha()
         # self.bot_session = pyg.image.load("assets/Menus_assets/sessions_section/BOT.png").convert_alpha()
         self.button_session = pyg.image.load(
@@ -121,25 +136,23 @@ class Menu:
         self.char_preview_scale = 9.5
 
         # Idle animation previews for characters 1-9 (loaded if IDLE-Sheet.png exists)
-        _IDLE_FRAME_SIZE = 40
+        # The frames are the idle sheets of the shared CharacterType: only
+        # the idle sheet is loaded here, SpriteLoader streams the others.
         self._idle_preview_frames = {}   # char_num -> [Surface, ...]
         self._idle_anim_idx   = {}       # char_num -> int
         self._idle_anim_accum = {}       # char_num -> float (ms)
         self._idle_anim_last_tick = pyg.time.get_ticks()
+        self._scaled_previews = {}       # (char_num, frame, size) -> scaled Surface
         for _i in range(1, 10):
             try:
-                _path = get_asset_path("sprites", f"Character-{_i}", "IDLE-Sheet.png")
-                _sheet = pyg.image.load(_path)
-                _count = _sheet.get_width() // _IDLE_FRAME_SIZE
-                _frames = [
-                    _sheet.subsurface((_j * _IDLE_FRAME_SIZE, 0, _IDLE_FRAME_SIZE, _IDLE_FRAME_SIZE))
-                    for _j in range(_count)
-                ]
-                self._idle_preview_frames[_i] = _frames
+                _char_type = player_module.get_character_type(_i)
+                self._idle_preview_frames[_i] = _char_type.frames['idle']['right']
                 self._idle_anim_idx[_i]   = 0
                 self._idle_anim_accum[_i] = 0.0
-            except Exception:
+            except FileNotFoundError:
                 pass
+        self.sprite_loader = SpriteLoader()
+        self._prioritized_selection = None
         # CREATE BUTTON INSTANCES
         self.play_button = animated_button.AnimatedButton(
             self.center_x(self.play_button_frames[0], 1.5),
@@ -262,6 +275,10 @@ class Menu:
             self.center_x(image_ch[17], -11), 582, image_ch[17], 4
         )
 
+        self.character_buttons = [
+            (getattr(self, f"character_{i}_button"), i) for i in range(1, 19)
+        ]
+
         # character choosen
         character_choosen_img = pyg.image.load(
             "assets/buttons/character_choosen.png"
@@ -281,6 +298,7 @@ class Menu:
         )
         # VARIABLES SESSIONS
         self.sessions = []
+        self.session_list = SessionList(self)
         self.scroll_y = 0
         self.pending_session = None
         self.input_box = InputBox(
@@ -317,24 +335,15 @@ class Menu:
         self.pending_leave_session = None
         self.pending_join_session = None
 
-        self._prev_mouse = False
 
     def handle_session_menu(self):
         """Gère l'état du menu des sessions"""
-        self.bg_session = pyg.transform.scale(
-            self.bg_session, (self.width, self.height)
-        )
-        self.screen.blit(self.bg_session, (0, 0))
-
-        zone_visible = pyg.Rect(300, 200, 750, 320)
-        self.screen.set_clip(zone_visible)
-
-        for i, session in enumerate(self.sessions):
-            session.draw_session(session.y - self.scroll_y)
+        self.backgrounds.draw(self.bg_layer, "bg_session")
 
-        self.screen.set_clip(None)
+        # Seules les lignes visibles dans la zone sont dessinées
+        self.session_list.draw(self.render_queue, self.sessions, self.scroll_y)
 
-        if self.create_session_button.draw(self.screen):
+        if self.create_session_button.draw(self.ui_layer):
             print("Session created")
             # new_session = Session(self)
 
@@ -348,20 +357,24 @@ class Menu:
         self.draw_text(
             text="Create session", font=self.middle_font, text_col="Black", x=735, y=480
         )
-        if self.exit_button.draw(self.screen):
+        if self.exit_button.draw(self.ui_layer):
             self.menu_state = "main"
 
     def update_sessions_from_server(self, sessions_json):
         try:
             sessions_data = json.loads(sessions_json)
-            self.sessions = []
 
-            # Recreate Session objects from server data
+            # Reuse the existing Session objects, only create the missing ones
             for idx, session_data in enumerate(sessions_data):
-                session = Session.from_dict(session_data, self)
+                if idx < len(self.sessions):
+                    session = self.sessions[idx]
+                    session.update_from_dict(session_data)
+                else:
+                    session = Session.from_dict(session_data, self)
+                    self.sessions.append(session)
                 # Recalculate Y position based on index
                 session.y = 79 + (idx * session.gap)
-                self.sessions.append(session)
+            del self.sessions[len(sessions_data):]
 
             print(f"Sessions mises à jour du serveur: {len(self.sessions)} sessions")
         except json.JSONDecodeError as e:
@@ -369,6 +382,31 @@ class Menu:
         except Exception as e:
             print(f"Erreur lors de la mise à jour des sessions: {e}")
 
+    def join_session(self, session):
+        """
+        Prepare the character selection for joining ``session``.
+        main.py sends [JoinedSession] when it sees pending_join_session.
+
+        Args:
+            session (Session): Session clicked in the list
+        """
+        print(f"Tentative de rejoindre : {session.titre}")
+        # Réinitialiser les variables de sélection
+        self.character_1 = 0
+        self.character_2 = 0
+        self.character_3 = 0
+        self.current_session_name = session.titre
+        self.number_players = session.nb_players
+        self.number_bot = session.nb_bots
+
+        # Réinitialiser les sélections de tous les joueurs
+        for p_id in range(1, 5):
+            self.players_characters[p_id] = [None, None, None]
+            self.players_ready[p_id] = False
+
+        self.pending_join_session = session.titre
+        self.menu_state = "waiting_player_id"
+
     def update_player_character(self, player_id, character_1, character_2, character_3):
         """
         Update character selection for a specific player (3 characters).
@@ -402,37 +440,37 @@ class Menu:
         w = int(image.get_width() * scale)
         return (self.width - w) // 2
 
-    def draw_text(self, text, font, text_col, x, y):
-        img = font.render(text, True, text_col)
-        self.screen.blit(img, (x, y))
+    def draw_text(self, text, font, text_col, x, y, surface=None):
+        img = self.text_cache.render(font, text, text_col)
+        (surface if surface is not None else self.ui_layer).blit(img, (x, y))
 
     def draw_text_center(self, text, font, text_col, y):
-        img = font.render(text, True, text_col)
+        img = self.text_cache.render(font, text, text_col)
         x = (self.width - img.get_width()) // 2
-        self.screen.blit(img, (x, y))
+        self.ui_layer.blit(img, (x, y))
 
     def handle_main_menu(self):
         """Gère l'état du menu principal"""
         # Draw background first to clear previous frame
-        self.screen.blit(self.wallpaper, (0, 0))
+        self.backgrounds.draw(self.bg_layer, "wallpaper")
         # Then draw animated buttons
-        if self.play_button.draw(self.screen):
+        if self.play_button.draw(self.ui_layer):
             self.menu_state = "play"
-        if self.settings_button.draw(self.screen):
+        if self.settings_button.draw(self.ui_layer):
             self.menu_state = "settings"
-        if self.exit_button.draw(self.screen):
+        if self.exit_button.draw(self.ui_layer):
             pyg.quit()
             sys.exit(0)
 
     def handle_settings_menu(self):
         """Gère l'état du menu paramètres"""
-        if self.video_button.draw(self.screen):
+        if self.video_button.draw(self.ui_layer):
             print("Video Settings")
-        if self.audio_button.draw(self.screen):
+        if self.audio_button.draw(self.ui_layer):
             print("Audio Settings")
-        if self.keys_button.draw(self.screen):
+        if self.keys_button.draw(self.ui_layer):
             print("Keys Settings")
-        if self.exit_button.draw(self.screen):
+        if self.exit_button.draw(self.ui_layer):
             self.menu_state = "main"
 
     def handle_play_menu(self):
@@ -453,7 +491,7 @@ class Menu:
         # tmp = ["three", "two", "one"]
         # self.menu_state = f"{tmp[self.number_bot - 1]}{'_player' if self.number_bot == 3 else '_players'}"
         self.menu_state = "choice_characters_1"
-        if self.exit_button.draw(self.screen):
+        if self.exit_button.draw(self.ui_layer):
             self.menu_state = "play"
 
     def handle_one_player_menu(self):
@@ -461,16 +499,16 @@ class Menu:
         self.draw_text_center(
             "Select the number of bots", self.font, self.TEXT_COL2, 50
         )
-        if self.one_player_button.draw(self.screen):
+        if self.one_player_button.draw(self.ui_layer):
             self.menu_state = "choice_characters_1"
             self.number_bot = 1
-        if self.two_players_button.draw(self.screen):
+        if self.two_players_button.draw(self.ui_layer):
             self.menu_state = "choice_characters_1"
             self.number_bot = 2
-        if self.three_players_button.draw(self.screen):
+        if self.three_players_button.draw(self.ui_layer):
             self.menu_state = "choice_characters_1"
             self.number_bot = 3
-        if self.exit_button.draw(self.screen):
+        if self.exit_button.draw(self.ui_layer):
             self.menu_state = "play"
 
     def handle_two_players_menu(self):
@@ -478,16 +516,16 @@ class Menu:
         self.draw_text_center(
             "Select the number of bots", self.font, self.TEXT_COL2, 50
         )
-        if self.zero_player_button.draw(self.screen):
+        if self.zero_player_button.draw(self.ui_layer):
             self.menu_state = "choice_characters_1"
             self.number_bot = 0
-        if self.one_player_button.draw(self.screen):
+        if self.one_player_button.draw(self.ui_layer):
             self.menu_state = "choice_characters_1"
             self.number_bot = 1
-        if self.two_players_button.draw(self.screen):
+        if self.two_players_button.draw(self.ui_layer):
             self.menu_state = "choice_characters_1"
             self.number_bot = 2
-        if self.exit_button.draw(self.screen):
+        if self.exit_button.draw(self.ui_layer):
             self.menu_state = "play"
 
     def handle_three_players_menu(self):
@@ -495,13 +533,13 @@ class Menu:
         self.draw_text_center(
             "Select the number of bots", self.font, self.TEXT_COL2, 50
         )
-        if self.zero_player_button.draw(self.screen):
+        if self.zero_player_button.draw(self.ui_layer):
             self.menu_state = "choice_characters_1"
             self.number_bot = 0
-        if self.one_player_button.draw(self.screen):
+        if self.one_player_button.draw(self.ui_layer):
             self.menu_state = "choice_characters_1"
             self.number_bot = 1
-        if self.exit_button.draw(self.screen):
+        if self.exit_button.draw(self.ui_layer):
             self.menu_state = "play"
 
     def _update_idle_previews(self):
@@ -520,15 +558,21 @@ class Menu:
         frames = self._idle_preview_frames.get(char_num)
         if not frames:
             return None
-        frame = frames[self._idle_anim_idx.get(char_num, 0)]
+        idx = self._idle_anim_idx.get(char_num, 0)
         size = max(pixel_size, 1)
-        return pyg.transform.scale(frame, (size, size))
+        key = (char_num, idx, size)
+        frame = self._scaled_previews.get(key)
+        if frame is None:
+            frame = pyg.transform.scale(frames[idx], (size, size))
+            self._scaled_previews[key] = frame
+        return frame
 
     def _blit_char_large(self, char_num, pos_x, pos_y, scale_factor=10):
         """
         Blit a large character preview at (pos_x, pos_y).
         Uses animated idle for chars 1-9 when IDLE-Sheet.png is available,
         otherwise falls back to the static selection icon.
+        Scaled images are kept in _scaled_previews.
         """
         if not (1 <= char_num <= len(self.image_ch)):
             return
@@ -538,9 +582,14 @@ class Menu:
         if 1 <= char_num <= 9 and char_num in self._idle_preview_frames:
             frame = self._get_idle_preview_frame(char_num, target_h)
             if frame:
-                self.screen.blit(frame, (pos_x, pos_y))
+                self.ui_layer.blit(frame, (pos_x, pos_y))
                 return
-        self.screen.blit(pyg.transform.scale(icon, (target_w, target_h)), (pos_x, pos_y))
+        key = (-char_num, target_w, target_h)
+        image = self._scaled_previews.get(key)
+        if image is None:
+            image = pyg.transform.scale(icon, (target_w, target_h))
+            self._scaled_previews[key] = image
+        self.ui_layer.blit(image, (pos_x, pos_y))
 
     def draw_character_preview(self, char_index):
         """Affiche l'aperçu du personnage à la position du joueur"""
@@ -559,14 +608,14 @@ class Menu:
         """Affiche un petit aperçu d'un personnage"""
         if isinstance(char_index, int) and 1 <= char_index <= len(self.image_ch):
             prev_img = self.image_ch[char_index - 1]
-            self.screen.blit(prev_img, (self.center_x(prev_img, x_offset), 345))
+            self.ui_layer.blit(prev_img, (self.center_x(prev_img, x_offset), 345))
 
     def handle_character_selection(self, character_var, next_state, title):
         """Gère la sélection d'un personnage avec aperçu"""
-        self.screen.blit(self.choice_chracters, (0, 0))
+        self.backgrounds.draw(self.bg_layer, "choice_chracters")
         self.draw_text(title, self.font, self.TEXT_COL, 70, 0)
 
-        if self.Back_selection_character.draw(self.screen):
+        if self.Back_selection_character.draw(self.ui_layer):
             # Déterminer l'état précédent
             if character_var == self.character_1:
                 self.menu_state = "play"
@@ -598,7 +647,7 @@ class Menu:
         ]
 
         for button_obj, char_num in character_buttons:
-            if button_obj.draw(self.screen):
+            if button_obj.draw(self.ui_layer):
                 if character_var == self.character_1:
                     self.character_1 = char_num
                 elif character_var == self.character_2:
@@ -612,10 +661,10 @@ class Menu:
 
     def handle_choice_characters_1(self):
         """Gère la sélection du premier personnage"""
-        self.screen.blit(self.choice_chracters, (0, 0))
+        self.backgrounds.draw(self.bg_layer, "choice_chracters")
         self.draw_text("Choose three characters", self.font, self.TEXT_COL, 70, 0)
 
-        if self.Back_selection_character.draw(self.screen):
+        if self.Back_selection_character.draw(self.ui_layer):
             self.menu_state = "play"
 
         character_buttons = [
@@ -640,7 +689,7 @@ class Menu:
         ]
 
         for button_obj, char_num in character_buttons:
-            if button_obj.draw(self.screen):
+            if button_obj.draw(self.ui_layer):
                 self.character_1 = char_num
                 self.menu_state = "choice_characters_2"
 
@@ -648,10 +697,10 @@ class Menu:
 
     def handle_choice_characters_2(self):
         """Gère la sélection du deuxième personnage"""
-        self.screen.blit(self.choice_chracters, (0, 0))
+        self.backgrounds.draw(self.bg_layer, "choice_chracters")
         self.draw_text("Choose two characters", self.font, self.TEXT_COL, 70, 0)
 
-        if self.Back_selection_character.draw(self.screen):
+        if self.Back_selection_character.draw(self.ui_layer):
             self.menu_state = "choice_characters_1"
 
         character_buttons = [
@@ -676,7 +725,7 @@ class Menu:
         ]
 
         for button_obj, char_num in character_buttons:
-            if button_obj.draw(self.screen):
+            if button_obj.draw(self.ui_layer):
                 self.character_2 = char_num
                 self.menu_state = "choice_characters_3"
 
@@ -689,10 +738,10 @@ class Menu:
 
     def handle_choice_characters_3(self):
         """Gère la sélection du troisième personnage et affiche le bouton start"""
-        self.screen.blit(self.choice_chracters, (0, 0))
+        self.backgrounds.draw(self.bg_layer, "choice_chracters")
         self.draw_text("Choose one character", self.font, self.TEXT_COL, 70, 0)
 
-        if self.Back_selection_character.draw(self.screen):
+        if self.Back_selection_character.draw(self.ui_layer):
             self.menu_state = "choice_characters_2"
 
         character_buttons = [
@@ -717,7 +766,7 @@ class Menu:
         ]
 
         for button_obj, char_num in character_buttons:
-            if button_obj.draw(self.screen):
+            if button_obj.draw(self.ui_layer):
                 self.character_3 = char_num
 
         # Afficher l'aperçu du 3e personnage (ou 2e s'il n'est pas encore choisi)
@@ -730,39 +779,17 @@ class Menu:
             self.draw_small_character_preview(self.character_1, 50)
 
         # Afficher le bouton start si les 3 personnages sont choisis
-        if self.character_3 and self.start_button.draw(self.screen):
+        if self.character_3 and self.start_button.draw(self.ui_layer):
             self.menu_state = "start game"
             self.etat = "game"
 
     def handle_character_selection_final(self):
         # Draw background
-        self.screen.blit(self.choice_chracters, (0, 0))
+        self.backgrounds.draw(self.bg_layer, "choice_chracters")
         self.draw_text_center("Choose three characters", 
                              self.font, self.TEXT_COL, 20)
 
-        # Display character selection buttons
-        character_buttons = [
-            (self.character_1_button, 1),
-            (self.character_2_button, 2),
-            (self.character_3_button, 3),
-            (self.character_4_button, 4),
-            (self.character_5_button, 5),
-            (self.character_6_button, 6),
-            (self.character_7_button, 7),
-            (self.character_8_button, 8),
-            (self.character_9_button, 9),
-            (self.character_10_button, 10),
-            (self.character_11_button, 11),
-            (self.character_12_button, 12),
-            (self.character_13_button, 13),
-            (self.character_14_button, 14),
-            (self.character_15_button, 15),
-            (self.character_16_button, 16),
-            (self.character_17_button, 17),
-            (self.character_18_button, 18),
-        ]
-
-        if self.Back_selection_character.draw(self.screen):
+        if self.Back_selection_character.draw(self.ui_layer):
             self.menu_state = "play"
             self.character_1 = 0
             self.character_2 = 0
@@ -773,8 +800,8 @@ class Menu:
             self.current_session_name = None
 
         # Handle character button clicks for current player's selection
-        for button_obj, char_num in character_buttons:
-            if button_obj.draw(self.screen):
+        for button_obj, char_num in self.character_buttons:
+            if button_obj.draw(self.ui_layer):
                 # Store order of selection
                 if not self.character_1:
                     self.character_1 = char_num
@@ -800,10 +827,9 @@ class Menu:
         max_human_slot = 4 - self.number_bot
 
         # Détection clic franc (mousedown ce frame, pas le frame d'avant)
-        cur_mouse = pyg.mouse.get_pressed()[0]
-        just_clicked = cur_mouse and not self._prev_mouse
-        self._prev_mouse = cur_mouse
-        mouse_pos = pyg.mouse.get_pos()
+        snapshot = current_snapshot()
+        just_clicked = snapshot.mouse_just_pressed(0)
+        mouse_pos = snapshot.mouse_pos
 
         self._update_idle_previews()
 
@@ -822,16 +848,16 @@ class Menu:
                 self._blit_char_large(char_3, pos_x, pos_y)
 
                 if char_2 and 1 <= char_2 <= len(self.image_ch):
-                    self.screen.blit(self.image_ch[char_2 - 1], (pos_x - 40, pos_y + 214))
+                    self.ui_layer.blit(self.image_ch[char_2 - 1], (pos_x - 40, pos_y + 214))
 
                 if char_1 and 1 <= char_1 <= len(self.image_ch):
-                    self.screen.blit(self.image_ch[char_1 - 1], (pos_x + 196, pos_y + 214))
+                    self.ui_layer.blit(self.image_ch[char_1 - 1], (pos_x + 196, pos_y + 214))
 
             elif char_2 and 1 <= char_2 <= len(self.image_ch):
                 self._blit_char_large(char_2, pos_x, pos_y)
 
                 if char_1 and 1 <= char_1 <= len(self.image_ch):
-                    self.screen.blit(self.image_ch[char_1 - 1], (pos_x - 40, pos_y + 214))
+                    self.ui_layer.blit(self.image_ch[char_1 - 1], (pos_x - 40, pos_y + 214))
 
             elif char_1 and 1 <= char_1 <= len(self.image_ch):
                 self._blit_char_large(char_1, pos_x, pos_y)
@@ -874,7 +900,7 @@ class Menu:
 
         # Show PLAY button if current player has selected all 3 characters and not already ready
         if self.character_1 and self.character_2 and self.character_3 and not self.players_ready[self.my_player_id]:
-            if self.start_button.draw(self.screen):
+            if self.start_button.draw(self.ui_layer):
                 # Mark current player as ready
                 self.players_ready[self.my_player_id] = True
                 # Prepare data to send to server with all 3 characters
@@ -897,8 +923,20 @@ class Menu:
             self.menu_state = "start game"
             self.etat = "game"
 
+    def _prioritize_selected_sprites(self):
+        """Push the selected characters to the front of the SpriteLoader queue."""
+        selection = (self.character_1, self.character_2, self.character_3)
+        if selection != self._prioritized_selection:
+            self._prioritized_selection = selection
+            self.sprite_loader.prioritize(selection)
+
+    def selected_characters(self):
+        """Selected character numbers (character_1..3), without empty slots."""
+        return [c for c in (self.character_1, self.character_2, self.character_3) if c]
+
     def method_menu(self):
         """Méthode principale gérant tous les états du menu"""
+        self._prioritize_selected_sprites()
         if self.menu_state == "main":
             self.handle_main_menu()
         elif self.menu_state == "settings":
@@ -906,13 +944,15 @@ class Menu:
         elif self.menu_state == "creation_parameters_session_menu":
             self.handle_session_menu()
 
-            # Fond du modal
+            # Fond du modal (dessin immédiat: on vide d'abord la file de rendu)
+            self.render_queue.flush(self.screen)
             pyg.draw.rect(self.screen, (30, 30, 30), (350, 150, 600, 450))
 
             self.draw_text_center("Configuration", self.font, self.TEXT_COL, 170)
 
             self.input_box.rect.x = 500
             self.input_box.rect.y = 245
+            self.render_queue.flush(self.screen)
             self.input_box.draw(self.screen)
 
             self.draw_text(
@@ -922,15 +962,15 @@ class Menu:
                 380,
                 320,
             )
-            if self.input_box.btn_plus_ia.draw(self.screen):
+            if self.input_box.btn_plus_ia.draw(self.ui_layer):
                 self.input_box.temp_nb_ia += 1
             if (
-                self.input_box.btn_moins_ia.draw(self.screen)
+                self.input_box.btn_moins_ia.draw(self.ui_layer)
                 and self.input_box.temp_nb_ia > 0
             ):
                 self.input_box.temp_nb_ia -= 1
 
-            if self.input_box.validate_button.draw(self.screen):
+            if self.input_box.validate_button.draw(self.ui_layer):
                 session_data = {
                     "titre": self.input_box.text
                     if self.input_box.text != ""
@@ -973,37 +1013,13 @@ class Menu:
 
 
 class Session:
+    """
+    Session data received from the server.
+    Drawing is done by the pooled rows of ui.session_list.SessionList.
+    """
+
     def __init__(self, menu):
         self.menu = menu
-        self.screen = menu.screen
-
-        # Chargement et redimensionnement des assets
-        self.bar_session = pyg.image.load(
-            "assets/Menus_assets/sessions_section/BAR.png"
-        ).convert_alpha()
-        self.bot_session = pyg.transform.scale(
-            pyg.image.load("assets/Menus_assets/sessions_section/BOT.png"), (30, 20)
-        ).convert_alpha()
-        self.player_session = pyg.transform.scale(
-            pyg.image.load("assets/Menus_assets/sessions_section/player.png"), (30, 20)
-        ).convert_alpha()
-        self.button_img = pyg.image.load(
-            "assets/Menus_assets/sessions_section/Button.png"
-        ).convert_alpha()
-        self.splash_session = pyg.transform.scale(
-            pyg.image.load("assets/Menus_assets/sessions_section/splash.png"),
-            (150, 150),
-        ).convert_alpha()
-        self.star_bar_session = pyg.transform.scale(
-            pyg.image.load("assets/Menus_assets/sessions_section/Star_Bar.png"),
-            (367, 244),
-        ).convert_alpha()
-
-        # Bouton "Join" spécifique à cette session
-        self.join_button = button.Button(
-            x=691, y=231, image=self.button_img, scale=0.25
-        )
-
 
         self.gap = 125
         self.y = 79
@@ -1022,77 +1038,19 @@ class Session:
             "gap": self.gap,
         }
 
+    def update_from_dict(self, data):
+        self.titre = data.get("titre", "Sans titre")
+        self.nb_bots = data.get("nb_bots", 0)
+        self.nb_players = data.get("nb_players", 1)
+        self.y = data.get("y", 79)
+        self.gap = data.get("gap", 125)
+
     @staticmethod
     def from_dict(data, menu):
         session = Session(menu)
-        session.titre = data.get("titre", "Sans titre")
-        session.nb_bots = data.get("nb_bots", 0)
-        session.nb_players = data.get("nb_players", 1)
-        session.y = data.get("y", 79)
-        session.gap = data.get("gap", 125)
+        session.update_from_dict(data)
         return session
 
-    def draw_session(self, y_scrollé):
-        """Affiche la ligne de session avec ses paramètres"""
-        self.join_button.rect.y = y_scrollé + 152
-
-        # Barre de fond
-        self.screen.blit(self.bar_session, (310, y_scrollé))
-
-        # Nom de la session (Text)
-        self.menu.draw_text(self.titre, self.menu.font, "Black", 391, y_scrollé + 113)
-
-        # Check if session is full
-        is_session_full = self.nb_players + self.nb_bots >= 4
-        
-        # Bouton Rejoindre ou FULL et son texte
-        if not is_session_full:
-            if self.join_button.draw(self.screen):
-                print(f"Tentative de rejoindre : {self.titre}")
-                # Réinitialiser les variables de sélection
-                self.menu.character_1 = 0
-                self.menu.character_2 = 0
-                self.menu.character_3 = 0
-                self.menu.current_session_name = self.titre
-                self.menu.number_players = self.nb_players
-                self.menu.number_bot = self.nb_bots
-                
-                # Réinitialiser les sélections de tous les joueurs
-                for p_id in range(1, 5):
-                    self.menu.players_characters[p_id] = [None, None, None]
-                    self.menu.players_ready[p_id] = False
-
-                
-                self.menu.pending_join_session = self.titre
-                self.menu.menu_state = "waiting_player_id"
-            
-            button_text = "Join"
-        else:
-            # Session is full - display FULL button (disabled)
-            self.join_button.draw(self.screen)  # Still draw button for visual consistency
-            button_text = "FULL"
-
-        self.menu.draw_text(
-            button_text, self.menu.middle_font, "Black", 745, y_scrollé + 186
-        )
-
-        # Décorations (Splash et Star Bar)
-        self.screen.blit(self.splash_session, (845, y_scrollé + 100))
-        self.screen.blit(self.star_bar_session, (357, y_scrollé + 87))
-
-        # Icones (IA et Joueurs)
-        self.screen.blit(self.bot_session, (450, y_scrollé + 188))
-        self.screen.blit(self.player_session, (530, y_scrollé + 188))
-
-        # VALEURS des paramètres
-        self.menu.draw_text(
-            str(self.nb_bots), self.menu.middle_font, "Black", 490, y_scrollé + 188
-        )
-        available_slots = self.nb_players
-        self.menu.draw_text(
-            str(available_slots), self.menu.middle_font, "Black", 570, y_scrollé + 188
-        )
-
 
 class InputBox:
     def __init__(self, x, y, w, h, text="", button_session=None, menu=None):
@@ -1103,6 +1061,7 @@ class InputBox:
         self.txt_surface = self.font.render(text, True, self.color)
         self.active = False
         self.screen = menu.screen
+        self.text_cache = menu.text_cache
 
         # Variables parameters
         self.temp_nb_ia = 0
@@ -1117,6 +1076,8 @@ class InputBox:
         self.validate_button = button.Button(550, 520, button_session, 0.5)
 
     def handle_event(self, event):
+        """Returns True if the event changed the box (focus or text)."""
+        was_active = self.active
         if event.type == pyg.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.active = not self.active
@@ -1125,6 +1086,7 @@ class InputBox:
             self.color = (
                 pyg.Color("dodgerblue2") if self.active else pyg.Color("lightskyblue3")
             )
+            return self.active != was_active
 
         if event.type == pyg.KEYDOWN and self.active:
             if event.key == pyg.K_BACKSPACE:
@@ -1132,6 +1094,8 @@ class InputBox:
             elif len(self.text) < 15:
                 self.text += event.unicode
             self.txt_surface = self.font.render(self.text, True, (255, 255, 255))
+            return True
+        return False
 
     def draw(self, screen):
         # Dessin du texte de l'InputBox et son contour
@@ -1151,7 +1115,7 @@ class InputBox:
         self.draw_text(text="Confirm", font=self.font, text_col="Black", x=550, y=520)
 
     def draw_text(self, text, font, text_col, x, y):
-        img = font.render(text, True, text_col)
+        img = self.text_cache.render(font, text, text_col)
         self.screen.blit(img, (x, y))
 
     def clean(self):
@@ -5,6 +5,7 @@ from . import animated_button
 import game.characters as player_module
 
 from utils.paths import get_asset_path
+from utils.display_format import convert_pending, expect_display
 from ui import Buttons as ObjButton
 
 WINDOW_WIDTH = 1280
@@ -17,6 +18,8 @@ class Menu_in_game:
         self.width = width
         self.height = height
         self.fullscreen = fullscreen
+        # The window is opened below: frames loaded until then are queued
+        expect_display()
         # PLAYER INITIALIZATION
         self.player = player_module.Furnace()
         # MENU STATE VARIABLES
@@ -51,6 +54,8 @@ class Menu_in_game:
         # Display setup
         flags = pyg.FULLSCREEN if self.fullscreen else 0
         self.screen = pyg.display.set_mode((self.width, self.height), flags)
+        # Frames loaded before the window existed (the Furnace)
+        convert_pending()
         pyg.display.set_caption("Jeu Multijoueur")
         self.clock = pyg.time.Clock()
         # FONT AND COLOR SETUP
@@ -0,0 +1,121 @@
+import time
+
+import pygame as pyg
+
+# Draw layers, flushed in increasing order
+LAYER_BACKGROUND = 0   # wallpapers, map background
+LAYER_ENTITIES = 10    # players, enemies, effects
+LAYER_FOREGROUND = 20  # map foreground, drawn over the entities
+LAYER_PANEL = 25       # clipped scrolling panels (session list)
+LAYER_UI = 30          # buttons, labels, previews
+LAYER_OVERLAY = 40     # dev display
+
+LAYER_NAMES = {
+    LAYER_BACKGROUND: "bg",
+    LAYER_ENTITIES: "entities",
+    LAYER_FOREGROUND: "fg",
+    LAYER_PANEL: "panel",
+    LAYER_UI: "ui",
+    LAYER_OVERLAY: "overlay",
+}
+
+
+class RenderLayer:
+    """
+    Blits of one layer, collected during the frame.
+
+    Exposes ``blit`` and ``blits`` like a pygame Surface, so any widget
+    drawing on a surface (Button, AnimatedButton, BitmapFont...) can draw
+    into a layer unchanged.
+
+    Attributes:
+        items (list): (surface, dest, area) tuples in submission order
+        clip (pygame.Rect): Clip rect applied when the layer is flushed
+    """
+
+    __slots__ = ("items", "clip")
+
+    def __init__(self, clip=None):
+        self.items = []
+        self.clip = clip
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Queue a blit; same arguments as ``Surface.blit`` (flags ignored)."""
+        self.items.append((source, dest, area))
+
+    def blits(self, blit_sequence, doreturn=True):
+        """Queue a sequence of blits; same items as ``Surface.blits``."""
+        self.items.extend(blit_sequence)
+
+
+class RenderQueue:
+    """
+    Per-frame render queue.
+
+    Draw code submits (surface, dest, area) to a layer instead of blitting
+    right away; ``flush`` then draws every layer in order with a single
+    ``Surface.blits(..., doreturn=False)`` call per layer and measures the
+    time spent in each one. Immediate drawing (``pygame.draw``) must call
+    ``flush`` first so that what was queued before stays underneath.
+
+    Attributes:
+        last_timings (dict): Layer -> milliseconds spent in the last frame
+    """
+
+    def __init__(self):
+        self._layers = {}
+        self._order = []
+        self._timings = {}
+        self.last_timings = {}
+
+    def layer(self, layer, clip=None):
+        """
+        Get a layer to draw into.
+
+        Args:
+            layer (int): Layer constant (LAYER_*)
+            clip (pygame.Rect): Clip rect of the layer, None to keep the
+                current one (a layer starts unclipped)
+
+        Returns:
+            RenderLayer: Surface-like collector for that layer
+        """
+        render_layer = self._layers.get(layer)
+        if render_layer is None:
+            render_layer = self._layers[layer] = RenderLayer()
+            self._order = sorted(self._layers)
+        if clip is not None:
+            render_layer.clip = pyg.Rect(clip)
+        return render_layer
+
+    def submit(self, surface, dest, area=None, layer=LAYER_UI):
+        """Queue a single blit on ``layer``."""
+        self.layer(layer).items.append((surface, dest, area))
+
+    def flush(self, target):
+        """
+        Draw and clear every queued layer.
+
+        Args:
+            target (pygame.Surface): Surface to draw on (the screen)
+        """
+        timings = self._timings
+        for layer in self._order:
+            render_layer = self._layers[layer]
+            items = render_layer.items
+            if not items:
+                continue
+            start = time.perf_counter()
+            if render_layer.clip is not None:
+                target.set_clip(render_layer.clip)
+                target.blits(items, doreturn=False)
+                target.set_clip(None)
+            else:
+                target.blits(items, doreturn=False)
+            timings[layer] = timings.get(layer, 0.0) + (time.perf_counter() - start) * 1000
+            items.clear()
+
+    def end_frame(self):
+        """Publish the layer timings of the frame (call once per frame, after flush)."""
+        self.last_timings = self._timings
+        self._timings = {}
@@ -2,6 +2,7 @@ import json
 import socket
 import threading
 
+from ui.bots import INPUT_PREFIX, BotPool
 from ui.console import (
     print_debug,
     print_error,
@@ -18,6 +19,8 @@ MAX_CLIENTS = 2
 
 MESSAGE_BUFFER_SIZE = 4096
 MSG_DELIMITER = "\n"
+MAX_PLAYERS = 4
+POSITION_PREFIX = "Position du joueur"
 
 
 class Serveur:
@@ -38,11 +41,19 @@ class Serveur:
         self.sessions_characters = {}
         self.socket_player_ids = {}
 
+        # PLAYER STATE: last position and input of each slot, humans and bots
+        self.session_positions = {}
+        self.session_inputs = {}
+        # Ready human slots per session; bots start once they are all ready
+        self.sessions_ready = {}
+        self.bots = BotPool(submit=self.submit_bot_input, observe=self.human_positions)
+
     def start_server(self):
         self.server_socket.listen(MAX_CLIENTS)
         print_success(f"Serveur démarré sur {self.Host}:{self.Port}")
         accept_thread = threading.Thread(target=self.accept_clients, daemon=True)
         accept_thread.start()
+        self.bots.start()
 
     def accept_clients(self):
         while True:
@@ -106,6 +117,10 @@ class Serveur:
             self.clients.remove(client_socket)
         self.recv_buffers.pop(client_socket, None)
         print_error("Client déconnecté")
+        slot = self.socket_player_ids.get(client_socket)
+        if slot is not None:
+            self._leave_session(client_socket, slot[0])
+            self.broadcast_sessions()
 
     def _handle_message(self, data, client_socket):
 
@@ -132,7 +147,7 @@ class Serveur:
                 self.sessions.append(new_session_data)
                 self.sessions_clients_joined[new_session_data["titre"]] = []
                 self.sessions_characters[new_session_data["titre"]] = {}
-
+                self.sessions_ready[new_session_data["titre"]] = set()
             self.broadcast_sessions()
 
         elif data.startswith("[JoinedSession]:"):
@@ -213,36 +228,94 @@ class Serveur:
             print_network("CharacterUpdate diffusé")
 
         elif data.startswith("[PlayerUnready]:"):
+            slot = self.socket_player_ids.get(client_socket)
+            if slot is not None:
+                with self.sessions_lock:
+                    self.sessions_ready.get(slot[0], set()).discard(slot[1])
             self.broadcast_raw(data, exclude_socket=client_socket)
             print_network("PlayerUnready diffusé")
         elif data.startswith("[LeaveSession]:"):
             session_name = data.split(":", 1)[1]
-            with self.sessions_lock:
-                if session_name in self.sessions_clients_joined:
-                    if client_socket in self.sessions_clients_joined[session_name]:
-                        self.sessions_clients_joined[session_name].remove(client_socket)
-                for s in self.sessions:
-                    if s["titre"] == session_name:
-                        s["nb_players"] = max(0, s.get("nb_players", 1) - 1)
-                        break
-
-                if client_socket in self.socket_player_ids:
-                    left_session, left_pid = self.socket_player_ids.pop(client_socket)
-                    if left_session in self.sessions_characters:
-                        self.sessions_characters[left_session].pop(left_pid, None)
-                    # Prévenir les autres que ce slot est vide
-                    self.broadcast_raw(
-                        f"[PlayerLeft]:{left_pid}", exclude_socket=client_socket
-                    )
-
+            self._leave_session(client_socket, session_name)
             self.broadcast_sessions()
 
         elif data.startswith("[PlayerReady]:"):
+            try:
+                ready = json.loads(data.split(":", 1)[1])
+                session_name = ready["session_name"]
+                with self.sessions_lock:
+                    self.sessions_ready.setdefault(session_name, set()).add(ready["player_id"])
+                self._start_bots_when_ready(session_name)
+            except Exception as e:
+                print_error(f"Erreur PlayerReady: {e}")
             self.broadcast_raw(data, exclude_socket=client_socket)
             print_network("PlayerReady diffusé")
 
+        elif data.startswith(INPUT_PREFIX):
+            try:
+                update = json.loads(data.split(":", 1)[1])
+                session_name = update["session_name"]
+                player_id = update["player_id"]
+                with self.sessions_lock:
+                    self.session_inputs.setdefault(session_name, {})[player_id] = update["keys"]
+                    self.session_positions.setdefault(session_name, {})[player_id] = tuple(
+                        update["position"]
+                    )
+                    members = list(self.sessions_clients_joined.get(session_name, ()))
+            except Exception as e:
+                print_error(f"Erreur PlayerInput: {e}")
+                return
+            for member in members:
+                if member != client_socket:
+                    self._send(member, data)
+
+        elif data.startswith(POSITION_PREFIX):
+            # "Position du joueur : x=..., y=..." envoyé à chaque frame
+            slot = self.socket_player_ids.get(client_socket)
+            if slot is None:
+                return
+            try:
+                x_part, y_part = data.split(":", 1)[1].split(",")
+                position = (float(x_part.split("=")[1]), float(y_part.split("=")[1]))
+            except (ValueError, IndexError):
+                return
+            with self.sessions_lock:
+                self.session_positions.setdefault(slot[0], {})[slot[1]] = position
+
     # SESSION MANAGEMENT
 
+    def _leave_session(self, client_socket, session_name):
+        """Retire un client d'une session ([LeaveSession] ou déconnexion)."""
+        with self.sessions_lock:
+            members = self.sessions_clients_joined.get(session_name)
+            if members is not None and client_socket in members:
+                members.remove(client_socket)
+            for s in self.sessions:
+                if s["titre"] == session_name:
+                    s["nb_players"] = max(0, s.get("nb_players", 1) - 1)
+                    break
+
+            if client_socket in self.socket_player_ids:
+                left_session, left_pid = self.socket_player_ids.pop(client_socket)
+                if left_session in self.sessions_characters:
+                    self.sessions_characters[left_session].pop(left_pid, None)
+                # The bots stop chasing the player who left
+                self.session_positions.get(left_session, {}).pop(left_pid, None)
+                self.session_inputs.get(left_session, {}).pop(left_pid, None)
+                self.sessions_ready.get(left_session, set()).discard(left_pid)
+                # Prévenir les autres que ce slot est vide
+                self.broadcast_raw(
+                    f"[PlayerLeft]:{left_pid}", exclude_socket=client_socket
+                )
+
+            empty = not self.sessions_clients_joined.get(session_name)
+            if empty:
+                self.session_positions.pop(session_name, None)
+                self.session_inputs.pop(session_name, None)
+                self.sessions_ready.pop(session_name, None)
+        if empty:
+            self._stop_bots(session_name)
+
     def broadcast_sessions(self):
         """Envoie la liste des sessions à jour à TOUS les clients connectés."""
         try:
@@ -263,6 +336,47 @@ class Serveur:
         except Exception as e:
             print_error(f"Erreur broadcast sessions: {e}")
 
+    # BOTS
+
+    def _start_bots_when_ready(self, session_name):
+        """
+        Les slots > max_humans sont des bots, pilotés par le serveur une
+        fois la partie lancée : quand tous les humains sont prêts, comme
+        côté client.
+        """
+        session_info = next((s for s in self.sessions if s["titre"] == session_name), None)
+        if session_info is None:
+            return
+        nb_bots = session_info.get("nb_bots", 0)
+        max_humans = MAX_PLAYERS - nb_bots
+        with self.sessions_lock:
+            ready = len(self.sessions_ready.get(session_name, ()))
+        bot_ids = range(max_humans + 1, MAX_PLAYERS + 1)
+        if not nb_bots or ready < max_humans or (session_name, bot_ids[0]) in self.bots.bots:
+            return
+        self.bots.add_session(session_name, bot_ids)
+        print_info(f"{nb_bots} bot(s) actif(s) dans {session_name}")
+
+    def _stop_bots(self, session_name):
+        """Arrête les bots d'une session vide."""
+        if any(key[0] == session_name for key in list(self.bots.bots)):
+            self.bots.remove_session(session_name)
+            print_info(f"Bots arrêtés dans {session_name}")
+
+    def submit_bot_input(self, message):
+        """Bot decisions enter through the same handler as client messages."""
+        self._handle_message(message, None)
+
+    def human_positions(self, session_name):
+        """Snapshot of the human positions of a session, for the bots."""
+        with self.sessions_lock:
+            positions = self.session_positions.get(session_name, {})
+            return {
+                player_id: position
+                for player_id, position in positions.items()
+                if (session_name, player_id) not in self.bots.bots
+            }
+
     # GAME STATE MANAGEMENT
 
     def start_game(self):
@@ -274,6 +388,7 @@ class Serveur:
 
     def stop_server(self):
         print_info("Arrêt du serveur...")
+        self.bots.stop()
         for client in self.clients:
             try:
                 client.close()
@@ -0,0 +1,189 @@
+import pygame as pyg
+
+from . import button
+from .render_queue import LAYER_PANEL
+
+SESSION_ASSETS = "assets/Menus_assets/sessions_section"
+SESSION_ZONE = (300, 200, 750, 320)
+
+
+class SessionRowAssets:
+    """Images shared by every session row, loaded once for the whole list."""
+
+    def __init__(self):
+        self.bar = pyg.image.load(f"{SESSION_ASSETS}/BAR.png").convert_alpha()
+        self.bot = pyg.transform.scale(
+            pyg.image.load(f"{SESSION_ASSETS}/BOT.png"), (30, 20)
+        ).convert_alpha()
+        self.player = pyg.transform.scale(
+            pyg.image.load(f"{SESSION_ASSETS}/player.png"), (30, 20)
+        ).convert_alpha()
+        self.button = pyg.image.load(f"{SESSION_ASSETS}/Button.png").convert_alpha()
+        self.splash = pyg.transform.scale(
+            pyg.image.load(f"{SESSION_ASSETS}/splash.png"), (150, 150)
+        ).convert_alpha()
+        self.star_bar = pyg.transform.scale(
+            pyg.image.load(f"{SESSION_ASSETS}/Star_Bar.png"), (367, 244)
+        ).convert_alpha()
+
+        # Vertical extent of the visible pixels of a row, relative to its y
+        layout = [
+            (self.bar, 0),
+            (self.splash, 100),
+            (self.star_bar, 87),
+            (self.bot, 188),
+            (self.player, 188),
+        ]
+        tops, bottoms = [], []
+        for image, offset in layout:
+            bounds = image.get_bounding_rect()
+            tops.append(offset + bounds.top)
+            bottoms.append(offset + bounds.bottom)
+        self.top = min(tops)
+        self.bottom = max(bottoms)
+
+
+class SessionRow:
+    """
+    Reusable row widget drawing whichever Session it is bound to.
+
+    Rows are pooled by SessionList: binding only swaps the data reference,
+    the join button and images are kept.
+    """
+
+    def __init__(self, menu, assets):
+        self.menu = menu
+        self.assets = assets
+        self.session = None
+        # Bouton "Join" de la ligne
+        self.join_button = button.Button(
+            x=691, y=231, image=assets.button, scale=0.25
+        )
+
+    def bind(self, session):
+        if session is not self.session:
+            self.session = session
+            self.join_button.clicked = False
+
+    def draw(self, surface, y_scrollé):
+        """Affiche la ligne de session avec ses paramètres"""
+        session = self.session
+        assets = self.assets
+        menu = self.menu
+        self.join_button.rect.y = y_scrollé + 152
+
+        # Barre de fond
+        surface.blit(assets.bar, (310, y_scrollé))
+
+        # Nom de la session (Text)
+        menu.draw_text(session.titre, menu.font, "Black", 391, y_scrollé + 113, surface)
+
+        # Check if session is full
+        is_session_full = session.nb_players + session.nb_bots >= 4
+
+        # Bouton Rejoindre ou FULL et son texte
+        if not is_session_full:
+            if self.join_button.draw(surface):
+                menu.join_session(session)
+            button_text = "Join"
+        else:
+            # Session is full - display FULL button (disabled)
+            self.join_button.draw(surface)  # Still draw button for visual consistency
+            button_text = "FULL"
+
+        menu.draw_text(button_text, menu.middle_font, "Black", 745, y_scrollé + 186, surface)
+
+        # Décorations (Splash et Star Bar)
+        surface.blit(assets.splash, (845, y_scrollé + 100))
+        surface.blit(assets.star_bar, (357, y_scrollé + 87))
+
+        # Icones (IA et Joueurs)
+        surface.blit(assets.bot, (450, y_scrollé + 188))
+        surface.blit(assets.player, (530, y_scrollé + 188))
+
+        # VALEURS des paramètres
+        menu.draw_text(
+            str(session.nb_bots), menu.middle_font, "Black", 490, y_scrollé + 188, surface
+        )
+        menu.draw_text(
+            str(session.nb_players), menu.middle_font, "Black", 570, y_scrollé + 188, surface
+        )
+
+
+class SessionList:
+    """
+    Virtualized list of sessions.
+
+    Only the rows intersecting the visible zone are drawn, using a small pool
+    of SessionRow widgets, so the cost per frame does not depend on the number
+    of sessions.
+
+    Attributes:
+        zone (pygame.Rect): Visible area of the list on screen
+        rows (list): Pool of SessionRow widgets
+        drawn_last_frame (int): Rows drawn during the last call to draw
+    """
+
+    def __init__(self, menu, zone=SESSION_ZONE):
+        """
+        Load the shared row assets.
+
+        Args:
+            menu (Menu): Menu owning the list (screen, fonts, join handling)
+            zone (tuple): Visible (x, y, w, h) area of the list
+        """
+        self.menu = menu
+        self.zone = pyg.Rect(zone)
+        self.assets = SessionRowAssets()
+        self.rows = []
+        self.drawn_last_frame = 0
+
+    def visible_range(self, sessions, scroll_y):
+        """
+        Get the indices of the sessions intersecting the visible zone.
+
+        Sessions are laid out every ``gap`` pixels starting at the first
+        session's ``y`` (see Menu.update_sessions_from_server).
+
+        Args:
+            sessions (list): Session objects
+            scroll_y (int): Current scroll offset
+
+        Returns:
+            range: Indices of the sessions to draw
+        """
+        if not sessions:
+            return range(0)
+        first = sessions[0]
+        gap = max(1, first.gap)
+        origin = first.y - scroll_y
+        start = (self.zone.top - self.assets.bottom - origin) // gap + 1
+        stop = (self.zone.bottom - self.assets.top - origin - 1) // gap + 1
+        return range(max(0, start), min(len(sessions), stop))
+
+    def _row(self, index, gap):
+        # A session keeps the same row while it stays visible: the pool is
+        # large enough for every row that can intersect the zone at once.
+        capacity = (self.zone.height + self.assets.bottom - self.assets.top) // gap + 2
+        slot = index % capacity
+        while len(self.rows) <= slot:
+            self.rows.append(SessionRow(self.menu, self.assets))
+        return self.rows[slot]
+
+    def draw(self, render_queue, sessions, scroll_y):
+        """
+        Queue the visible sessions on the panel layer, clipped to the zone.
+
+        Args:
+            render_queue (RenderQueue): Frame render queue
+            sessions (list): Session objects
+            scroll_y (int): Current scroll offset
+        """
+        visible = self.visible_range(sessions, scroll_y)
+        layer = render_queue.layer(LAYER_PANEL, clip=self.zone)
+        for index in visible:
+            session = sessions[index]
+            row = self._row(index, max(1, session.gap))
+            row.bind(session)
+            row.draw(layer, session.y - scroll_y)
+        self.drawn_last_frame = len(visible)
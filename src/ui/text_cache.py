@@ -0,0 +1,158 @@
+from collections import OrderedDict
+
+import pygame as pyg
+
+DEFAULT_MAX_ENTRIES = 256
+BITMAP_CHARSET = "0123456789-+.,:/ "
+
+
+def _color_key(color):
+    """Return a hashable key for any color accepted by ``Font.render``."""
+    if isinstance(color, pyg.Color):
+        return tuple(color)
+    return color
+
+
+class TextCache:
+    """
+    Bounded LRU cache of rendered text surfaces.
+
+    Entries are keyed by (font, text, color, antialias), so static labels such
+    as "Create session", "READY" or session titles are rendered once and then
+    blitted from the cache. The least recently used entry is evicted when
+    ``max_entries`` is reached.
+
+    Attributes:
+        max_entries (int): Maximum number of cached surfaces
+        hits (int): Total cache hits since creation
+        misses (int): Total cache misses (real ``font.render`` calls)
+        saved_last_frame (int): Render calls avoided during the last frame
+        rendered_last_frame (int): Render calls issued during the last frame
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of cached surfaces
+        """
+        self.max_entries = max(1, max_entries)
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._frame_hits = 0
+        self._frame_misses = 0
+        self.saved_last_frame = 0
+        self.rendered_last_frame = 0
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Return the rendered surface for ``text``, rendering it only on a miss.
+
+        Args:
+            font (pygame.font.Font): Font used to render
+            text (str): Text to render
+            color: Any color accepted by ``Font.render``
+            antialias (bool): Antialiasing flag
+
+        Returns:
+            pygame.Surface: Rendered text (shared, must not be modified)
+        """
+        key = (font, text, _color_key(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            self._frame_hits += 1
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        self.misses += 1
+        self._frame_misses += 1
+        return surface
+
+    def end_frame(self):
+        """Publish the per-frame counters and reset them for the next frame."""
+        self.saved_last_frame = self._frame_hits
+        self.rendered_last_frame = self._frame_misses
+        self._frame_hits = 0
+        self._frame_misses = 0
+
+    def clear(self):
+        """Drop every cached surface."""
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+class BitmapFont:
+    """
+    Pre-rendered glyph font for frequently changing text (counters, overlay).
+
+    Each glyph is rendered once; drawing a string is a single ``Surface.blits``
+    call, so values that change every frame never hit ``font.render``.
+    Characters outside ``charset`` are rendered lazily on first use.
+    """
+
+    def __init__(self, font, color, charset=BITMAP_CHARSET, antialias=True):
+        """
+        Pre-render the glyphs of ``charset``.
+
+        Args:
+            font (pygame.font.Font): Font used to render glyphs
+            color: Glyph color
+            charset (str): Characters rendered up front
+            antialias (bool): Antialiasing flag
+        """
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_height()
+        self.glyphs = {}
+        for char in charset:
+            self._glyph(char)
+
+    def _glyph(self, char):
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.font.render(char, self.antialias, self.color)
+            self.glyphs[char] = glyph
+        return glyph
+
+    def size(self, text):
+        """
+        Get the size ``text`` would occupy once drawn.
+
+        Args:
+            text (str): Text to measure
+
+        Returns:
+            tuple: (width, height) in pixels
+        """
+        return sum(self._glyph(c).get_width() for c in text), self.height
+
+    def draw(self, surface, text, pos):
+        """
+        Draw ``text`` glyph by glyph at ``pos``.
+
+        Args:
+            surface (pygame.Surface): Target surface
+            text (str): Text to draw
+            pos (tuple): Top-left (x, y) position
+
+        Returns:
+            int: X coordinate just after the last glyph
+        """
+        x, y = pos
+        sequence = []
+        for char in text:
+            glyph = self._glyph(char)
+            sequence.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.blits(sequence, doreturn=False)
+        return x
@@ -0,0 +1,208 @@
+import json
+import mmap
+import os
+import struct
+
+import pygame as pyg
+
+from utils.layer_cache import source_hash
+from utils.paths import find_project_root, get_asset_path
+
+PACK_MAGIC = b"PYGPACK1"
+PACK_HEADER = struct.Struct("<8sI")  # magic, index length
+PACK_ALIGN = 16
+PIXEL_FORMAT = "RGBA"
+DEFAULT_PACK_PATH = os.path.join("build", "assets.pack")
+
+_default_pack = None
+_default_pack_checked = False
+
+
+def pack_key(*parts):
+    """Key of a sheet inside a pack: its path relative to assets/, with '/'."""
+    return "/".join(parts)
+
+
+def build_pack(sheets, out_path):
+    """
+    Write an asset pack with pre-sliced, pre-flipped raw RGBA frames.
+
+    Layout: PACK_HEADER, JSON index, then the frames' raw pixels, each
+    aligned on PACK_ALIGN bytes. The index maps every sheet key to
+    ``{"size": [w, h], "source": hash, "right": [offsets], "left": [offsets]}``,
+    *source* being the source_hash of the PNG the frames were cut from.
+
+    Args:
+        sheets (list): (key, path, frame_width, frame_height) tuples
+        out_path (str): Pack file to write
+
+    Returns:
+        dict: The index written in the pack
+    """
+    index = {}
+    blobs = []
+    offset = 0
+    for key, path, frame_w, frame_h in sheets:
+        sheet = pyg.image.load(path)
+        if sheet.get_height() < frame_h:
+            continue  # not a strip of frames, CharacterType cannot slice it either
+        count = sheet.get_width() // frame_w
+        entry = {"size": [frame_w, frame_h], "source": source_hash(path), "right": [], "left": []}
+        for i in range(count):
+            frame = sheet.subsurface((i * frame_w, 0, frame_w, frame_h))
+            for direction, image in (
+                ("right", frame),
+                ("left", pyg.transform.flip(frame, True, False)),
+            ):
+                raw = pyg.image.tobytes(image, PIXEL_FORMAT)
+                entry[direction].append(offset)
+                padding = -len(raw) % PACK_ALIGN
+                blobs.append(raw + b"\0" * padding)
+                offset += len(raw) + padding
+        index[key] = entry
+
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    data_start = PACK_HEADER.size + len(index_bytes)
+    data_start += -data_start % PACK_ALIGN
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    with open(out_path, "wb") as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        f.write(b"\0" * (data_start - f.tell()))
+        for blob in blobs:
+            f.write(blob)
+    return index
+
+
+class AssetPack:
+    """
+    Memory-mapped asset pack built by build_pack.
+
+    Frames are created with ``pygame.image.frombuffer`` directly on the
+    mapped file: no PNG decoding, no slicing and no flipping at runtime.
+    The pack must stay open while its surfaces are in use. A sheet whose
+    PNG was edited since the pack was built is stale (``is_current``), its
+    PNG must be used instead.
+
+    Attributes:
+        path (str): Pack file path
+        index (dict): Sheet key -> frame offsets
+    """
+
+    def __init__(self, path):
+        """
+        Map the pack file and read its index.
+
+        Args:
+            path (str): Pack file path
+
+        Raises:
+            ValueError: If the file is not an asset pack
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_len = PACK_HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"Pas un pack d'assets: {path}")
+        start = PACK_HEADER.size
+        self.index = json.loads(self._map[start:start + index_len].decode("utf-8"))
+        data_start = start + index_len
+        self._data_start = data_start + (-data_start % PACK_ALIGN)
+        self._view = memoryview(self._map)
+        self._current = {}  # key -> packed frames match the source PNG
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def is_current(self, key, source_path):
+        """
+        True if the packed frames of *key* were cut from the current
+        *source_path* (same source_hash). Checked once per key.
+        """
+        current = self._current.get(key)
+        if current is None:
+            try:
+                current = self.index[key].get("source") == source_hash(source_path)
+            except OSError:
+                current = False
+            self._current[key] = current
+        return current
+
+    def frames(self, key, direction="right"):
+        """
+        Surfaces of a packed sheet.
+
+        Args:
+            key (str): Sheet key (see pack_key)
+            direction (str): 'right' or 'left' (pre-flipped)
+
+        Returns:
+            list: pygame Surfaces backed by the mapped file
+        """
+        entry = self.index[key]
+        width, height = entry["size"]
+        size = width * height * 4
+        base = self._data_start
+        view = self._view
+        return [
+            pyg.image.frombuffer(view[base + offset:base + offset + size], (width, height), PIXEL_FORMAT)
+            for offset in entry[direction]
+        ]
+
+    def close(self):
+        """Release the mapping (only once no surface uses it anymore)."""
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+            self._view = None
+        self._map.close()
+        self._file.close()
+
+
+def default_pack():
+    """
+    The project's asset pack (build/assets.pack) if it was built, else None.
+    Opened on first call.
+    """
+    global _default_pack, _default_pack_checked
+    if not _default_pack_checked:
+        _default_pack_checked = True
+        path = os.path.join(find_project_root(), DEFAULT_PACK_PATH)
+        if os.path.exists(path):
+            try:
+                _default_pack = AssetPack(path)
+            except (OSError, ValueError):
+                _default_pack = None
+    return _default_pack
+
+
+def set_default_pack(pack):
+    """Use *pack* (an AssetPack, or None to decode PNGs) as the default pack."""
+    global _default_pack, _default_pack_checked
+    _default_pack = pack
+    _default_pack_checked = True
+
+
+def character_sheets(frame_size=40):
+    """
+    (key, path, frame_width, frame_height) of every character sheet found
+    in assets/sprites, for build_pack.
+    """
+    sheets = []
+    sprites_dir = get_asset_path("sprites")
+    for folder in sorted(os.listdir(sprites_dir)):
+        folder_path = os.path.join(sprites_dir, folder)
+        if not os.path.isdir(folder_path):
+            continue
+        for filename in sorted(os.listdir(folder_path)):
+            if filename.endswith(".png"):
+                sheets.append(
+                    (
+                        pack_key("sprites", folder, filename),
+                        os.path.join(folder_path, filename),
+                        frame_size,
+                        frame_size,
+                    )
+                )
+    return sheets
@@ -0,0 +1,83 @@
+import threading
+
+import pygame as pyg
+
+# Frame lists loaded before set_mode, or on another thread, converted by
+# convert_pending on the main thread
+_pending = []
+_pending_lock = threading.Lock()
+# Set by expect_display: a window will be opened, queue until then
+_display_expected = False
+
+
+def expect_display():
+    """
+    Announce that a display mode will be set: frames loaded until then are
+    queued for convert_pending. Without it (server, tools, headless
+    benchmarks) frames loaded with no display are left as decoded.
+    """
+    global _display_expected
+    _display_expected = True
+
+
+def display_ready():
+    """True once a display mode is set (convert_alpha needs it)."""
+    return pyg.display.get_init() and pyg.display.get_surface() is not None
+
+
+def _convert(frames):
+    for i, surface in enumerate(frames):
+        if surface is not None:
+            frames[i] = surface.convert_alpha()
+
+
+def to_display_format(frames):
+    """
+    Convert a list of surfaces to the display pixel format, in place.
+
+    Blitting a surface that is not in the display format converts every
+    pixel on each blit; converting once at load time avoids that. When no
+    display mode is set yet but one is expected (sprites loaded before
+    set_mode, see expect_display), the list is kept and converted by
+    convert_pending once the window exists. With no display expected the
+    list is returned as is. Lists loaded off the main thread (SpriteLoader)
+    are always left to convert_pending, convert_alpha belongs to the main
+    thread.
+
+    Args:
+        frames (list): Surfaces to convert; None entries are skipped
+
+    Returns:
+        list: The same list, for chaining
+    """
+    main_thread = threading.current_thread() is threading.main_thread()
+    if main_thread and display_ready():
+        _convert(frames)
+    elif _display_expected or display_ready():
+        with _pending_lock:
+            _pending.append(frames)
+    return frames
+
+
+def convert_pending():
+    """
+    Convert every list deferred by to_display_format.
+    Call from the main thread right after ``pygame.display.set_mode``, then
+    once per frame for the lists loaded by background threads.
+
+    Returns:
+        int: Number of lists converted
+    """
+    if not _pending or not display_ready():
+        return 0
+    with _pending_lock:
+        pending = _pending[:]
+        _pending.clear()
+    for frames in pending:
+        _convert(frames)
+    return len(pending)
+
+
+def pending_count():
+    """Number of frame lists waiting for a display mode."""
+    return len(_pending)
@@ -0,0 +1,142 @@
+import hashlib
+import mmap
+import os
+import struct
+
+import pygame as pyg
+
+from utils.paths import find_project_root
+
+LAYER_CACHE_MAGIC = b"PYGLAYR2"
+# magic, width, height, alpha, bits per pixel, pitch, R/G/B/A masks
+LAYER_CACHE_HEADER = struct.Struct("<8sII?BI4I")
+# Masks of convert_alpha surfaces, which match the "BGRA" buffer layout
+ALPHA_MASKS = (0xFF0000, 0xFF00, 0xFF, 0xFF000000)
+DEFAULT_LAYER_CACHE_DIR = os.path.join("build", "cache", "layers")
+
+
+def source_hash(path):
+    """Short SHA-1 of a source image file, the cache invalidation key."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+
+class LayerCache:
+    """
+    On-disk cache of full-screen layers already scaled to a resolution.
+
+    An entry holds the pixels of a source image scaled to (width, height)
+    and converted to the display format, as laid out in memory, named
+    after the source file and path, the size and the SHA-1 of the source:
+    a later launch at the same resolution copies the pixels into a surface
+    of the same format (alpha layers even use the memory-mapped file
+    directly), without decoding, scaling nor converting anything.
+    Editing the source changes its hash, so the stale entry is simply not
+    found (and is deleted when the new one is written). Only usable once a
+    display mode is set.
+
+    Attributes:
+        directory (str): Cache directory
+        hits (int): Layers read from the cache
+        misses (int): Layers that had to be built
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.path.join(find_project_root(), DEFAULT_LAYER_CACHE_DIR)
+        self.hits = 0
+        self.misses = 0
+
+    def _prefix(self, source_path, size, alpha):
+        # The path hash keeps apart sources sharing a filename in different
+        # folders, which would otherwise delete each other's entries
+        path = os.path.abspath(source_path)
+        stem = os.path.splitext(os.path.basename(path))[0].replace(" ", "_")
+        path_hash = hashlib.sha1(path.encode("utf-8")).hexdigest()[:8]
+        return f"{stem}-{path_hash}-{size[0]}x{size[1]}{'a' if alpha else ''}-"
+
+    def _entry(self, source_path, size, alpha):
+        return os.path.join(
+            self.directory,
+            self._prefix(source_path, size, alpha) + source_hash(source_path) + ".raw",
+        )
+
+    def load(self, source_path, size, alpha):
+        """
+        Cached layer for a source image and resolution.
+
+        Args:
+            source_path (str): Source image path
+            size (tuple): (width, height) of the scaled layer
+            alpha (bool): Per-pixel alpha layer
+
+        Returns:
+            pygame.Surface: The layer in the display format, or None if it
+            is not cached (or the source changed)
+        """
+        entry = self._entry(source_path, size, alpha)
+        try:
+            with open(entry, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(mapped) < LAYER_CACHE_HEADER.size:
+            return None
+        header = LAYER_CACHE_HEADER.unpack_from(mapped, 0)
+        magic, width, height, cached_alpha, bitsize, pitch = header[:6]
+        masks = header[6:]
+        if magic != LAYER_CACHE_MAGIC or (width, height) != tuple(size) or cached_alpha != alpha:
+            return None
+        if len(mapped) != LAYER_CACHE_HEADER.size + pitch * height or pitch != width * 4:
+            return None
+        pixels = memoryview(mapped)[LAYER_CACHE_HEADER.size:]
+        if alpha:
+            if masks != ALPHA_MASKS:
+                return None
+            # Same layout as convert_alpha: the surface uses the mapped file
+            # directly, pages are read in by the first blit
+            layer = pyg.image.frombuffer(pixels, (width, height), "BGRA")
+        else:
+            if masks[:3] != pyg.display.get_surface().get_masks()[:3]:
+                return None  # written for another display format
+            # An opaque layer needs the exact display masks to blit as a
+            # plain copy, which frombuffer cannot give: copy the pixels
+            layer = pyg.Surface((width, height), 0, bitsize, masks)
+            layer.get_buffer().write(bytes(pixels), 0)
+        self.hits += 1
+        return layer
+
+    def store(self, source_path, size, alpha, layer):
+        """
+        Write a scaled, converted layer and drop the entries of older
+        source versions.
+
+        A read-only or full disk only costs the cache: errors are ignored.
+        """
+        prefix = self._prefix(source_path, size, alpha)
+        entry = self._entry(source_path, size, alpha)
+        self.misses += 1
+        if layer.get_pitch() != layer.get_width() * 4 or (alpha and layer.get_masks() != ALPHA_MASKS):
+            return  # a layout load() could not read back
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for name in os.listdir(self.directory):
+                if name.startswith(prefix) and os.path.join(self.directory, name) != entry:
+                    os.remove(os.path.join(self.directory, name))
+            header = LAYER_CACHE_HEADER.pack(
+                LAYER_CACHE_MAGIC, size[0], size[1], alpha,
+                layer.get_bitsize(), layer.get_pitch(), *layer.get_masks(),
+            )
+            pixels = layer.get_buffer().raw
+            temp = entry + ".tmp"
+            with open(temp, "wb") as f:
+                f.write(header)
+                f.write(pixels)
+            os.replace(temp, entry)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Delete every cached layer."""
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,116 @@
+import os
+import threading
+
+import pygame as pyg
+
+from utils.asset_pack import default_pack, pack_key
+from utils.display_format import to_display_format
+from utils.paths import get_asset_path
+
+# Decode cache: absolute path -> decoded Surface
+_decoded = {}
+_decoded_lock = threading.Lock()
+
+
+class SpriteSheet:
+    """
+    Shared sprite sheet slicer.
+
+    Every sheet is decoded once (decode cache keyed by path) no matter how
+    many frame lists are cut from it, so loading the right and left frames
+    of a sheet, or building several Water / buttons, decodes each PNG a
+    single time. Sheets present in build/assets.pack are read from the pack
+    instead, unless their PNG changed since the pack was built. Frames are
+    converted to the display format (to_display_format).
+    """
+
+    decodes = 0  # number of PNG decodes, for the startup timings
+
+    @classmethod
+    def image(cls, path):
+        """
+        Decoded surface of *path*, from the decode cache.
+
+        Args:
+            path (str): Image path
+
+        Returns:
+            pygame.Surface: The whole image (shared, do not draw on it)
+        """
+        key = os.path.abspath(path)
+        surface = _decoded.get(key)
+        if surface is None:
+            with _decoded_lock:
+                surface = _decoded.get(key)
+                if surface is None:
+                    surface = pyg.image.load(key)
+                    _decoded[key] = surface
+                    cls.decodes += 1
+        return surface
+
+    @classmethod
+    def load(cls, path, frame_w, frame_h, count=None, flip=False):
+        """
+        Cut a horizontal strip of frames.
+
+        Args:
+            path (str): Sheet path
+            frame_w (int): Frame width in pixels
+            frame_h (int): Frame height in pixels
+            count (int): Number of frames (default: as many as fit)
+            flip (bool): Mirror the frames horizontally (left-facing)
+
+        Returns:
+            list: Frames in the display format
+
+        Raises:
+            ValueError: If the sheet holds fewer than *count* frames
+        """
+        frames = cls._from_pack(path, frame_w, frame_h, flip)
+        if frames is None:
+            sheet = cls.image(path)
+            available = sheet.get_width() // frame_w
+            if count is not None and count > available:
+                raise ValueError(f"{path}: {count} frames demandées, {available} disponibles")
+            frames = [
+                sheet.subsurface((i * frame_w, 0, frame_w, frame_h))
+                for i in range(available if count is None else count)
+            ]
+            if flip:
+                frames = [pyg.transform.flip(frame, True, False) for frame in frames]
+        elif count is not None:
+            if count > len(frames):
+                raise ValueError(f"{path}: {count} frames demandées, {len(frames)} disponibles")
+            frames = frames[:count]
+        return to_display_format(frames)
+
+    @classmethod
+    def _packed(cls, path, frame_w, frame_h):
+        pack = default_pack()
+        if pack is None:
+            return None, None
+        relative = os.path.relpath(os.path.abspath(path), get_asset_path())
+        key = pack_key(*relative.split(os.sep))
+        if key not in pack or pack.index[key]["size"] != [frame_w, frame_h]:
+            return None, None
+        if not pack.is_current(key, path):
+            return None, None  # PNG edited since the pack was built
+        return pack, key
+
+    @classmethod
+    def _from_pack(cls, path, frame_w, frame_h, flip):
+        pack, key = cls._packed(path, frame_w, frame_h)
+        if pack is None:
+            return None
+        return pack.frames(key, 'left' if flip else 'right')
+
+    @classmethod
+    def is_packed(cls, path, frame_w, frame_h):
+        """True if the frames of *path* come pre-flipped from the asset pack."""
+        return cls._packed(path, frame_w, frame_h)[0] is not None
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget every decoded sheet (frames already cut stay valid)."""
+        with _decoded_lock:
+            _decoded.clear()
@@ -0,0 +1,114 @@
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.items import ITEM_RARITY_RARE, MAX_STACK, Consumable, Equipment, Inventory
+
+
+def potion():
+    return Consumable("Potion", "heal", 50, value=15)
+
+
+def test_identical_consumables_stack():
+    """Identical consumables share one slot, up to MAX_STACK"""
+    inventory = Inventory(5)
+    for _ in range(MAX_STACK):
+        assert inventory.add_item(potion())
+    assert inventory.used_slots == 1
+    assert inventory.stack_count(potion()) == MAX_STACK
+    assert len(inventory) == MAX_STACK
+
+    assert inventory.add_item(Consumable("Potion", "heal", 20, value=15))
+    assert inventory.used_slots == 2  # different amount, different stack
+
+
+def test_stack_overflow_and_removal():
+    """A full stack overflows into a new slot and stays reachable once the overflow empties"""
+    inventory = Inventory(5)
+    for _ in range(MAX_STACK + 1):
+        inventory.add_item(potion())
+    assert inventory.used_slots == 2
+
+    probe = potion()
+    assert inventory.remove_item(probe)
+    assert inventory.used_slots == 1
+    assert probe in inventory
+    assert inventory.stack_count(probe) == MAX_STACK
+    assert inventory.remove_item(probe)
+    assert inventory.stack_count(probe) == MAX_STACK - 1
+
+    # Later potions fill the remaining stack instead of opening slots
+    inventory.add_item(potion())
+    inventory.add_item(potion())
+    assert inventory.used_slots == 2
+    assert len(inventory) == MAX_STACK + 1
+
+
+def test_removal_frees_room_in_a_full_stack():
+    """Removing from a full stack lets the next add go to it"""
+    inventory = Inventory(5)
+    first = potion()
+    inventory.add_item(first)
+    for _ in range(2 * MAX_STACK - 1):
+        inventory.add_item(potion())
+    assert inventory.used_slots == 2  # two full stacks
+
+    assert inventory.remove_item(first)  # from the first stack
+    inventory.add_item(potion())
+    assert inventory.used_slots == 2
+    assert len(inventory) == 2 * MAX_STACK
+
+
+def test_removed_consumable_can_be_added_back():
+    """A consumable taken out of its stack can be put back"""
+    inventory = Inventory(5)
+    first, second = potion(), potion()
+    assert inventory.add_item(first)
+    assert inventory.add_item(second)
+    assert inventory.remove_item(first)
+    assert len(inventory) == 1
+
+    assert inventory.add_item(first)
+    assert len(inventory) == 2
+    assert inventory.used_slots == 1
+
+
+def test_equipment_slots_and_queries():
+    """Equipment takes one slot each and is indexed by type, name and rarity"""
+    inventory = Inventory(2)
+    sword = Equipment("Sword", "hand_r", damage_bonus=5, value=100, rarity=ITEM_RARITY_RARE)
+    shield = Equipment("Shield", "hand_l", armor=3, value=80)
+    assert inventory.add_item(sword)
+    assert not inventory.add_item(sword)  # already there
+    assert inventory.add_item(shield)
+    assert inventory.is_full()
+    assert not inventory.add_item(Equipment("Helmet", "head", armor=1))
+
+    assert set(inventory.get_items_by_type(Equipment)) == {sword, shield}
+    assert inventory.get_items_by_name("Sword") == [sword]
+    assert inventory.get_items_by_rarity(ITEM_RARITY_RARE) == [sword]
+
+    assert inventory.remove_item(sword)
+    assert not inventory.remove_item(sword)
+    assert inventory.get_items_by_name("Sword") == []
+    assert inventory.get_items_by_type(Equipment) == [shield]
+
+
+def test_value_follows_changes():
+    """The running total value matches the items held"""
+    inventory = Inventory(5)
+    sword = Equipment("Sword", "hand_r", value=100)
+    inventory.add_item(sword)
+    for _ in range(MAX_STACK + 2):
+        inventory.add_item(potion())
+    assert inventory.get_inventory_value() == 100 + 15 * (MAX_STACK + 2)
+
+    inventory.remove_item(sword)
+    inventory.remove_item(potion())
+    inventory.remove_item(potion())
+    assert inventory.get_inventory_value() == 15 * MAX_STACK
+    assert inventory.get_inventory_value() == sum(
+        item.value * count for _, item, count in inventory.slots()
+    )
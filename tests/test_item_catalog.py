@@ -0,0 +1,64 @@
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.item_catalog import (
+    INVENTORY_ENTRY,
+    INVENTORY_HEADER,
+    INVENTORY_MAGIC,
+    MAX_INVENTORY_SLOTS,
+    get_item_catalog,
+    pack_inventory,
+    unpack_inventory,
+)
+from game.items import MAX_STACK, Inventory
+
+
+def binary_inventory(entries, max_size=10):
+    catalog = get_item_catalog()
+    header = INVENTORY_HEADER.pack(INVENTORY_MAGIC, catalog.checksum, max_size, len(entries))
+    return header + b"".join(INVENTORY_ENTRY.pack(*entry) for entry in entries)
+
+
+def stackable_id(stackable):
+    return next(d.id for d in get_item_catalog().definitions if d.stackable == stackable)
+
+
+def test_pack_unpack_round_trip():
+    """Slots, items and stack counts survive pack_inventory / unpack_inventory"""
+    catalog = get_item_catalog()
+    inventory = Inventory(10)
+    for definition in catalog.definitions:
+        for _ in range(3 if definition.stackable else 1):
+            inventory.add_item(catalog.create(definition.key))
+
+    restored = unpack_inventory(pack_inventory(inventory))
+    assert restored.max_size == inventory.max_size
+    assert [(slot, item.definition, count) for slot, item, count in restored.slots()] == [
+        (slot, item.definition, count) for slot, item, count in inventory.slots()
+    ]
+    assert len(restored) == len(inventory)
+    assert restored.get_inventory_value() == inventory.get_inventory_value()
+
+
+def test_unpack_rejects_bad_data():
+    """Malformed headers and entries raise ValueError"""
+    potion, sword = stackable_id(True), stackable_id(False)
+    bad = [
+        binary_inventory([], max_size=MAX_INVENTORY_SLOTS + 1),
+        binary_inventory([], max_size=0xFFFFFFFF),
+        binary_inventory([(0, len(get_item_catalog()), 1)]),
+        binary_inventory([(0, potion, 1), (0, potion, 1)]),
+        binary_inventory([(10, potion, 1)]),
+        binary_inventory([(0, potion, 0)]),
+        binary_inventory([(0, potion, MAX_STACK + 1)]),
+        binary_inventory([(0, sword, 2)]),
+        binary_inventory([(0, potion, 1)])[:-1],
+    ]
+    for data in bad:
+        with pytest.raises(ValueError):
+            unpack_inventory(data)
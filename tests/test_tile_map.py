@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pygame as pyg
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from game.tile_map import tile_map_from_images
+
+TILE = 8
+
+
+def test_back_tile_identical_to_a_wall_stays_walkable():
+    """Solidity follows the solid layer, not the pixels shared with other layers"""
+    wall = (120, 60, 20, 255)
+    back = pyg.Surface((2 * TILE, TILE), pyg.SRCALPHA)
+    back.fill(wall)
+    front = pyg.Surface((2 * TILE, TILE), pyg.SRCALPHA)
+    front.fill(wall, (0, 0, TILE, TILE))  # wall on the left cell only
+
+    tile_map = tile_map_from_images(
+        {"back": (back, False), "front": (front, True)}, TILE, solid_layer="front"
+    )
+    grid = tile_map.walk_grid()
+    assert not grid.walkable(0, 0)
+    assert grid.walkable(1, 0)
+    # The back layer still shares its identical tiles
+    assert tile_map.tile("back", 0, 0) == tile_map.tile("back", 1, 0)
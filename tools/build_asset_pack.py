@@ -0,0 +1,32 @@
+"""
+Build build/assets.pack: every character sheet pre-sliced and pre-flipped
+into raw RGBA frames, loaded at runtime with mmap (see utils/asset_pack.py).
+
+Run from the project root after changing the sprites:
+    python tools/build_asset_pack.py [output]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame as pyg
+
+from utils.asset_pack import DEFAULT_PACK_PATH, build_pack, character_sheets
+from utils.paths import find_project_root
+
+
+def main():
+    out_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        find_project_root(), DEFAULT_PACK_PATH
+    )
+    pyg.init()
+    sheets = character_sheets()
+    index = build_pack(sheets, out_path)
+    frames = sum(len(entry["right"]) + len(entry["left"]) for entry in index.values())
+    size_kb = os.path.getsize(out_path) / 1024
+    print(f"{len(index)} sheets, {frames} frames -> {out_path} ({size_kb:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Build build/maps/map-1: the whole-map PNGs of assets/maps converted into a
+tile map (de-duplicated tileset + zlib-packed tile id layers, see
+game/tile_map.py). Non-empty foreground tiles are marked solid.
+
+Run from the project root after changing the map images:
+    python tools/build_tile_map.py [output]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame as pyg
+
+from game.map_laoder import MAP_PATH_BACKGROUND, MAP_PATH_FOREGROUND, MAP_PATH_TILES
+from game.tile_map import TILE_SIZE, save_tile_map, tile_map_from_images
+from utils.paths import find_project_root
+
+
+def main():
+    root = find_project_root()
+    out_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(root, MAP_PATH_TILES)
+    pyg.init()
+    layers = {
+        "back": (pyg.image.load(os.path.join(root, MAP_PATH_BACKGROUND)), False),
+        "front": (pyg.image.load(os.path.join(root, MAP_PATH_FOREGROUND)), True),
+    }
+    tile_map = tile_map_from_images(layers, TILE_SIZE, solid_layer="front")
+    save_tile_map(out_path, tile_map)
+    cells = tile_map.width * tile_map.height
+    print(
+        f"{tile_map.width}x{tile_map.height} tiles, {len(tile_map.tileset.tiles)} distinct, "
+        f"{len(tile_map.tileset.solid)} solid, {cells} cells per layer -> {out_path}"
+    )
+
+
+if __name__ == "__main__":
+    main()